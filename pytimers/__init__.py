@@ -1,11 +1,55 @@
+from importlib import import_module
+from typing import Any, List, TYPE_CHECKING
+
 from .timer import Timer
 from .triggers.base_trigger import BaseTrigger
-from .triggers.logger_trigger import LoggerTrigger
+from .triggers.batch_trigger import BatchTrigger
+from .triggers.lazy_trigger import LazyTrigger
+
+if TYPE_CHECKING:
+    from .triggers.aggregating_trigger import AggregatingTrigger
+    from .triggers.anomaly_trigger import AnomalyTrigger
+    from .triggers.chrome_trace_trigger import ChromeTraceTrigger
+    from .triggers.logger_trigger import LoggerTrigger
+    from .triggers.scaling_trigger import ScalingTrigger
+    from .triggers.span_export_trigger import SpanExportTrigger
+    from .triggers.sqlite_trigger import SQLiteTrigger
+
+# triggers are imported on first access to keep `import pytimers` fast
+_LAZY_ATTRIBUTES = {
+    "AggregatingTrigger": ".triggers.aggregating_trigger",
+    "AnomalyTrigger": ".triggers.anomaly_trigger",
+    "ChromeTraceTrigger": ".triggers.chrome_trace_trigger",
+    "LoggerTrigger": ".triggers.logger_trigger",
+    "ScalingTrigger": ".triggers.scaling_trigger",
+    "SpanExportTrigger": ".triggers.span_export_trigger",
+    "SQLiteTrigger": ".triggers.sqlite_trigger",
+}
+
+
+def _logger_trigger() -> BaseTrigger:
+    from .triggers.logger_trigger import LoggerTrigger
+
+    return LoggerTrigger()
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
-# provide default instance for the simplicity containing logger Trigger
+# provide default instance for the simplicity containing logger Trigger constructed
+# once the first measurement is finished
 timer = Timer(
     triggers=[
-        LoggerTrigger(),
+        LazyTrigger(_logger_trigger),
     ]
 )
 
@@ -13,6 +57,13 @@ timer = Timer(
 __all__ = [
     "Timer",
     "timer",
+    "AggregatingTrigger",
+    "AnomalyTrigger",
     "BaseTrigger",
+    "BatchTrigger",
+    "ChromeTraceTrigger",
     "LoggerTrigger",
+    "ScalingTrigger",
+    "SpanExportTrigger",
+    "SQLiteTrigger",
 ]
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Optional, Sequence
+
+from pytimers.serialization import (
+    decode_statistics,
+    encode_statistics,
+    merge_statistics,
+)
+
+
+def _merge(arguments: argparse.Namespace) -> int:
+    dumps = []
+    for path in arguments.inputs:
+        with open(path, "rb") as file:
+            dumps.append(decode_statistics(file.read()))
+    merged = merge_statistics(*dumps)
+    if arguments.output is not None:
+        with open(arguments.output, "wb") as file:
+            file.write(encode_statistics(merged))
+    for label in sorted(merged, key=lambda label: (label is not None, label)):
+        statistics = merged[label]
+        print(
+            f"{'code block' if label is None else label}: {statistics.count} calls, "
+            f"mean {statistics.mean_s:.6g}s, p50 {statistics.quantile(0.5):.6g}s, "
+            f"p99 {statistics.quantile(0.99):.6g}s, max {statistics.max_s:.6g}s"
+        )
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line interface of pytimers, run as ``python -m pytimers``.
+
+    :param argv: Command line arguments, defaults to :py:data:`sys.argv`.
+    :return: Exit code.
+    """
+
+    parser = argparse.ArgumentParser(prog="python -m pytimers")
+    commands = parser.add_subparsers(dest="command", required=True)
+    merge = commands.add_parser(
+        "merge",
+        help="merge statistics encoded on different nodes and print a summary",
+    )
+    merge.add_argument("inputs", nargs="+", help="files with encoded statistics")
+    merge.add_argument("-o", "--output", help="file to write merged statistics to")
+    merge.set_defaults(handler=_merge)
+    arguments = parser.parse_args(argv)
+    try:
+        return int(arguments.handler(arguments))
+    except (OSError, ValueError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
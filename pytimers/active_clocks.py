@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from threading import Lock
+
+from pytimers.clock import Clock
+
+
+class ActiveClockRegistry:
+    """Registry of running clocks of all threads and asyncio tasks. Running clocks
+    are otherwise visible only through the per context
+    :py:data:`pytimers.timer.STARTED_CLOCK_VAR` stacks. The registry is used by
+    tools inspecting the running process from another thread. Clocks are
+    registered only while at least one such tool is enabled so the registry has no
+    cost otherwise. Registration is a single dictionary operation.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._users = 0
+        self._clocks: dict[int, Clock] = {}
+        self._lock = Lock()
+
+    def acquire(self) -> None:
+        """Enables clock registration for a new user of the registry."""
+
+        with self._lock:
+            self._users += 1
+            self.enabled = True
+
+    def release(self) -> None:
+        """Disables clock registration once the last user of the registry releases
+        it. Clocks registered so far are discarded.
+        """
+
+        with self._lock:
+            self._users = max(self._users - 1, 0)
+            if self._users == 0:
+                self.enabled = False
+                self._clocks = {}
+
+    def register(self, clock: Clock) -> None:
+        self._clocks[id(clock)] = clock
+
+    def unregister(self, clock: Clock) -> None:
+        self._clocks.pop(id(clock), None)
+
+    def snapshot(self) -> list[Clock]:
+        """Provides clocks running at the time of the call.
+
+        :return: List of running clocks.
+        """
+
+        return list(self._clocks.copy().values())
+
+    def innermost(self) -> list[Clock]:
+        """Provides running clocks not enclosing any other running clock, i.e. clocks
+        on top of the clock stack of each thread or asyncio task.
+
+        :return: List of running clocks on top of the clock stacks.
+        """
+
+        clocks = self.snapshot()
+        parents = {id(clock.parent) for clock in clocks if clock.parent is not None}
+        return [clock for clock in clocks if id(clock) not in parents]
+
+
+# process wide registry of running clocks
+ACTIVE_CLOCKS = ActiveClockRegistry()
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import math
+from typing import Iterable, Sequence
+
+
+class LatencyHistogram:
+    """Histogram of durations with logarithmically sized buckets. Any quantile
+    estimated from the histogram is within ``relative_accuracy`` of the exact value.
+    Durations shorter than ``min_duration_s`` are counted in a single zero bucket.
+
+    :param relative_accuracy: Maximal relative error of estimated quantiles.
+    :param min_duration_s: Shortest duration with a guaranteed relative error.
+    """
+
+    __slots__ = (
+        "relative_accuracy",
+        "min_duration_s",
+        "buckets",
+        "zero_count",
+        "count",
+        "_gamma",
+        "_log_gamma",
+    )
+
+    def __init__(self, relative_accuracy: float = 0.01, min_duration_s: float = 1e-9):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("Relative accuracy has to be between 0 and 1.")
+        self.relative_accuracy = relative_accuracy
+        self.min_duration_s = min_duration_s
+        self.buckets: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+    def add(self, duration_s: float) -> None:
+        """Adds a single duration to the histogram.
+
+        :param duration_s: The duration in seconds.
+        """
+
+        self.count += 1
+        if duration_s < self.min_duration_s:
+            self.zero_count += 1
+        else:
+            key = math.ceil(math.log(duration_s) / self._log_gamma)
+            self.buckets[key] = self.buckets.get(key, 0) + 1
+
+    def add_many(self, durations: Iterable[float]) -> None:
+        """Adds multiple durations to the histogram.
+
+        :param durations: The durations in seconds.
+        """
+
+        for duration_s in durations:
+            self.add(duration_s)
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Adds all durations of another histogram to this histogram.
+
+        :param other: The histogram to be merged in.
+        :raise ValueError: The histograms have different bucket sizes.
+        """
+
+        if (
+            other.relative_accuracy != self.relative_accuracy
+            or other.min_duration_s != self.min_duration_s
+        ):
+            raise ValueError("Only histograms with the same buckets can be merged.")
+        self.count += other.count
+        self.zero_count += other.zero_count
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+
+    def quantile(self, q: float) -> float:
+        """Estimates a quantile of the durations.
+
+        :param q: The quantile between 0 and 1, e.g. ``0.99`` for 99th percentile.
+        :return: The estimated duration in seconds or ``0.0`` for empty histogram.
+        """
+
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile has to be between 0 and 1.")
+        rank = q * (self.count - 1)
+        cumulative = self.zero_count
+        if self.count == 0 or rank < cumulative:
+            return 0.0
+        for key in sorted(self.buckets):
+            cumulative += self.buckets[key]
+            if cumulative > rank:
+                break
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def copy(self) -> LatencyHistogram:
+        """Creates an independent copy of the histogram.
+
+        :return: The copied histogram.
+        """
+
+        histogram = LatencyHistogram(self.relative_accuracy, self.min_duration_s)
+        histogram.merge(self)
+        return histogram
+
+
+class LabelStatistics:
+    """Summary statistics of durations measured under a single label.
+
+    :param relative_accuracy: Maximal relative error of estimated quantiles, see
+        :py:class:`pytimers.aggregation.LatencyHistogram`.
+    """
+
+    __slots__ = ("count", "total_s", "min_s", "max_s", "histogram")
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        self.count = 0
+        self.total_s = 0.0
+        self.min_s = float("inf")
+        self.max_s = 0.0
+        self.histogram = LatencyHistogram(relative_accuracy)
+
+    def add(self, duration_s: float) -> None:
+        """Updates the statistics with a single duration.
+
+        :param duration_s: The measured duration in seconds.
+        """
+
+        self.count += 1
+        self.total_s += duration_s
+        if duration_s < self.min_s:
+            self.min_s = duration_s
+        if duration_s > self.max_s:
+            self.max_s = duration_s
+        self.histogram.add(duration_s)
+
+    def add_many(self, durations: Sequence[float]) -> None:
+        """Updates the statistics with a batch of durations.
+
+        :param durations: The measured durations in seconds.
+        """
+
+        if not durations:
+            return
+        self.count += len(durations)
+        self.total_s += sum(durations)
+        self.min_s = min(self.min_s, min(durations))
+        self.max_s = max(self.max_s, max(durations))
+        self.histogram.add_many(durations)
+
+    def merge(self, other: LabelStatistics) -> None:
+        """Updates the statistics with statistics of another set of durations.
+
+        :param other: The statistics to be merged in.
+        """
+
+        self.count += other.count
+        self.total_s += other.total_s
+        self.min_s = min(self.min_s, other.min_s)
+        self.max_s = max(self.max_s, other.max_s)
+        self.histogram.merge(other.histogram)
+
+    @property
+    def mean_s(self) -> float:
+        """Mean duration in seconds or ``0.0`` if there are no durations."""
+
+        return self.total_s / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Estimates a quantile of the durations, see
+        :py:meth:`pytimers.aggregation.LatencyHistogram.quantile`.
+
+        :param q: The quantile between 0 and 1, e.g. ``0.99`` for 99th percentile.
+        :return: The estimated duration in seconds.
+        """
+
+        if self.count == 0:
+            return 0.0
+        elif q == 0:
+            return self.min_s
+        elif q == 1:
+            return self.max_s
+        # estimates are clipped to the exactly known range
+        return min(max(self.histogram.quantile(q), self.min_s), self.max_s)
+
+    def copy(self) -> LabelStatistics:
+        """Creates an independent copy of the statistics.
+
+        :return: The copied statistics.
+        """
+
+        statistics = LabelStatistics(self.histogram.relative_accuracy)
+        statistics.merge(self)
+        return statistics
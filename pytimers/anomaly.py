@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import math
+
+
+class ChangeDetector:
+    """Online detector of shifts of the duration distribution of a single label.
+    The detector keeps exponentially weighted moving average and variance of
+    logarithms of durations and runs a two-sided CUSUM test on durations
+    standardized by them. Each update takes constant time. Once a shift is
+    detected the detector learns the new baseline from scratch.
+
+    :param alpha: Weight of the newest duration in the moving average and variance.
+    :param threshold: Cumulative sum of standardized deviations reporting a shift.
+    :param drift: Standardized deviation tolerated without increasing the sums.
+    :param warmup: Number of durations used to learn the baseline before shifts are
+        detected.
+    :param min_std: Lowest standard deviation of logarithms of durations, i.e.
+        relative spread of durations, used for the standardization. Prevents
+        reporting negligible shifts of very stable durations. Has to be positive.
+
+    Attribute ``previous_baseline_s`` holds the baseline in seconds before the last
+    detected shift or ``0.0`` if no shift was detected yet.
+    """
+
+    __slots__ = (
+        "alpha",
+        "threshold",
+        "drift",
+        "warmup",
+        "min_std",
+        "count",
+        "mean",
+        "variance",
+        "upper_sum",
+        "lower_sum",
+        "previous_baseline_s",
+    )
+
+    def __init__(
+        self,
+        alpha: float = 0.01,
+        threshold: float = 8.0,
+        drift: float = 1.0,
+        warmup: int = 100,
+        min_std: float = 0.05,
+    ) -> None:
+        self.alpha = alpha
+        self.threshold = threshold
+        self.drift = drift
+        self.warmup = warmup
+        self.min_std = min_std
+        self.previous_baseline_s = 0.0
+        self.reset()
+
+    def reset(self) -> None:
+        """Forgets the baseline and the cumulative sums. Called automatically once a
+        shift is detected.
+        """
+
+        self.count = 0
+        self.mean = 0.0
+        self.variance = 0.0
+        self.upper_sum = 0.0
+        self.lower_sum = 0.0
+
+    @property
+    def baseline_s(self) -> float:
+        """Typical duration in seconds, i.e. exponential of the moving average of
+        logarithms of durations, ``0.0`` before the first update.
+        """
+
+        return math.exp(self.mean) if self.count else 0.0
+
+    def update(self, duration_s: float) -> int:
+        """Updates the detector with a single duration.
+
+        :param duration_s: The measured duration in seconds.
+        :return: ``1`` if an increase of durations was detected, ``-1`` if a decrease
+            was detected and ``0`` otherwise.
+        """
+
+        value = math.log(duration_s if duration_s > 1e-9 else 1e-9)
+        # local copy keeps the update consistent with a concurrent reset
+        count = self.count + 1
+        self.count = count
+        deviation = value - self.mean
+        if count > self.warmup:
+            std = math.sqrt(self.variance)
+            score = deviation / (std if std > self.min_std else self.min_std)
+            self.upper_sum = max(0.0, self.upper_sum + score - self.drift)
+            self.lower_sum = max(0.0, self.lower_sum - score - self.drift)
+            if self.upper_sum > self.threshold or self.lower_sum > self.threshold:
+                direction = 1 if self.upper_sum > self.threshold else -1
+                self.previous_baseline_s = math.exp(self.mean)
+                self.reset()
+                return direction
+        # plain mean and variance until the moving average has enough history
+        alpha = self.alpha if count * self.alpha > 1.0 else 1.0 / count
+        increment = alpha * deviation
+        self.mean += increment
+        self.variance = (1.0 - alpha) * (self.variance + deviation * increment)
+        return 0
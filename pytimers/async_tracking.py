@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from timeit import default_timer
+from typing import Any, Awaitable, Generator, Generic, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+
+class ActiveTimeAwaitable(Generic[T]):
+    """Awaitable wrapper measuring the time the wrapped awaitable actually runs on
+    the event loop. The time of every step of the wrapped coroutine, i.e. from
+    resuming the coroutine until its next suspension, is accumulated in
+    ``active_duration_s``. The time the coroutine spends suspended while other
+    tasks run is not included.
+
+    :param awaitable: The awaitable to be measured.
+    """
+
+    __slots__ = ("_awaitable", "active_duration_s")
+
+    def __init__(self, awaitable: Awaitable[T]):
+        self._awaitable = awaitable
+        self.active_duration_s = 0.0
+
+    def __await__(self) -> Generator[Any, Any, T]:
+        iterator = self._awaitable.__await__()
+        send_value: Any = None
+        error: Optional[BaseException] = None
+        while True:
+            step_start = default_timer()
+            try:
+                if error is None:
+                    yielded = iterator.send(send_value)
+                else:
+                    yielded = iterator.throw(error)
+            except StopIteration as stop:
+                return stop.value  # type: ignore
+            finally:
+                self.active_duration_s += default_timer() - step_start
+            try:
+                send_value = yield yielded
+                error = None
+            except GeneratorExit:
+                iterator.close()
+                raise
+            except BaseException as exc:
+                send_value = None
+                error = exc
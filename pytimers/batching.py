@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from array import array
+from threading import Lock, current_thread
+from timeit import default_timer
+
+
+class MeasurementBuffer:
+    """Buffer of measurements owned by a single thread. The buffer is protected by
+    its own lock which is contended only while another thread flushes it.
+    """
+
+    __slots__ = ("durations", "label_ids", "flags", "created", "thread", "_lock")
+
+    def __init__(self) -> None:
+        self.thread = current_thread()
+        self._lock = Lock()
+        self.durations = array("d")
+        self.label_ids = array("L")
+        self.flags = array("B")
+        self.created = default_timer()
+
+    def append(self, duration: float, label_id: int, flags: int) -> int:
+        """Appends a single measurement to the buffer.
+
+        :return: Number of buffered measurements.
+        """
+
+        with self._lock:
+            self.durations.append(duration)
+            self.label_ids.append(label_id)
+            self.flags.append(flags)
+            return len(self.durations)
+
+    def drain(self) -> tuple[array[float], array[int], array[int]]:
+        """Empties the buffer.
+
+        :return: Buffered durations, label ids and flags.
+        """
+
+        with self._lock:
+            batch = self.durations, self.label_ids, self.flags
+            self.durations = array("d")
+            self.label_ids = array("L")
+            self.flags = array("B")
+            self.created = default_timer()
+        return batch
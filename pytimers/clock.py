@@ -1,19 +1,70 @@
+from __future__ import annotations
+
+from array import array
+from threading import get_ident
+from time import time
 from timeit import default_timer
-from typing import Optional
+from typing import Callable, Optional, TYPE_CHECKING
 
 from pytimers.exceptions import ClockStillRunning
 
+if TYPE_CHECKING:
+    from pytimers.gc_tracking import GCSnapshot
+
+
+# initial number of laps preallocated on the first lap of a clock
+LAP_CAPACITY = 8
+
+
+def epoch_offset() -> float:
+    """Computes the offset converting :py:func:`timeit.default_timer` values, e.g.
+    start times of clocks and measurements, to unix time.
+
+    :return: The offset in seconds.
+    """
+
+    return time() - default_timer()
+
 
 class Clock:
-    def __init__(self, label: Optional[str]):
+    def __init__(
+        self,
+        label: Optional[str],
+        cpu_timer: Optional[Callable[[], float]] = None,
+        label_id: Optional[int] = None,
+        parent: Optional[Clock] = None,
+        gc_pauses: bool = False,
+    ):
         self.label = label
+        self.label_id = label_id
+        self.parent = parent
+        self.thread_id = get_ident()
+        self._cpu_timer = cpu_timer
+        self._cpu_start_time = cpu_timer() if cpu_timer is not None else None
+        self._gc_start: Optional[GCSnapshot] = None
+        if gc_pauses:
+            # imported only by clocks measuring garbage collection pauses
+            from pytimers.gc_tracking import GC_PAUSES
+
+            self._gc_start = GC_PAUSES.snapshot()
         self.start_time = default_timer()
         self._duration: Optional[float] = None
+        self._cpu_duration: Optional[float] = None
+        self._gc_pauses: Optional[GCSnapshot] = None
+        self.lap_count = 0
+        self._lap_times: Optional[array[float]] = None
+        self._lap_names: list[Optional[str]] = []
 
     def stop(self) -> None:
         """Stops the running clock."""
 
         self._duration = default_timer() - self.start_time
+        if self._cpu_timer is not None and self._cpu_start_time is not None:
+            self._cpu_duration = self._cpu_timer() - self._cpu_start_time
+        if self._gc_start is not None:
+            from pytimers.gc_tracking import GC_PAUSES
+
+            self._gc_pauses = GC_PAUSES.since(self._gc_start)
 
     def duration(self, precision: Optional[int] = None) -> float:
         """Exposes measured time of the clock. You can use this method to access the
@@ -37,6 +88,145 @@ class Clock:
         else:
             return round(self._duration, precision)
 
+    def cpu_duration(self, precision: Optional[int] = None) -> Optional[float]:
+        """Exposes CPU time consumed between start and stop of the clock. CPU time is
+        measured only if the clock was created with a ``cpu_timer``.
+
+        :param precision: Number of decimal places of the returned time. If set to
+            ``None`` the full precision is returned.
+        :return: Measured CPU time in seconds or ``None`` if CPU time is not measured.
+        :raise pytimers.exceptions.ClockStillRunning: Clock has to be stopped before
+            accessing elapsed time.
+        """
+
+        if self._duration is None:
+            raise ClockStillRunning(
+                "Clock has to be stopped before accessing elapsed time."
+            )
+        elif self._cpu_duration is None or precision is None:
+            return self._cpu_duration
+        else:
+            return round(self._cpu_duration, precision)
+
+    def wait_duration(self, precision: Optional[int] = None) -> Optional[float]:
+        """Exposes the part of the measured time not spent on CPU, e.g. waiting for
+        I/O, locks or sleeping.
+
+        :param precision: Number of decimal places of the returned time. If set to
+            ``None`` the full precision is returned.
+        :return: Measured wait time in seconds or ``None`` if CPU time is not
+            measured.
+        :raise pytimers.exceptions.ClockStillRunning: Clock has to be stopped before
+            accessing elapsed time.
+        """
+
+        cpu_duration = self.cpu_duration()
+        if cpu_duration is None:
+            return None
+        wait_duration = max(self.duration() - cpu_duration, 0.0)
+        if precision is None:
+            return wait_duration
+        else:
+            return round(wait_duration, precision)
+
+    def gc_duration(self, precision: Optional[int] = None) -> Optional[float]:
+        """Exposes time spent in garbage collection pauses between start and stop of
+        the clock. Pauses are measured only if the clock was created with
+        ``gc_pauses`` enabled.
+
+        :param precision: Number of decimal places of the returned time. If set to
+            ``None`` the full precision is returned.
+        :return: Garbage collection time in seconds or ``None`` if pauses are not
+            measured.
+        :raise pytimers.exceptions.ClockStillRunning: Clock has to be stopped before
+            accessing elapsed time.
+        """
+
+        if self._duration is None:
+            raise ClockStillRunning(
+                "Clock has to be stopped before accessing elapsed time."
+            )
+        elif self._gc_pauses is None:
+            return None
+        elif precision is None:
+            return self._gc_pauses[0]
+        else:
+            return round(self._gc_pauses[0], precision)
+
+    def gc_collections(self) -> Optional[tuple[int, ...]]:
+        """Exposes numbers of garbage collections of each generation between start
+        and stop of the clock.
+
+        :return: Numbers of collections indexed by generation or ``None`` if pauses
+            are not measured.
+        :raise pytimers.exceptions.ClockStillRunning: Clock has to be stopped before
+            accessing elapsed time.
+        """
+
+        if self._duration is None:
+            raise ClockStillRunning(
+                "Clock has to be stopped before accessing elapsed time."
+            )
+        return None if self._gc_pauses is None else self._gc_pauses[1]
+
+    def innermost_label(self) -> Optional[str]:
+        """Finds the label of this clock or of the closest labelled enclosing clock.
+
+        :return: The label or ``None`` if neither this nor any enclosing clock is
+            labelled.
+        """
+
+        clock: Optional[Clock] = self
+        while clock is not None:
+            if clock.label is not None:
+                return clock.label
+            clock = clock.parent
+        return None
+
+    def lap(self, name: str) -> None:
+        """Marks the end of a phase of the timed code block. The phase started at the
+        previous lap or at the start of the clock. Laps are much cheaper than nested
+        timed code blocks as they only store the current time into a preallocated
+        array. Durations of all phases are passed to triggers in
+        :py:attr:`pytimers.measurement.Measurement.phases` once the code block is
+        finished. Number of laps marked so far is available in ``lap_count``.
+
+        :param name: Name of the finished phase.
+        """
+
+        now = default_timer()
+        count = self.lap_count
+        lap_times = self._lap_times
+        if lap_times is None:
+            lap_times = self._lap_times = array("d", bytes(8 * LAP_CAPACITY))
+            self._lap_names = [None] * LAP_CAPACITY
+        elif count == len(lap_times):
+            lap_times.extend(lap_times)
+            self._lap_names.extend(self._lap_names)
+        lap_times[count] = now
+        self._lap_names[count] = name
+        self.lap_count = count + 1
+
+    # alias reading better for code blocks marking progress instead of phases
+    checkpoint = lap
+
+    def phases(self) -> list[tuple[str, float]]:
+        """Exposes durations of phases marked by :py:meth:`pytimers.clock.Clock.lap`.
+        Time after the last lap is not included in any phase.
+
+        :return: Names and durations in seconds of the phases in order of the laps.
+        """
+
+        if self._lap_times is None:
+            return []
+        phases = []
+        previous = self.start_time
+        for index in range(self.lap_count):
+            lap_time = self._lap_times[index]
+            phases.append((str(self._lap_names[index]), lap_time - previous))
+            previous = lap_time
+        return phases
+
     def current_duration(self, precision: Optional[int] = None) -> float:
         """Calculates the current duration elapsed since the clock was started. This
         property can be used inside a timed code block.
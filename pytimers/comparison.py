@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import logging
+import math
+from random import random
+from threading import Lock
+from typing import Any, Callable, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+SHADOW = "shadow"
+ALTERNATE = "alternate"
+
+# outcome of a single timed call, i.e. output, raised exception and duration
+Outcome = Tuple[Any, Optional[Exception], float]
+
+
+class _LogStatistics:
+    """Running mean and variance of logarithms of durations."""
+
+    __slots__ = ("count", "mean", "_m2")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+
+def _log_duration(duration_s: float) -> float:
+    return math.log(duration_s if duration_s > 1e-9 else 1e-9)
+
+
+class Comparison:
+    """State of a comparison of a callable decorated by
+    :py:meth:`pytimers.Timer.compare` with its candidate implementation. Sampled
+    calls are timed under paired labels ``<qualname>[baseline]`` and
+    ``<qualname>[candidate]``. The comparison counts calls whose outputs differ and
+    estimates the speed-up of the candidate, i.e. ratio of the baseline and the
+    candidate duration, as a geometric mean with a confidence interval.
+
+    :param label: Label of the decorated callable.
+    :param candidate: The candidate implementation accepting the same arguments.
+    :param fraction: Fraction of calls running the candidate.
+    :param mode: Either ``"shadow"`` or ``"alternate"``, see
+        :py:meth:`pytimers.Timer.compare`.
+    :param equal: Callable comparing outputs of the decorated callable and the
+        candidate, defaults to ``==``.
+    :param on_mismatch: Optional callable called with the positional arguments, the
+        keyword arguments, the outcome of the decorated callable and the outcome of
+        the candidate whenever the outputs differ. Outcome is either the output or
+        the raised exception. Exceptions raised by the callable are logged and
+        counted in ``failed_callbacks``, they never reach the caller.
+    :raise ValueError: Unknown mode.
+    """
+
+    def __init__(
+        self,
+        label: str,
+        candidate: Callable[..., Any],
+        fraction: float = 0.01,
+        mode: str = SHADOW,
+        equal: Optional[Callable[[Any, Any], bool]] = None,
+        on_mismatch: Optional[
+            Callable[[tuple[Any, ...], dict[str, Any], Any, Any], Any]
+        ] = None,
+    ) -> None:
+        if mode not in (SHADOW, ALTERNATE):
+            raise ValueError(f"Unknown comparison mode {mode!r}.")
+        self.candidate = candidate
+        self.fraction = fraction
+        self.mode = mode
+        self.equal = equal
+        self.on_mismatch = on_mismatch
+        self.baseline_label = f"{label}[baseline]"
+        self.candidate_label = f"{label}[candidate]"
+        self.compared = 0
+        self.mismatches = 0
+        self.failed_callbacks = 0
+        self._paired = _LogStatistics()
+        self._baseline = _LogStatistics()
+        self._candidate = _LogStatistics()
+        self._lock = Lock()
+
+    def sampled(self) -> bool:
+        """Decides whether the next call is compared.
+
+        :return: ``True`` if the candidate should run.
+        """
+
+        return random() < self.fraction
+
+    def _outputs_equal(self, baseline: Outcome, candidate: Outcome) -> bool:
+        baseline_output, baseline_exc, _ = baseline
+        candidate_output, candidate_exc, _ = candidate
+        if baseline_exc is not None or candidate_exc is not None:
+            return type(baseline_exc) is type(candidate_exc)
+        try:
+            if self.equal is None:
+                return bool(baseline_output == candidate_output)
+            return self.equal(baseline_output, candidate_output)
+        except Exception:
+            return False
+
+    def add_pair(
+        self,
+        baseline: Outcome,
+        candidate: Outcome,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Records outcomes of both implementations called with the same arguments.
+
+        :param baseline: Outcome of the decorated callable.
+        :param candidate: Outcome of the candidate.
+        :param args: Positional arguments of the call.
+        :param kwargs: Keyword arguments of the call.
+        """
+
+        equal = self._outputs_equal(baseline, candidate)
+        with self._lock:
+            self.compared += 1
+            if not equal:
+                self.mismatches += 1
+            self._paired.add(_log_duration(baseline[2]) - _log_duration(candidate[2]))
+        if not equal and self.on_mismatch is not None:
+            # the comparison runs inside the production call which must not fail
+            try:
+                self.on_mismatch(
+                    args,
+                    kwargs,
+                    baseline[0] if baseline[1] is None else baseline[1],
+                    candidate[0] if candidate[1] is None else candidate[1],
+                )
+            except Exception:
+                with self._lock:
+                    self.failed_callbacks += 1
+                logger.warning(
+                    "Mismatch callback of %s failed.",
+                    self.baseline_label,
+                    exc_info=True,
+                )
+
+    def add_single(self, duration_s: float, candidate: bool) -> None:
+        """Records a duration of a call running only one of the implementations.
+
+        :param duration_s: The measured duration in seconds.
+        :param candidate: ``True`` if the candidate was called.
+        """
+
+        with self._lock:
+            (self._candidate if candidate else self._baseline).add(
+                _log_duration(duration_s)
+            )
+
+    def speedup(self, z: float = 1.96) -> Optional[tuple[float, float, float]]:
+        """Estimates how many times the candidate is faster than the decorated
+        callable. In the shadow mode the estimate is based on ratios of durations of
+        both implementations called with the same arguments, in the alternate mode
+        on durations of independent calls.
+
+        :param z: Quantile of the standard normal distribution defining the
+            confidence level, e.g. ``1.96`` for 95 % confidence interval.
+        :return: Estimated speed-up, lower and upper bound of its confidence
+            interval or ``None`` if at least two durations of each implementation
+            are not available yet.
+        """
+
+        with self._lock:
+            if self.mode == SHADOW:
+                if self._paired.count < 2:
+                    return None
+                mean = self._paired.mean
+                error = math.sqrt(self._paired.variance / self._paired.count)
+            else:
+                if self._baseline.count < 2 or self._candidate.count < 2:
+                    return None
+                mean = self._baseline.mean - self._candidate.mean
+                error = math.sqrt(
+                    self._baseline.variance / self._baseline.count
+                    + self._candidate.variance / self._candidate.count
+                )
+        return (
+            math.exp(mean),
+            math.exp(mean - z * error),
+            math.exp(mean + z * error),
+        )
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import json
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Event, Thread
+from types import TracebackType
+from typing import Any, Deque, Optional, Type
+
+from pytimers.active_clocks import ACTIVE_CLOCKS
+from pytimers.clock import epoch_offset
+from pytimers.measurement import Measurement
+from pytimers.triggers.aggregating_trigger import AggregatingTrigger
+from pytimers.triggers.base_trigger import BaseTrigger
+
+
+class _DashboardServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], dashboard: TimingDashboard):
+        super().__init__(address, _DashboardHandler)
+        self.dashboard = dashboard
+
+
+class _DashboardHandler(BaseHTTPRequestHandler):
+    server: _DashboardServer
+
+    def do_GET(self) -> None:
+        dashboard = self.server.dashboard
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if path == "":
+            content: Any = dashboard.snapshot()
+        elif path == "/labels":
+            content = dashboard.labels()
+        elif path == "/in-flight":
+            content = dashboard.in_flight()
+        elif path == "/slow-calls":
+            content = dashboard.slow_calls()
+        else:
+            self.send_error(404)
+            return
+        body = json.dumps(content).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class TimingDashboard(BaseTrigger):
+    """Trigger serving a live view of the timed process as JSON over HTTP. The
+    dashboard exposes per label statistics of an
+    :py:class:`pytimers.AggregatingTrigger`, code blocks currently running in all
+    threads and asyncio tasks and the most recent slow measurements. The dashboard
+    has to be added to the triggers of the timer to collect slow measurements.
+
+    Requests are served by a daemon thread from snapshots so serving never blocks
+    the timed code. The statistics are merged from the aggregating trigger once per
+    ``refresh_interval`` regardless of the number of requests, running clocks are
+    read from :py:data:`pytimers.active_clocks.ACTIVE_CLOCKS` and slow measurements
+    are kept in a bounded :py:class:`collections.deque`.
+
+    The following paths are served: ``/`` with all the data, ``/labels``,
+    ``/in-flight`` and ``/slow-calls``.
+
+    :param aggregating_trigger: Source of the per label statistics. If set to
+        ``None`` no statistics are served.
+    :param host: Host the HTTP server binds to.
+    :param port: Port the HTTP server binds to. If set to ``0`` a free port is
+        chosen, see :py:attr:`pytimers.dashboard.TimingDashboard.url`.
+    :param slow_threshold_s: Minimal duration in seconds of a measurement to be kept
+        as a slow call.
+    :param max_slow_calls: Number of the most recent slow calls kept.
+    :param refresh_interval: Number of seconds between two snapshots of the
+        statistics.
+    """
+
+    needs_task_name = True
+
+    def __init__(
+        self,
+        aggregating_trigger: Optional[AggregatingTrigger] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        slow_threshold_s: float = 1.0,
+        max_slow_calls: int = 100,
+        refresh_interval: float = 1.0,
+    ):
+        super().__init__()
+        self.aggregating_trigger = aggregating_trigger
+        self.host = host
+        self.port = port
+        self.slow_threshold_s = slow_threshold_s
+        self.refresh_interval = refresh_interval
+        self._epoch_offset = epoch_offset()
+        self._slow_calls: Deque[Measurement] = deque(maxlen=max_slow_calls)
+        self._labels: list[dict[str, Any]] = []
+        self._server: Optional[_DashboardServer] = None
+        self._threads: list[Thread] = []
+        self._stop_event = Event()
+
+    def on_measurement(self, measurement: Measurement) -> None:
+        if measurement.duration_s >= self.slow_threshold_s:
+            self._slow_calls.append(measurement)
+
+    @property
+    def running(self) -> bool:
+        """True if the HTTP server is running."""
+
+        return self._server is not None
+
+    @property
+    def url(self) -> str:
+        """URL of the running dashboard.
+
+        :raise RuntimeError: The dashboard is not running.
+        """
+
+        if self._server is None:
+            raise RuntimeError("Dashboard is not running.")
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}/"
+
+    def start(self) -> None:
+        """Starts the HTTP server and the snapshot refresh in background daemon
+        threads.
+
+        :raise RuntimeError: The dashboard is already running.
+        """
+
+        if self._server is not None:
+            raise RuntimeError("Dashboard is already running.")
+        self._server = _DashboardServer((self.host, self.port), self)
+        ACTIVE_CLOCKS.acquire()
+        self._stop_event.clear()
+        self.refresh()
+        self._threads = [
+            Thread(
+                target=self._server.serve_forever,
+                name="pytimers-dashboard",
+                daemon=True,
+            ),
+            Thread(
+                target=self._run_refresh,
+                name="pytimers-dashboard-refresh",
+                daemon=True,
+            ),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        """Stops the HTTP server and the snapshot refresh."""
+
+        if self._server is None:
+            return
+        self._stop_event.set()
+        self._server.shutdown()
+        self._server.server_close()
+        for thread in self._threads:
+            thread.join()
+        self._server = None
+        self._threads = []
+        ACTIVE_CLOCKS.release()
+
+    def _run_refresh(self) -> None:
+        while not self._stop_event.wait(self.refresh_interval):
+            self.refresh()
+
+    def refresh(self) -> None:
+        """Takes a new snapshot of the statistics. This method is called
+        periodically by the background thread.
+        """
+
+        if self.aggregating_trigger is None:
+            return
+        failed = self.aggregating_trigger.statistics(failed=True)
+        labels: list[dict[str, Any]] = []
+        for label, statistics in self.aggregating_trigger.statistics().items():
+            failed_statistics = failed.get(label)
+            errors = 0 if failed_statistics is None else failed_statistics.count
+            labels.append(
+                {
+                    "label": label,
+                    "count": statistics.count,
+                    "errors": errors,
+                    "total_s": statistics.total_s,
+                    "mean_s": statistics.mean_s,
+                    "min_s": statistics.min_s,
+                    "p50_s": statistics.quantile(0.5),
+                    "p90_s": statistics.quantile(0.9),
+                    "p99_s": statistics.quantile(0.99),
+                    "max_s": statistics.max_s,
+                }
+            )
+        labels.sort(key=lambda entry: entry["total_s"], reverse=True)
+        # the snapshot is replaced at once so readers never see a partial update
+        self._labels = labels
+
+    def labels(self) -> list[dict[str, Any]]:
+        """Provides the latest snapshot of the per label statistics sorted by the
+        total measured time.
+
+        :return: JSON serializable statistics of each label.
+        """
+
+        return self._labels
+
+    def in_flight(self) -> list[dict[str, Any]]:
+        """Provides code blocks running at the time of the call sorted by their
+        current duration. Only code blocks started while the dashboard is running
+        are included.
+
+        :return: JSON serializable description of each running code block.
+        """
+
+        clocks = sorted(
+            ((clock.current_duration(), clock) for clock in ACTIVE_CLOCKS.snapshot()),
+            key=lambda item: item[0],
+            reverse=True,
+        )
+        return [
+            {
+                "label": clock.label,
+                "parent_label": None if clock.parent is None else clock.parent.label,
+                "thread_id": clock.thread_id,
+                "current_duration_s": current_duration,
+            }
+            for current_duration, clock in clocks
+        ]
+
+    def slow_calls(self) -> list[dict[str, Any]]:
+        """Provides the most recent measurements not shorter than
+        ``slow_threshold_s``, the most recent first.
+
+        :return: JSON serializable description of each slow measurement.
+        """
+
+        return [
+            {
+                "label": measurement.label,
+                "decorator": measurement.decorator,
+                "duration_s": measurement.duration_s,
+                "cpu_duration_s": measurement.cpu_duration_s,
+                "start_time": (
+                    None
+                    if measurement.start_time is None
+                    else measurement.start_time + self._epoch_offset
+                ),
+                "thread_id": measurement.thread_id,
+                "task_name": measurement.task_name,
+                "parent_label": measurement.parent_label,
+                "exception": (
+                    None
+                    if measurement.exc_type is None
+                    else measurement.exc_type.__name__
+                ),
+            }
+            for measurement in reversed(self._slow_calls.copy())
+        ]
+
+    def snapshot(self) -> dict[str, Any]:
+        """Provides all the data served by the dashboard.
+
+        :return: JSON serializable dictionary with ``labels``, ``in_flight`` and
+            ``slow_calls`` keys.
+        """
+
+        return {
+            "labels": self.labels(),
+            "in_flight": self.in_flight(),
+            "slow_calls": self.slow_calls(),
+        }
+
+    def __enter__(self) -> TimingDashboard:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.stop()
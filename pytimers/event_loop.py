@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Optional
+
+from pytimers.aggregation import LabelStatistics
+from pytimers.measurement import Measurement
+from pytimers.timer import Timer
+
+
+class EventLoopLagMonitor:
+    """Monitor of the event loop lag, i.e. the delay between the time a callback
+    was scheduled to run and the time the event loop actually ran it. Growing lag
+    means the event loop is overloaded and all coroutines appear slow regardless
+    of their own code.
+
+    :param interval: Number of seconds between two lag probes.
+    :param timer: Optional timer whose triggers receive every probed lag as a
+        measurement.
+    :param label: Label of the measurements passed to the timer.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.1,
+        timer: Optional[Timer] = None,
+        label: str = "event loop lag",
+    ):
+        self.interval = interval
+        self.timer = timer
+        self.label = label
+        self.lag_s = 0.0
+        self._statistics = LabelStatistics()
+        self._handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def running(self) -> bool:
+        """True if the monitor probes the event loop."""
+
+        return self._handle is not None
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """Starts probing the event loop.
+
+        :param loop: The event loop to be monitored. The running event loop is used
+            if set to ``None``.
+        :raise RuntimeError: The monitor is already running.
+        """
+
+        if self._handle is not None:
+            raise RuntimeError("Event loop lag monitor is already running.")
+        if loop is None:
+            loop = asyncio.get_running_loop()
+        self._schedule(loop)
+
+    def stop(self) -> None:
+        """Stops probing the event loop. Collected statistics are kept."""
+
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _schedule(self, loop: asyncio.AbstractEventLoop) -> None:
+        expected = loop.time() + self.interval
+        self._handle = loop.call_at(expected, self._probe, loop, expected)
+
+    def _probe(self, loop: asyncio.AbstractEventLoop, expected: float) -> None:
+        self.lag_s = max(loop.time() - expected, 0.0)
+        self._statistics.add_many([self.lag_s])
+        if self.timer is not None:
+            self.timer.record(
+                Measurement(duration_s=self.lag_s, decorator=False, label=self.label)
+            )
+        self._schedule(loop)
+
+    def statistics(self) -> LabelStatistics:
+        """Exposes statistics of all probed lags.
+
+        :return: Copy of the lag statistics.
+        """
+
+        return self._statistics.copy()
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import math
+from array import array
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Any, Callable, Optional, Type, TypeVar
+
+from pytimers.clock import Clock
+from pytimers.immutable_stack import ImmutableStack
+from pytimers.measurement import Measurement
+from pytimers.timer import COLLECTORS, STARTED_CLOCK_VAR, Timer
+from pytimers.triggers.batch_trigger import DECORATOR_FLAG, measurement_flags
+
+
+T = TypeVar("T")
+
+
+class TimedThreadPoolExecutor(ThreadPoolExecutor):
+    """:py:class:`concurrent.futures.ThreadPoolExecutor` running each submitted
+    callable in a copy of the context of the submitting code. Code blocks running at
+    the time of the submission become parents of code blocks timed in the worker
+    thread. Use the executor with :py:meth:`asyncio.loop.run_in_executor` or set it
+    as the default executor of the event loop to propagate the context there.
+    """
+
+    def submit(  # type: ignore[override]
+        self, fn: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> Future[T]:
+        return super().submit(copy_context().run, fn, *args, **kwargs)
+
+
+class MeasurementBatch:
+    """Compact encoding of measurements sent from a worker process to the parent
+    process. Labels are sent once per batch and referenced by index, numbers are
+    stored in arrays. Attributes meaningless in another process, e.g. clocks,
+    thread ids or start times, are not sent.
+
+    :param measurements: The measurements to be encoded.
+    """
+
+    __slots__ = (
+        "labels",
+        "label_indices",
+        "parent_label_indices",
+        "durations",
+        "cpu_durations",
+        "flags",
+        "exc_types",
+    )
+
+    def __init__(self, measurements: list[Measurement]):
+        label_indices: dict[Optional[str], int] = {}
+        self.labels: list[Optional[str]] = []
+        self.label_indices = array("L")
+        self.parent_label_indices = array("L")
+        self.durations = array("d")
+        self.cpu_durations = array("d")
+        self.flags = array("B")
+        # exception types of failed measurements indexed by measurement
+        self.exc_types: dict[int, Type[BaseException]] = {}
+        for index, measurement in enumerate(measurements):
+            for label, indices in (
+                (measurement.label, self.label_indices),
+                (measurement.parent_label, self.parent_label_indices),
+            ):
+                label_index = label_indices.get(label)
+                if label_index is None:
+                    label_index = label_indices[label] = len(self.labels)
+                    self.labels.append(label)
+                indices.append(label_index)
+            self.durations.append(measurement.duration_s)
+            cpu_duration = measurement.cpu_duration_s
+            self.cpu_durations.append(
+                math.nan if cpu_duration is None else cpu_duration
+            )
+            if measurement.exc_type is not None:
+                self.exc_types[index] = measurement.exc_type
+            self.flags.append(measurement_flags(measurement))
+
+    def __len__(self) -> int:
+        return len(self.durations)
+
+    def decode(self, parent_clock: Optional[Clock] = None) -> list[Measurement]:
+        """Decodes the measurements. Label ids are not sent as they differ between
+        processes, labels are interned again once the measurements are recorded.
+
+        :param parent_clock: Clock of the code block which submitted the work. It
+            becomes the parent of measurements not nested in another code block in
+            the worker process.
+        :return: The decoded measurements.
+        """
+
+        measurements = []
+        for index in range(len(self.durations)):
+            parent_label = self.labels[self.parent_label_indices[index]]
+            cpu_duration = self.cpu_durations[index]
+            measurement = Measurement(
+                duration_s=self.durations[index],
+                decorator=bool(self.flags[index] & DECORATOR_FLAG),
+                label=self.labels[self.label_indices[index]],
+                cpu_duration_s=None if math.isnan(cpu_duration) else cpu_duration,
+                parent_label=parent_label,
+                exc_type=self.exc_types.get(index),
+            )
+            if parent_label is None and parent_clock is not None:
+                measurement.parent_label = parent_clock.label
+                measurement.parent_clock = parent_clock
+            measurements.append(measurement)
+        return measurements
+
+
+def _run_in_worker(
+    fn: Callable[..., T], *args: Any, **kwargs: Any
+) -> tuple[T, MeasurementBatch]:
+    measurements: list[Measurement] = []
+    COLLECTORS.append(measurements)
+    # forked workers inherit clocks running in the parent process at the time of the
+    # fork, the clock of the submitting code block is assigned in the parent instead
+    token = STARTED_CLOCK_VAR.set(ImmutableStack.create_empty())
+    try:
+        result = fn(*args, **kwargs)
+    except BaseException as exc:
+        # measurements of failed calls are attached to the pickled exception
+        exc.__dict__["_pytimers_batch"] = MeasurementBatch(measurements)
+        raise
+    finally:
+        STARTED_CLOCK_VAR.reset(token)
+        COLLECTORS.remove(measurements)
+    return result, MeasurementBatch(measurements)
+
+
+class TimedProcessPoolExecutor(ProcessPoolExecutor):
+    """:py:class:`concurrent.futures.ProcessPoolExecutor` collecting measurements
+    finished in worker processes and recording them in a timer of the parent
+    process. Measurements of each submitted call are sent back in a single
+    :py:class:`pytimers.executors.MeasurementBatch` together with the result. Code
+    block running at the time of the submission becomes the parent of
+    measurements not nested in another code block in the worker process. Triggers
+    of timers in the worker process are not called for these measurements so each
+    measurement reaches triggers only once, in the parent process.
+
+    :param timer: Timer recording the measurements of the worker processes.
+    :param args: Positional arguments of
+        :py:class:`concurrent.futures.ProcessPoolExecutor`.
+    :param kwargs: Keyword arguments of
+        :py:class:`concurrent.futures.ProcessPoolExecutor`.
+    """
+
+    def __init__(self, timer: Timer, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.timer = timer
+
+    def submit(  # type: ignore[override]
+        self, fn: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> Future[T]:
+        clock_stack = STARTED_CLOCK_VAR.get()
+        parent_clock = None if clock_stack.empty() else clock_stack.peek()
+        worker_future = super().submit(_run_in_worker, fn, *args, **kwargs)
+        future: Future[T] = Future()
+
+        def cancel_worker(future: Future[T]) -> None:
+            if future.cancelled():
+                worker_future.cancel()
+
+        def finish(worker_future: Future[tuple[T, MeasurementBatch]]) -> None:
+            if worker_future.cancelled():
+                future.cancel()
+                return
+            exc = worker_future.exception()
+            if exc is None:
+                result, batch = worker_future.result()
+            else:
+                batch = exc.__dict__.pop("_pytimers_batch", None)
+            if batch is not None:
+                for measurement in batch.decode(parent_clock):
+                    self.timer.record(measurement)
+            # the future could be cancelled by the caller while the worker was running
+            if not future.set_running_or_notify_cancel():
+                return
+            if exc is None:
+                future.set_result(result)
+            else:
+                future.set_exception(exc)
+
+        future.add_done_callback(cancel_worker)
+        worker_future.add_done_callback(finish)
+        return future
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import gc
+from threading import Lock
+from timeit import default_timer
+from typing import Optional, Tuple
+
+# cumulative pause time in seconds followed by cumulative numbers of collections of
+# each generation
+GCSnapshot = Tuple[float, Tuple[int, ...]]
+
+
+class GCPauseTracker:
+    """Process wide accumulator of garbage collection pauses using
+    :py:data:`gc.callbacks`. The tracker keeps only cumulative counters, timed code
+    blocks take a snapshot of the counters when started and attribute the
+    difference to themselves once stopped. Garbage collection stops all threads so
+    a pause is attributed to all code blocks running at the time. The hook is
+    registered while at least one user, e.g. a timer created with ``gc_pauses``,
+    holds the tracker so it costs nothing once all such timers are gone.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._users = 0
+        self.pause_s = 0.0
+        self.collections = [0] * len(gc.get_count())
+        self._collection_start: Optional[float] = None
+        self._lock = Lock()
+
+    def acquire(self) -> None:
+        """Registers the garbage collection hook for a new user of the tracker."""
+
+        with self._lock:
+            self._users += 1
+        self.enable()
+
+    def release(self) -> None:
+        """Removes the garbage collection hook once the last user of the tracker
+        releases it.
+        """
+
+        with self._lock:
+            self._users = max(self._users - 1, 0)
+            if self._users > 0:
+                return
+        self.disable()
+
+    def enable(self) -> None:
+        """Registers the garbage collection hook if not registered yet."""
+
+        with self._lock:
+            if not self.enabled:
+                gc.callbacks.append(self._callback)
+                self.enabled = True
+
+    def disable(self) -> None:
+        """Removes the garbage collection hook regardless of its users. Collected
+        counters are kept.
+        """
+
+        with self._lock:
+            self._users = 0
+            if self.enabled:
+                gc.callbacks.remove(self._callback)
+                self.enabled = False
+                self._collection_start = None
+
+    def _callback(self, phase: str, info: dict[str, int]) -> None:
+        if phase == "start":
+            self._collection_start = default_timer()
+        elif self._collection_start is not None:
+            self.pause_s += default_timer() - self._collection_start
+            self.collections[info["generation"]] += 1
+            self._collection_start = None
+
+    def snapshot(self) -> GCSnapshot:
+        """Provides the current values of the cumulative counters.
+
+        :return: Cumulative pause time in seconds and cumulative numbers of
+            collections of each generation.
+        """
+
+        return self.pause_s, tuple(self.collections)
+
+    def since(self, snapshot: GCSnapshot) -> GCSnapshot:
+        """Calculates pauses since the snapshot was taken.
+
+        :param snapshot: Snapshot taken by
+            :py:meth:`pytimers.gc_tracking.GCPauseTracker.snapshot`.
+        :return: Pause time in seconds and numbers of collections of each generation
+            since the snapshot.
+        """
+
+        pause_s, collections = snapshot
+        return (
+            self.pause_s - pause_s,
+            tuple(
+                current - previous
+                for current, previous in zip(self.collections, collections)
+            ),
+        )
+
+
+# process wide tracker of garbage collection pauses
+GC_PAUSES = GCPauseTracker()
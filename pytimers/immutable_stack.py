@@ -20,6 +20,10 @@ class ImmutableStack(Generic[T], ABC):
     def pop(self) -> tuple[T, ImmutableStack[T]]:
         pass
 
+    @abstractmethod
+    def peek(self) -> T:
+        pass
+
     @abstractmethod
     def __len__(self) -> int:
         pass
@@ -51,6 +55,9 @@ class NonemptyImmutableStack(ImmutableStack[T]):
     def pop(self) -> tuple[T, ImmutableStack[T]]:
         return self._head, self._tail
 
+    def peek(self) -> T:
+        return self._head
+
     def __len__(self) -> int:
         return self._len
 
@@ -62,5 +69,8 @@ class EmptyImmutableStack(ImmutableStack[T]):
     def pop(self) -> tuple[T, ImmutableStack[T]]:
         raise IndexError("pop from emtpy stack")
 
+    def peek(self) -> T:
+        raise IndexError("peek from emtpy stack")
+
     def __len__(self) -> int:
         return 0
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from fnmatch import fnmatchcase
+from types import ModuleType
+from typing import Any, Callable, Iterable, Optional
+
+
+TIMER_ATTRIBUTE = "__pytimers_timer__"
+ORIGINAL_ATTRIBUTE = "__pytimers_original__"
+
+
+def _is_selected(
+    name: str,
+    include: Optional[Iterable[str]],
+    exclude: Optional[Iterable[str]],
+) -> bool:
+    if include is None:
+        if name.startswith("_"):
+            return False
+    elif not any(fnmatchcase(name, pattern) for pattern in include):
+        return False
+    return exclude is None or not any(fnmatchcase(name, pattern) for pattern in exclude)
+
+
+def _is_timeable(function: Any) -> bool:
+    # inspect is imported on the first instrumentation to keep `import pytimers` fast
+    import inspect
+
+    return (
+        inspect.isfunction(function)
+        and not inspect.isgeneratorfunction(function)
+        and not inspect.isasyncgenfunction(function)
+        and not hasattr(function, TIMER_ATTRIBUTE)
+    )
+
+
+def _instrumented_attribute(
+    timer: object,
+    attribute: Any,
+    wrap: Callable[[Callable[..., Any]], Callable[..., Any]],
+) -> Optional[Any]:
+    instrumented: Any
+    if isinstance(attribute, (staticmethod, classmethod)):
+        if not _is_timeable(attribute.__func__):
+            return None
+        wrapper = wrap(attribute.__func__)
+        instrumented = type(attribute)(wrapper)
+    elif _is_timeable(attribute):
+        wrapper = instrumented = wrap(attribute)
+    else:
+        return None
+    setattr(wrapper, TIMER_ATTRIBUTE, timer)
+    setattr(wrapper, ORIGINAL_ATTRIBUTE, attribute)
+    return instrumented
+
+
+def instrument_namespace(
+    timer: object,
+    target: type | ModuleType,
+    wrap: Callable[[Callable[..., Any]], Callable[..., Any]],
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+) -> list[str]:
+    """Replaces selected functions of a class or module with timed wrappers.
+
+    :param timer: Timer owning the wrappers.
+    :param target: Class or module to be instrumented.
+    :param wrap: Function creating the timed wrapper.
+    :param include: Glob patterns of names to be instrumented. All public names
+        are instrumented if set to ``None``.
+    :param exclude: Glob patterns of names not to be instrumented.
+    :return: Names of the instrumented attributes.
+    """
+
+    include = None if include is None else list(include)
+    exclude = None if exclude is None else list(exclude)
+    instrumented_names = []
+    for name, attribute in list(vars(target).items()):
+        if not _is_selected(name, include, exclude):
+            continue
+        if isinstance(target, ModuleType) and (
+            getattr(attribute, "__module__", None) != target.__name__
+        ):
+            # skip functions imported from other modules
+            continue
+        instrumented = _instrumented_attribute(timer, attribute, wrap)
+        if instrumented is not None:
+            setattr(target, name, instrumented)
+            instrumented_names.append(name)
+    return instrumented_names
+
+
+def uninstrument_namespace(timer: object, target: type | ModuleType) -> list[str]:
+    """Restores functions of a class or module replaced by
+    :py:func:`instrument_namespace`.
+
+    :param timer: Timer owning the wrappers to be removed.
+    :param target: Class or module to be restored.
+    :return: Names of the restored attributes.
+    """
+
+    restored_names = []
+    for name, attribute in list(vars(target).items()):
+        wrapper = (
+            attribute.__func__
+            if isinstance(attribute, (staticmethod, classmethod))
+            else attribute
+        )
+        if getattr(wrapper, TIMER_ATTRIBUTE, None) is timer:
+            setattr(target, name, getattr(wrapper, ORIGINAL_ATTRIBUTE))
+            restored_names.append(name)
+    return restored_names
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from threading import Lock
+from typing import Iterable, Optional
+
+
+class LabelRegistry:
+    """Registry interning labels into small consecutive integer ids. Interned ids
+    never change so triggers can use them as indexes into arrays. The ``None``
+    label of unlabelled code blocks is always interned as ``0``. Interned labels
+    are never released so the registry grows with the number of distinct labels.
+    """
+
+    def __init__(self) -> None:
+        self._ids: dict[Optional[str], int] = {None: 0}
+        self._labels: list[Optional[str]] = [None]
+        self._lock = Lock()
+
+    def intern(self, label: Optional[str]) -> int:
+        """Provides id of the label registering the label if needed.
+
+        :param label: The label to be interned.
+        :return: Id of the label.
+        """
+
+        label_id = self._ids.get(label)
+        if label_id is None:
+            with self._lock:
+                label_id = self._ids.get(label)
+                if label_id is None:
+                    label_id = len(self._labels)
+                    self._labels.append(label)
+                    self._ids[label] = label_id
+        return label_id
+
+    def label(self, label_id: int) -> Optional[str]:
+        """Looks up the label of an interned id.
+
+        :param label_id: Id of the label.
+        :return: The interned label.
+        :raise IndexError: Id was not provided by this registry.
+        """
+
+        return self._labels[label_id]
+
+    def labels(self, label_ids: Iterable[int]) -> list[Optional[str]]:
+        """Looks up labels of multiple interned ids at once.
+
+        :param label_ids: Ids of the labels.
+        :return: The interned labels in the same order.
+        """
+
+        labels = self._labels
+        return [labels[label_id] for label_id in label_ids]
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+
+# process wide registry shared by all timers and triggers
+LABEL_REGISTRY = LabelRegistry()
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from typing import Any, Optional, Type
+
+from pytimers.clock import Clock
+
+
+class Measurement:
+    """Structured result of a single finished timer passed to triggers. A single
+    instance is shared by all triggers of the timer so triggers should treat it as
+    read-only. Instances are not reused, triggers may keep references to them, e.g.
+    to report them later. Optional attributes are filled only if the timer is
+    configured to measure them. New attributes may be added in future versions
+    without breaking existing triggers.
+
+    :param duration_s: The measured wall time duration in seconds.
+    :param decorator: True if the timer was used as a decorator for callable.
+        False if used as a context manager for timing code blocks.
+    :param label: The label of the measured code block or the name of the decorated
+        callable.
+    :param cpu_duration_s: CPU time in seconds consumed during the measurement.
+        ``None`` if the timer was not configured to measure CPU time.
+    :param start_time: Start of the measurement as returned by
+        :py:func:`timeit.default_timer`.
+    :param thread_id: Identifier of the thread as returned by
+        :py:func:`threading.get_ident`.
+    :param task_name: Name of the :py:class:`asyncio.Task` running the measured code
+        or ``None`` outside of asyncio tasks. Set only if a trigger of the timer
+        sets :py:attr:`pytimers.BaseTrigger.needs_task_name`.
+    :param parent_label: Label of the enclosing timed code block or ``None`` if the
+        measurement is not nested in another timed code block.
+    :param label_id: Id of the label interned in
+        :py:data:`pytimers.labels.LABEL_REGISTRY`. ``None`` if the label was not
+        interned, labels of code blocks are interned only once passed to a batch
+        trigger.
+    :param exc_type: Type of the exception raised by the measured code or ``None``
+        if the code finished successfully.
+    :param active_duration_s: Time in seconds a decorated coroutine function actually
+        ran on the event loop. ``None`` if the timer was not configured to measure
+        active time of coroutines.
+    :param clock: The clock of the measured code block. ``None`` for decorated
+        callables.
+    :param parent_clock: The clock of the enclosing timed code block or ``None`` if
+        the measurement is not nested in another timed code block.
+    :param stack_trace: Formatted stack trace of the thread running the code block.
+        Captured only by :py:class:`pytimers.watchdog.Watchdog` reporting code blocks
+        still running after their deadline, ``None`` otherwise.
+    :param key: Key derived from the arguments of a callable decorated using
+        :py:meth:`pytimers.Timer.by`, e.g. the size of the input. ``None`` for other
+        measurements and calls whose key was not sampled.
+    :param phases: Names and durations in seconds of phases of the code block marked
+        by :py:meth:`pytimers.clock.Clock.lap`. ``None`` if no lap was recorded.
+    :param gc_duration_s: Time in seconds spent in garbage collection pauses during
+        the measurement. ``None`` if the timer was not configured to measure
+        garbage collection pauses.
+    :param gc_collections: Numbers of garbage collections of each generation during
+        the measurement. ``None`` if the timer was not configured to measure
+        garbage collection pauses.
+    """
+
+    __slots__ = (
+        "duration_s",
+        "decorator",
+        "label",
+        "cpu_duration_s",
+        "start_time",
+        "thread_id",
+        "task_name",
+        "parent_label",
+        "label_id",
+        "exc_type",
+        "active_duration_s",
+        "clock",
+        "parent_clock",
+        "stack_trace",
+        "key",
+        "phases",
+        "gc_duration_s",
+        "gc_collections",
+    )
+
+    def __init__(
+        self,
+        duration_s: float,
+        decorator: bool,
+        label: Optional[str] = None,
+        cpu_duration_s: Optional[float] = None,
+        start_time: Optional[float] = None,
+        thread_id: Optional[int] = None,
+        task_name: Optional[str] = None,
+        parent_label: Optional[str] = None,
+        label_id: Optional[int] = None,
+        exc_type: Optional[Type[BaseException]] = None,
+        active_duration_s: Optional[float] = None,
+        clock: Optional[Clock] = None,
+        parent_clock: Optional[Clock] = None,
+        stack_trace: Optional[str] = None,
+        key: Any = None,
+        phases: Optional[list[tuple[str, float]]] = None,
+        gc_duration_s: Optional[float] = None,
+        gc_collections: Optional[tuple[int, ...]] = None,
+    ):
+        self.duration_s = duration_s
+        self.decorator = decorator
+        self.label = label
+        self.cpu_duration_s = cpu_duration_s
+        self.start_time = start_time
+        self.thread_id = thread_id
+        self.task_name = task_name
+        self.parent_label = parent_label
+        self.label_id = label_id
+        self.exc_type = exc_type
+        self.active_duration_s = active_duration_s
+        self.clock = clock
+        self.parent_clock = parent_clock
+        self.stack_trace = stack_trace
+        self.key = key
+        self.phases = phases
+        self.gc_duration_s = gc_duration_s
+        self.gc_collections = gc_collections
+
+    @property
+    def failed(self) -> bool:
+        """True if the measured code raised an exception."""
+
+        return self.exc_type is not None
+
+    @property
+    def wait_duration_s(self) -> Optional[float]:
+        """Wall time not spent on CPU, e.g. waiting for I/O, locks or sleeping.
+        ``None`` if CPU time was not measured.
+        """
+
+        if self.cpu_duration_s is None:
+            return None
+        return max(self.duration_s - self.cpu_duration_s, 0.0)
+
+    @property
+    def non_gc_duration_s(self) -> Optional[float]:
+        """Wall time not spent in garbage collection pauses. ``None`` if garbage
+        collection pauses were not measured.
+        """
+
+        if self.gc_duration_s is None:
+            return None
+        return max(self.duration_s - self.gc_duration_s, 0.0)
+
+    @property
+    def suspended_duration_s(self) -> Optional[float]:
+        """Wall time a decorated coroutine function spent suspended, i.e. awaiting
+        I/O or waiting for other tasks running on the event loop. ``None`` if active
+        time was not measured.
+        """
+
+        if self.active_duration_s is None:
+            return None
+        return max(self.duration_s - self.active_duration_s, 0.0)
+
+    def __repr__(self) -> str:
+        attributes = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.__slots__
+        )
+        return f"{self.__class__.__name__}({attributes})"
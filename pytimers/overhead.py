@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+from random import random
+from threading import Lock, current_thread, local
+from typing import Any, Iterable, Optional
+
+
+class TriggerCost:
+    """Cumulative cost of a single trigger measured by
+    :py:class:`pytimers.overhead.OverheadGovernor`.
+
+    :param calls: Number of calls of the trigger. Batch triggers are called once per
+        flushed batch.
+    :param total_s: Total time in seconds spent in the trigger.
+    """
+
+    __slots__ = ("calls", "total_s")
+
+    def __init__(self, calls: int = 0, total_s: float = 0.0) -> None:
+        self.calls = calls
+        self.total_s = total_s
+
+    @property
+    def mean_s(self) -> float:
+        """Mean time of a single call in seconds or ``0.0`` if never called."""
+
+        return self.total_s / self.calls if self.calls else 0.0
+
+    def __repr__(self) -> str:
+        return f"TriggerCost(calls={self.calls}, total_s={self.total_s})"
+
+
+class _ThreadAccount:
+    """Costs and measured time accumulated by a single thread since they were last
+    merged into the governor. The account is protected by its own lock which is
+    contended only while another thread merges it.
+    """
+
+    __slots__ = ("thread", "lock", "count", "measured_s", "costs")
+
+    def __init__(self) -> None:
+        self.thread = current_thread()
+        self.lock = Lock()
+        self.count = 0
+        self.measured_s = 0.0
+        # calls and total time keyed by trigger id, triggers keep the ids valid
+        self.costs: dict[int, tuple[Any, TriggerCost]] = {}
+
+
+class OverheadGovernor:
+    """Tracks time a timer spends in its triggers and keeps it below a fraction of
+    the measured time. Every ``check_interval`` measurements the governor compares
+    the cost of triggers with the sum of durations of the measurements of the
+    period. If the cost exceeds ``max_fraction`` of the measured time the governor
+    lowers the fraction of measurements passed to triggers. Once the sample rate
+    reaches ``min_sample_rate`` the trigger with the highest cost in the period is
+    disabled instead. The sample rate is raised again once the cost drops below
+    half of ``max_fraction``. Measurements of nested code blocks are all included
+    in the measured time. Each thread accumulates its costs separately and merges
+    them into the governor once per ``check_interval`` of its measurements, so
+    threads contend on a shared lock only at that time.
+
+    :param max_fraction: Maximal cost of triggers relative to the measured time,
+        e.g. ``0.01`` for 1 %. If set to ``None`` the costs are only tracked.
+    :param check_interval: Number of measurements between two checks of the cost.
+    :param min_sample_rate: Lowest fraction of measurements passed to triggers.
+    :param disable_triggers: If set to ``False`` triggers are never disabled and the
+        sample rate is the only means of lowering the cost.
+    """
+
+    def __init__(
+        self,
+        max_fraction: Optional[float] = 0.01,
+        check_interval: int = 1000,
+        min_sample_rate: float = 0.01,
+        disable_triggers: bool = True,
+    ) -> None:
+        self.max_fraction = max_fraction
+        self.check_interval = check_interval
+        self.min_sample_rate = min_sample_rate
+        self.disable_triggers = disable_triggers
+        self.sample_rate = 1.0
+        self._measured_s = 0.0
+        self._lock = Lock()
+        self._local = local()
+        self._accounts: list[_ThreadAccount] = []
+        # costs keyed by trigger id, triggers are kept to keep the ids valid
+        self._costs: dict[int, tuple[Any, TriggerCost]] = {}
+        self._disabled: dict[int, Any] = {}
+        self._period_count = 0
+        self._period_measured_s = 0.0
+        self._period_costs: dict[int, float] = {}
+
+    def sampled(self) -> bool:
+        """Decides whether the next measurement is passed to triggers.
+
+        :return: ``True`` if the measurement should be passed to triggers.
+        """
+
+        sample_rate = self.sample_rate
+        return sample_rate >= 1.0 or random() < sample_rate
+
+    def enabled(self, trigger: Any) -> bool:
+        """Checks whether the trigger was not disabled by the governor.
+
+        :param trigger: Trigger of the timer.
+        :return: ``False`` if the trigger was disabled.
+        """
+
+        return id(trigger) not in self._disabled
+
+    def account(
+        self,
+        duration_s: Optional[float],
+        costs: Iterable[tuple[Any, float]] = (),
+    ) -> None:
+        """Records a finished measurement and the time spent in triggers.
+
+        :param duration_s: Duration of the measurement in seconds. ``None`` if the
+            costs are not related to a measurement, e.g. for flushed batches.
+        :param costs: Triggers and the time in seconds spent in each of them.
+        """
+
+        account: Optional[_ThreadAccount] = getattr(self._local, "account", None)
+        if account is None:
+            account = self._local.account = _ThreadAccount()
+            with self._lock:
+                self._accounts.append(account)
+        with account.lock:
+            for trigger, cost_s in costs:
+                key = id(trigger)
+                tracked = account.costs.get(key)
+                if tracked is None:
+                    tracked = account.costs[key] = (trigger, TriggerCost())
+                tracked[1].calls += 1
+                tracked[1].total_s += cost_s
+            if duration_s is None:
+                return
+            account.measured_s += duration_s
+            account.count += 1
+            if account.count < self.check_interval:
+                return
+        with self._lock:
+            self._merge()
+            if self._period_count >= self.check_interval:
+                self._check()
+
+    def _merge(self) -> None:
+        # merges accounts of all threads, the caller holds the governor lock
+        accounts = self._accounts
+        for account in accounts:
+            with account.lock:
+                costs = account.costs
+                self._period_count += account.count
+                self._period_measured_s += account.measured_s
+                self._measured_s += account.measured_s
+                account.count = 0
+                account.measured_s = 0.0
+                account.costs = {}
+            for key, (trigger, cost) in costs.items():
+                tracked = self._costs.get(key)
+                if tracked is None:
+                    tracked = self._costs[key] = (trigger, TriggerCost())
+                tracked[1].calls += cost.calls
+                tracked[1].total_s += cost.total_s
+                self._period_costs[key] = (
+                    self._period_costs.get(key, 0.0) + cost.total_s
+                )
+        self._accounts = [account for account in accounts if account.thread.is_alive()]
+
+    def _check(self) -> None:
+        cost_s = sum(self._period_costs.values())
+        measured_s = self._period_measured_s
+        period_costs = self._period_costs
+        self._period_count = 0
+        self._period_measured_s = 0.0
+        self._period_costs = {}
+        if self.max_fraction is None:
+            return
+        if cost_s <= 0.0:
+            fraction = 0.0
+        elif measured_s <= 0.0:
+            fraction = float("inf")
+        else:
+            fraction = cost_s / measured_s
+        if fraction > self.max_fraction:
+            if self.sample_rate > self.min_sample_rate:
+                self.sample_rate = max(
+                    self.min_sample_rate,
+                    self.sample_rate * self.max_fraction / fraction,
+                )
+            elif self.disable_triggers:
+                key = max(period_costs, key=lambda key: period_costs[key])
+                self._disabled[key] = self._costs[key][0]
+        elif fraction < self.max_fraction / 2 and self.sample_rate < 1.0:
+            self.sample_rate = min(1.0, self.sample_rate * 2)
+
+    @property
+    def measured_s(self) -> float:
+        """Total measured time in seconds."""
+
+        with self._lock:
+            self._merge()
+            return self._measured_s
+
+    @property
+    def overhead_fraction(self) -> float:
+        """Total time spent in triggers relative to the total measured time."""
+
+        with self._lock:
+            self._merge()
+            cost_s = sum(cost.total_s for _, cost in self._costs.values())
+            measured_s = self._measured_s
+        if cost_s <= 0.0:
+            return 0.0
+        return cost_s / measured_s if measured_s > 0.0 else float("inf")
+
+    def costs(self) -> list[tuple[Any, TriggerCost]]:
+        """Exposes costs of all triggers called so far.
+
+        :return: Triggers and copies of their costs ordered from the most expensive.
+        """
+
+        with self._lock:
+            self._merge()
+            costs = [
+                (trigger, TriggerCost(cost.calls, cost.total_s))
+                for trigger, cost in self._costs.values()
+            ]
+        costs.sort(key=lambda item: item[1].total_s, reverse=True)
+        return costs
+
+    def disabled_triggers(self) -> list[Any]:
+        """Lists triggers disabled by the governor.
+
+        :return: The disabled triggers in order of disabling.
+        """
+
+        with self._lock:
+            return list(self._disabled.values())
+
+    def reset(self) -> None:
+        """Enables all disabled triggers, restores the full sample rate and discards
+        the tracked costs.
+        """
+
+        with self._lock:
+            self._merge()
+            self.sample_rate = 1.0
+            self._measured_s = 0.0
+            self._costs = {}
+            self._disabled = {}
+            self._period_count = 0
+            self._period_measured_s = 0.0
+            self._period_costs = {}
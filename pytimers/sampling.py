@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from threading import Event, Lock, Thread
+from types import TracebackType
+from typing import Optional, Type
+
+from pytimers.active_clocks import ACTIVE_CLOCKS
+
+
+class SamplingProfiler:
+    """Statistical profiler periodically sampling labelled code blocks running in all
+    threads and asyncio tasks. Each sample counts the innermost labelled block of
+    every clock stack, so a label running in several threads at once is counted
+    once per thread. Unlike triggers, the cost of the profiler does not grow with
+    the number of timed code blocks entered. Only code blocks timed using the
+    context manager are sampled as decorated callables do not start a
+    :py:class:`pytimers.clock.Clock`.
+
+    :param interval: Number of seconds between two samples.
+    """
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self._counts: dict[Optional[str], int] = {}
+        self._samples = 0
+        self._lock = Lock()
+        self._stop_event = Event()
+        self._thread: Optional[Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """True if the background sampling thread is running."""
+
+        return self._thread is not None
+
+    def start(self) -> None:
+        """Starts sampling in a background daemon thread.
+
+        :raise RuntimeError: The profiler is already running.
+        """
+
+        if self._thread is not None:
+            raise RuntimeError("Sampling profiler is already running.")
+        ACTIVE_CLOCKS.acquire()
+        self._stop_event.clear()
+        self._thread = Thread(
+            target=self._run,
+            name="pytimers-sampling-profiler",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the background sampling thread. Collected samples are kept."""
+
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        ACTIVE_CLOCKS.release()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> None:
+        """Takes a single sample of running labelled code blocks. This method is
+        called periodically by the background thread.
+        """
+
+        clocks = ACTIVE_CLOCKS.innermost()
+        with self._lock:
+            self._samples += 1
+            for clock in clocks:
+                label = clock.innermost_label()
+                if label is not None:
+                    self._counts[label] = self._counts.get(label, 0) + 1
+
+    def counts(self) -> dict[Optional[str], int]:
+        """Exposes number of samples in which each label was running.
+
+        :return: Number of samples for each label.
+        """
+
+        with self._lock:
+            return dict(self._counts)
+
+    def breakdown(self) -> dict[Optional[str], float]:
+        """Estimates fraction of the profiled time each label was running. Fractions
+        of labels running concurrently in multiple threads or tasks can add up to
+        more than one.
+
+        :return: Fraction of samples for each label.
+        """
+
+        with self._lock:
+            if self._samples == 0:
+                return {}
+            return {
+                label: count / self._samples for label, count in self._counts.items()
+            }
+
+    def estimated_durations(self) -> dict[Optional[str], float]:
+        """Estimates for how long each label was running.
+
+        :return: Estimated duration in seconds for each label.
+        """
+
+        return {
+            label: count * self.interval for label, count in self.counts().items()
+        }
+
+    def reset(self) -> None:
+        """Discards all collected samples."""
+
+        with self._lock:
+            self._counts = {}
+            self._samples = 0
+
+    def __enter__(self) -> SamplingProfiler:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.stop()
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import math
+from typing import Optional
+
+from pytimers.aggregation import LabelStatistics
+
+
+def log2_bucket(size: float) -> int:
+    """Rounds a size down to a power of two. Use it as a key of
+    :py:meth:`pytimers.Timer.by` to aggregate durations of calls with inputs of
+    similar size together, e.g. ``@timer.by(lambda rows: log2_bucket(len(rows)))``.
+
+    :param size: The size, e.g. number of items of the input.
+    :return: The greatest power of two not greater than the size or ``0`` for sizes
+        lower than one.
+    """
+
+    if size < 1:
+        return 0
+    return 1 << (int(size).bit_length() - 1)
+
+
+class SizeScaling:
+    """Statistics of durations of a single label measured against the size of the
+    input. Durations are aggregated in power of two size buckets and a power law
+    ``duration = c * size ** exponent`` is fitted to all measurements using least
+    squares in log-log scale.
+
+    :param relative_accuracy: Maximal relative error of estimated quantiles of the
+        buckets, see :py:class:`pytimers.aggregation.LatencyHistogram`.
+    """
+
+    __slots__ = (
+        "count",
+        "total_size",
+        "total_s",
+        "buckets",
+        "_relative_accuracy",
+        "_fitted",
+        "_sum_x",
+        "_sum_y",
+        "_sum_xx",
+        "_sum_xy",
+    )
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        self.count = 0
+        self.total_size = 0.0
+        self.total_s = 0.0
+        self.buckets: dict[int, LabelStatistics] = {}
+        self._relative_accuracy = relative_accuracy
+        # sums of logarithms of sizes (x) and durations (y) used by the fit
+        self._fitted = 0
+        self._sum_x = 0.0
+        self._sum_y = 0.0
+        self._sum_xx = 0.0
+        self._sum_xy = 0.0
+
+    def add(self, size: float, duration_s: float) -> None:
+        """Updates the statistics with a single measurement.
+
+        :param size: The size of the input.
+        :param duration_s: The measured duration in seconds.
+        """
+
+        self.count += 1
+        self.total_size += size
+        self.total_s += duration_s
+        bucket = log2_bucket(size)
+        statistics = self.buckets.get(bucket)
+        if statistics is None:
+            statistics = self.buckets[bucket] = LabelStatistics(
+                self._relative_accuracy
+            )
+        statistics.add(duration_s)
+        if size > 0 and duration_s > 0:
+            x = math.log(size)
+            y = math.log(duration_s)
+            self._fitted += 1
+            self._sum_x += x
+            self._sum_y += y
+            self._sum_xx += x * x
+            self._sum_xy += x * y
+
+    def merge(self, other: SizeScaling) -> None:
+        """Updates the statistics with statistics of another set of measurements.
+
+        :param other: The statistics to be merged in.
+        """
+
+        self.count += other.count
+        self.total_size += other.total_size
+        self.total_s += other.total_s
+        for bucket, statistics in other.buckets.items():
+            if bucket in self.buckets:
+                self.buckets[bucket].merge(statistics)
+            else:
+                self.buckets[bucket] = statistics.copy()
+        self._fitted += other._fitted
+        self._sum_x += other._sum_x
+        self._sum_y += other._sum_y
+        self._sum_xx += other._sum_xx
+        self._sum_xy += other._sum_xy
+
+    @property
+    def per_item_s(self) -> float:
+        """Total measured time divided by the total size in seconds or ``0.0`` if the
+        total size is zero.
+        """
+
+        return self.total_s / self.total_size if self.total_size else 0.0
+
+    @property
+    def exponent(self) -> Optional[float]:
+        """Fitted exponent of the size. Exponent close to one means linear scaling,
+        exponents significantly greater than one indicate super-linear scaling.
+        ``None`` if the measurements do not cover at least two distinct sizes.
+        """
+
+        denominator = self._fitted * self._sum_xx - self._sum_x**2
+        # relative threshold absorbs rounding errors of equal sizes
+        if self._fitted < 2 or denominator <= 1e-9 * self._fitted * self._sum_xx:
+            return None
+        return (self._fitted * self._sum_xy - self._sum_x * self._sum_y) / denominator
+
+    def copy(self) -> SizeScaling:
+        """Creates an independent copy of the statistics.
+
+        :return: The copied statistics.
+        """
+
+        scaling = SizeScaling(self._relative_accuracy)
+        scaling.merge(self)
+        return scaling
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import struct
+from typing import Mapping, Optional
+
+from pytimers.aggregation import LabelStatistics, LatencyHistogram
+
+
+# leading bytes and version of encoded statistics
+MAGIC = b"PYTS"
+VERSION = 1
+
+_HISTOGRAM_HEADER = struct.Struct("<dd")
+_STATISTICS_HEADER = struct.Struct("<ddd")
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    while value >= 0x80:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(data: bytes, offset: int) -> tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _write_histogram(buffer: bytearray, histogram: LatencyHistogram) -> None:
+    buffer += _HISTOGRAM_HEADER.pack(
+        histogram.relative_accuracy, histogram.min_duration_s
+    )
+    _write_varint(buffer, histogram.zero_count)
+    _write_varint(buffer, len(histogram.buckets))
+    # sorted bucket keys are stored as zigzag encoded differences
+    previous = 0
+    for key in sorted(histogram.buckets):
+        delta = key - previous
+        _write_varint(buffer, delta * 2 if delta >= 0 else -delta * 2 - 1)
+        _write_varint(buffer, histogram.buckets[key])
+        previous = key
+
+
+def _read_histogram(data: bytes, offset: int) -> tuple[LatencyHistogram, int]:
+    relative_accuracy, min_duration_s = _HISTOGRAM_HEADER.unpack_from(data, offset)
+    offset += _HISTOGRAM_HEADER.size
+    histogram = LatencyHistogram(relative_accuracy, min_duration_s)
+    histogram.zero_count, offset = _read_varint(data, offset)
+    histogram.count = histogram.zero_count
+    size, offset = _read_varint(data, offset)
+    key = 0
+    for _ in range(size):
+        delta, offset = _read_varint(data, offset)
+        key += delta >> 1 if delta & 1 == 0 else -((delta + 1) >> 1)
+        count, offset = _read_varint(data, offset)
+        histogram.buckets[key] = count
+        histogram.count += count
+    return histogram, offset
+
+
+def encode_statistics(statistics: Mapping[Optional[str], LabelStatistics]) -> bytes:
+    """Encodes per label statistics, e.g. returned by
+    :py:meth:`pytimers.AggregatingTrigger.statistics`, into a compact binary format.
+    Histogram buckets are stored exactly so statistics encoded on different nodes
+    can be merged into statistics of all measurements without any loss of accuracy.
+
+    :param statistics: Statistics of each label.
+    :return: The encoded statistics.
+    """
+
+    buffer = bytearray(MAGIC)
+    buffer.append(VERSION)
+    _write_varint(buffer, len(statistics))
+    for label, label_statistics in statistics.items():
+        if label is None:
+            _write_varint(buffer, 0)
+        else:
+            encoded_label = label.encode("utf-8")
+            _write_varint(buffer, len(encoded_label) + 1)
+            buffer += encoded_label
+        _write_varint(buffer, label_statistics.count)
+        buffer += _STATISTICS_HEADER.pack(
+            label_statistics.total_s, label_statistics.min_s, label_statistics.max_s
+        )
+        _write_histogram(buffer, label_statistics.histogram)
+    return bytes(buffer)
+
+
+def decode_statistics(data: bytes) -> dict[Optional[str], LabelStatistics]:
+    """Decodes statistics encoded by
+    :py:func:`pytimers.serialization.encode_statistics`.
+
+    :param data: The encoded statistics.
+    :return: Statistics of each label.
+    :raise ValueError: The data are not encoded statistics of a supported version.
+    """
+
+    if data[: len(MAGIC)] != MAGIC:
+        raise ValueError("Data are not encoded pytimers statistics.")
+    if len(data) <= len(MAGIC) or data[len(MAGIC)] != VERSION:
+        raise ValueError("Unsupported version of encoded pytimers statistics.")
+    result: dict[Optional[str], LabelStatistics] = {}
+    try:
+        size, offset = _read_varint(data, len(MAGIC) + 1)
+        for _ in range(size):
+            label_size, offset = _read_varint(data, offset)
+            label: Optional[str] = None
+            if label_size:
+                end = offset + label_size - 1
+                label = data[offset:end].decode("utf-8")
+                offset = end
+            statistics = LabelStatistics()
+            statistics.count, offset = _read_varint(data, offset)
+            (
+                statistics.total_s,
+                statistics.min_s,
+                statistics.max_s,
+            ) = _STATISTICS_HEADER.unpack_from(data, offset)
+            offset += _STATISTICS_HEADER.size
+            statistics.histogram, offset = _read_histogram(data, offset)
+            result[label] = statistics
+    except (IndexError, struct.error):
+        raise ValueError("Encoded pytimers statistics are truncated.") from None
+    return result
+
+
+def merge_statistics(
+    *statistics: Mapping[Optional[str], LabelStatistics]
+) -> dict[Optional[str], LabelStatistics]:
+    """Merges statistics of the same labels, e.g. decoded statistics collected by
+    different nodes. Quantiles of the merged statistics are estimated from the
+    merged histograms, not averaged.
+
+    :param statistics: Statistics of each label to be merged.
+    :return: Merged copies of the statistics of each label.
+    :raise ValueError: Histograms of a label have different bucket sizes.
+    """
+
+    result: dict[Optional[str], LabelStatistics] = {}
+    for mapping in statistics:
+        for label, label_statistics in mapping.items():
+            if label in result:
+                result[label].merge(label_statistics)
+            else:
+                result[label] = label_statistics.copy()
+    return result
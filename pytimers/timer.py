@@ -1,17 +1,26 @@
 from __future__ import annotations
 
-import inspect
-from contextvars import ContextVar
+import sys
+from contextvars import ContextVar, copy_context
+from functools import partial, wraps
+from threading import Lock, get_ident, local
 from timeit import default_timer
-from types import TracebackType
-from typing import Any, Awaitable, Callable, Iterable, Optional, Type
-from warnings import warn
-
-from decorator import decorate  # type: ignore
+from types import ModuleType, TracebackType
+from typing import Any, Awaitable, Callable, Iterable, Optional, TYPE_CHECKING, Type
 
+from pytimers.active_clocks import ACTIVE_CLOCKS
 from pytimers.clock import Clock
 from pytimers.immutable_stack import ImmutableStack
-from pytimers.triggers import BaseTrigger
+from pytimers.labels import LABEL_REGISTRY
+from pytimers.measurement import Measurement
+from pytimers.triggers.base_trigger import BaseTrigger, notify_trigger
+from pytimers.triggers.batch_trigger import BatchTrigger, measurement_flags
+
+if TYPE_CHECKING:
+    from pytimers.batching import MeasurementBuffer
+    from pytimers.comparison import Comparison, Outcome
+    from pytimers.gc_tracking import GCSnapshot
+    from pytimers.overhead import OverheadGovernor
 
 
 STARTED_CLOCK_VAR: ContextVar[ImmutableStack[Clock]] = ContextVar(
@@ -19,18 +28,106 @@ STARTED_CLOCK_VAR: ContextVar[ImmutableStack[Clock]] = ContextVar(
     default=ImmutableStack.create_empty(),
 )
 
+# lists collecting all measurements finished in this process, used to send
+# measurements of worker processes back to the parent process, triggers are not
+# called while any collector is active
+COLLECTORS: list[list[Measurement]] = []
+
+
+def _current_task_name() -> Optional[str]:
+    # asyncio is inspected only if already imported by the application
+    asyncio = sys.modules.get("asyncio")
+    if asyncio is None:
+        return None
+    # unlike current_task the running loop lookup does not raise outside a loop
+    loop = asyncio._get_running_loop()
+    if loop is None:
+        return None
+    task = asyncio.current_task(loop)
+    if task is None or not hasattr(task, "get_name"):
+        return None
+    return str(task.get_name())
+
+
+def _is_coroutine_function(function: Any) -> bool:
+    # inspect is imported on the first decoration to keep `import pytimers` fast
+    import inspect
+
+    return inspect.iscoroutinefunction(function)
+
+
+def _sampled(key: Callable[..., Any], sample_rate: float) -> Callable[..., Any]:
+    from random import random
+
+    def sampled_key(*args: Any, **kwargs: Any) -> Any:
+        return key(*args, **kwargs) if random() < sample_rate else None
+
+    return sampled_key
+
+
+# trigger types mapped to True for batch triggers, isinstance checks of the
+# abstract trigger classes are considerably slower than the lookup
+_BATCH_TRIGGER_TYPES: dict[type, bool] = {}
+
+
+def _is_batch_trigger(trigger: Any) -> bool:
+    cls = type(trigger)
+    batch = _BATCH_TRIGGER_TYPES.get(cls)
+    if batch is None:
+        batch = _BATCH_TRIGGER_TYPES[cls] = issubclass(cls, BatchTrigger)
+    return batch
+
+
+# modules of optional features are imported on their first use to keep
+# `import pytimers` fast
+def _gc_snapshot() -> GCSnapshot:
+    from pytimers.gc_tracking import GC_PAUSES
+
+    return GC_PAUSES.snapshot()
+
+
+def _gc_since(snapshot: GCSnapshot) -> GCSnapshot:
+    from pytimers.gc_tracking import GC_PAUSES
+
+    return GC_PAUSES.since(snapshot)
+
+
+def _running_clock() -> Optional[Clock]:
+    clock_stack = STARTED_CLOCK_VAR.get()
+    return None if clock_stack.empty() else clock_stack.peek()
+
 
 class Timer:
     """Initializes Timer object with a set of triggers to be applied after the
     timer finishes.
 
-    :param triggers: An iterable of callables to be called after the timer finishes.
-        All triggers should accept keywords arguments ``duration_s: float,
-        decorator: bool, label: str``. PyTimers also provide an abstract class
-        :py:class:`BaseTrigger` to help with trigger interface implementation. See the
-        :py:class:`BaseTrigger` for more details. Any instance of
-        :py:class:`BaseTrigger` subclass is a valid trigger and can be passed to the
-        argument ``triggers``.
+    :param triggers: An iterable of triggers to be called after the timer finishes.
+        Instances of :py:class:`BaseTrigger` subclasses receive a single
+        :py:class:`pytimers.measurement.Measurement` shared by all triggers via
+        :py:meth:`BaseTrigger.on_measurement`. Any other callable is called with
+        positional arguments ``duration_s: float, decorator: bool, label: str``.
+    :param cpu_timer: Optional CPU clock, e.g. :py:func:`time.thread_time` or
+        :py:func:`time.process_time`, used to measure CPU time alongside the wall
+        time. CPU time is not measured if set to ``None``.
+    :param batch_size: Number of measurements buffered per thread before they are
+        handed over to instances of
+        :py:class:`pytimers.triggers.batch_trigger.BatchTrigger`.
+    :param flush_interval: Maximal age in seconds of a per thread buffer before it
+        is flushed to batch triggers. The age is checked whenever a new measurement
+        is buffered. If set to ``None`` the buffers are flushed only by size or
+        by :py:meth:`pytimers.Timer.flush`.
+    :param async_active_time: If set to ``True`` decorated coroutine functions
+        additionally measure the time they actually run on the event loop, excluding
+        the time they are suspended while other tasks run.
+    :param gc_pauses: If set to ``True`` time spent in garbage collection pauses and
+        numbers of collections are measured alongside the wall time using the
+        process wide :py:data:`pytimers.gc_tracking.GC_PAUSES` tracker. Its
+        :py:data:`gc.callbacks` hook is removed once all timers measuring the pauses
+        are garbage collected.
+    :param governor: Optional :py:class:`pytimers.overhead.OverheadGovernor`
+        measuring time spent in each trigger and lowering the sample rate of
+        measurements passed to triggers or disabling expensive triggers once the
+        cost exceeds the configured fraction of the measured time.
     """
 
     def __init__(
@@ -38,14 +135,47 @@ class Timer:
         triggers: Optional[
             Iterable[BaseTrigger | Callable[[float, bool, Optional[str]], Any]]
         ] = None,
+        cpu_timer: Optional[Callable[[], float]] = None,
+        batch_size: int = 1024,
+        flush_interval: Optional[float] = 1.0,
+        async_active_time: bool = False,
+        gc_pauses: bool = False,
+        governor: Optional[OverheadGovernor] = None,
     ):
         self._label_text: Optional[str] = None
         self.triggers = list(triggers) if triggers else []
+        # names of asyncio tasks are looked up only if any trigger reads them
+        self._task_names = any(
+            getattr(trigger, "needs_task_name", False) for trigger in self.triggers
+        )
+        self.cpu_timer = cpu_timer
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.async_active_time = async_active_time
+        self.gc_pauses = gc_pauses
+        if gc_pauses:
+            from weakref import finalize
+
+            from pytimers.gc_tracking import GC_PAUSES
+
+            GC_PAUSES.acquire()
+            # the hook is removed once the last such timer is garbage collected
+            finalize(self, GC_PAUSES.release)
+        self.governor = governor
+        # approximate number of calls whose key extractor raised an exception
+        self.key_errors = 0
         self._latest_time: Optional[float] = None
+        self._local_buffer = local()
+        self._buffers: list[MeasurementBuffer] = []
+        self._buffers_lock = Lock()
 
     def label(self, text: str) -> Timer:
         """Sets label for the next timed code block. This label propagates to all
-        triggers once the context managers is closed.
+        triggers once the context managers is closed. The label is interned in
+        :py:data:`pytimers.labels.LABEL_REGISTRY` only once the measurement is
+        passed to a batch trigger. Interned labels are never released, avoid
+        unbounded numbers of distinct labels, e.g. containing request ids, with
+        batch triggers.
 
         :param text: Code block label text.
         :return: Returns ``self``. This makes possible to call the method directly
@@ -62,6 +192,8 @@ class Timer:
         .. deprecated:: 3.0
         """
 
+        from warnings import warn
+
         warn(
             message=(
                 "The `named` method will no longer be supported in future versions. "
@@ -72,11 +204,22 @@ class Timer:
         return self.label(name)
 
     def __enter__(self) -> Clock:
-        started_timer = Clock(label=self._label_text)
         clock_stack = STARTED_CLOCK_VAR.get()
+        # positional arguments are considerably cheaper than keywords, mypy checks
+        # their order as the parameters have distinct types
+        started_timer = Clock(
+            self._label_text,
+            self.cpu_timer,
+            # labels of code blocks are interned lazily, None is always 0
+            0 if self._label_text is None else None,
+            None if clock_stack.empty() else clock_stack.peek(),
+            self.gc_pauses,
+        )
         STARTED_CLOCK_VAR.set(clock_stack.push(started_timer))
+        if ACTIVE_CLOCKS.enabled:
+            ACTIVE_CLOCKS.register(started_timer)
 
-        if self._label_text:
+        if self._label_text is not None:
             self._label_text = None
 
         return started_timer
@@ -91,51 +234,576 @@ class Timer:
         clock, new_clock_stack = clock_stack.pop()
         STARTED_CLOCK_VAR.set(new_clock_stack)
         clock.stop()
-        self._finish_timing(
+        if ACTIVE_CLOCKS.enabled:
+            ACTIVE_CLOCKS.unregister(clock)
+        parent_clock = clock.parent
+        measurement = Measurement(
             clock.duration(),
-            clock.label,
             False,
+            clock.label,
+            None if self.cpu_timer is None else clock.cpu_duration(),
+            clock.start_time,
+            clock.thread_id,
+            _current_task_name() if self._task_names else None,
+            None if parent_clock is None else parent_clock.label,
+            clock.label_id,
         )
+        # assigning the remaining attributes is considerably cheaper than passing
+        # them as keywords on this hot path
+        measurement.exc_type = exc_type
+        measurement.clock = clock
+        measurement.parent_clock = parent_clock
+        if clock.lap_count:
+            measurement.phases = clock.phases()
+        if self.gc_pauses:
+            measurement.gc_duration_s = clock.gc_duration()
+            measurement.gc_collections = clock.gc_collections()
+        self._finish_timing(measurement)
 
     def _wrapper(
         self,
+        label_id: int,
+        key_extractor: Optional[Callable[..., Any]],
         wrapped: Callable[..., Any],
         *args: Any,
         **kwargs: Any,
     ) -> Any:
+        key = None if key_extractor is None else self._key(key_extractor, args, kwargs)
+        cpu_timer = self.cpu_timer
+        cpu_start_time = cpu_timer() if cpu_timer is not None else None
+        gc_start = _gc_snapshot() if self.gc_pauses else None
         start_time = default_timer()
-        output = wrapped(*args, **kwargs)
+        try:
+            output = wrapped(*args, **kwargs)
+        except BaseException as exc:
+            end_time = default_timer()
+            self._finish_call(
+                label_id,
+                wrapped.__qualname__,
+                start_time,
+                end_time,
+                cpu_start_time,
+                key,
+                gc_start,
+                type(exc),
+            )
+            raise
         end_time = default_timer()
-        self._finish_timing(end_time - start_time, wrapped.__qualname__, True)
+        self._finish_call(
+            label_id,
+            wrapped.__qualname__,
+            start_time,
+            end_time,
+            cpu_start_time,
+            key,
+            gc_start,
+        )
         return output
 
     async def _async_wrapper(
         self,
+        label_id: int,
+        key_extractor: Optional[Callable[..., Any]],
         wrapped: Callable[..., Awaitable[Any]],
         *args: Any,
         **kwargs: Any,
     ) -> Any:
+        key = None if key_extractor is None else self._key(key_extractor, args, kwargs)
+        cpu_timer = self.cpu_timer
+        cpu_start_time = cpu_timer() if cpu_timer is not None else None
+        gc_start = _gc_snapshot() if self.gc_pauses else None
+        if self.async_active_time:
+            from pytimers.async_tracking import ActiveTimeAwaitable
+
+            tracked: Optional[ActiveTimeAwaitable[Any]] = ActiveTimeAwaitable(
+                wrapped(*args, **kwargs)
+            )
+        else:
+            tracked = None
         start_time = default_timer()
-        output = await wrapped(*args, **kwargs)
+        try:
+            if tracked is None:
+                output = await wrapped(*args, **kwargs)
+            else:
+                output = await tracked
+        except BaseException as exc:
+            end_time = default_timer()
+            self._finish_call(
+                label_id,
+                wrapped.__qualname__,
+                start_time,
+                end_time,
+                cpu_start_time,
+                key,
+                gc_start,
+                type(exc),
+                None if tracked is None else tracked.active_duration_s,
+            )
+            raise
         end_time = default_timer()
-        self._finish_timing(end_time - start_time, wrapped.__qualname__, True)
+        self._finish_call(
+            label_id,
+            wrapped.__qualname__,
+            start_time,
+            end_time,
+            cpu_start_time,
+            key,
+            gc_start,
+            active_duration=None if tracked is None else tracked.active_duration_s,
+        )
         return output
 
+    def _key(
+        self,
+        key_extractor: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        # a failing key extractor must not break the timed callable
+        try:
+            return key_extractor(*args, **kwargs)
+        except Exception:
+            self.key_errors += 1
+            return None
+
+    def _finish_call(
+        self,
+        label_id: int,
+        label: str,
+        start_time: float,
+        end_time: float,
+        cpu_start_time: Optional[float],
+        key: Any = None,
+        gc_start: Optional[GCSnapshot] = None,
+        exc_type: Optional[Type[BaseException]] = None,
+        active_duration: Optional[float] = None,
+    ) -> None:
+        cpu_timer = self.cpu_timer
+        if cpu_timer is None or cpu_start_time is None:
+            cpu_duration = None
+        else:
+            cpu_duration = cpu_timer() - cpu_start_time
+        parent_clock = _running_clock()
+        measurement = Measurement(
+            end_time - start_time,
+            True,
+            label,
+            cpu_duration,
+            start_time,
+            get_ident(),
+            _current_task_name() if self._task_names else None,
+            None if parent_clock is None else parent_clock.label,
+            label_id,
+        )
+        measurement.exc_type = exc_type
+        measurement.active_duration_s = active_duration
+        measurement.parent_clock = parent_clock
+        measurement.key = key
+        if gc_start is not None:
+            gc_pauses = _gc_since(gc_start)
+            measurement.gc_duration_s, measurement.gc_collections = gc_pauses
+        self._finish_timing(measurement)
+
     def __call__(self, wrapped: Callable[..., Any]) -> Any:
-        if inspect.iscoroutinefunction(wrapped):
-            return decorate(wrapped, self._async_wrapper)
+        return self._decorate(wrapped, None)
+
+    def by(
+        self,
+        key: Callable[..., Any],
+        sample_rate: float = 1.0,
+    ) -> Callable[[Callable[..., Any]], Any]:
+        """Creates a decorator timing the callable the same way as the timer itself
+        but additionally passing a key derived from the call arguments to triggers
+        in :py:attr:`pytimers.measurement.Measurement.key`, e.g. the size of the
+        input using ``@timer.by(lambda rows: len(rows))``. The key is evaluated
+        before the timer starts so its cost is not included in the measurement.
+        Exceptions raised by the key callable are suppressed, the key of such calls
+        is ``None`` and they are counted in ``key_errors`` attribute of the timer.
+        The key callable should not consume the arguments, e.g. iterators.
+
+        :param key: Callable receiving the same arguments as the decorated callable
+            and returning the key of the call.
+        :param sample_rate: Fraction of calls the key is evaluated for. All calls are
+            timed but the key of calls not sampled is ``None``.
+        :return: The decorator.
+        """
+
+        if sample_rate < 1.0:
+            key = _sampled(key, sample_rate)
+        return partial(self._decorate, key_extractor=key)
+
+    def _decorate(
+        self,
+        wrapped: Callable[..., Any],
+        key_extractor: Optional[Callable[..., Any]],
+    ) -> Any:
+        # the decorator library is imported on the first decoration
+        from decorator import decorate  # type: ignore
+
+        label_id = LABEL_REGISTRY.intern(wrapped.__qualname__)
+        if _is_coroutine_function(wrapped):
+            return decorate(
+                wrapped, partial(self._async_wrapper, label_id, key_extractor)
+            )
+        else:
+            return decorate(wrapped, partial(self._wrapper, label_id, key_extractor))
+
+    def compare(
+        self,
+        candidate: Callable[..., Any],
+        fraction: float = 0.01,
+        mode: str = "shadow",
+        equal: Optional[Callable[[Any, Any], bool]] = None,
+        on_mismatch: Optional[
+            Callable[[tuple[Any, ...], dict[str, Any], Any, Any], Any]
+        ] = None,
+    ) -> Callable[[Callable[..., Any]], Any]:
+        """Creates a decorator timing the callable the same way as the timer itself
+        and comparing it with a candidate implementation on a sampled fraction of
+        calls, e.g. ``@timer.compare(candidate=new_implementation, fraction=0.01)``.
+        Sampled calls are timed under labels ``<qualname>[baseline]`` and
+        ``<qualname>[candidate]`` instead of the qualified name. Results of the
+        comparison are available in ``comparison`` attribute of the decorated
+        callable, see :py:class:`pytimers.comparison.Comparison`.
+
+        In the ``"shadow"`` mode both implementations are called with the same
+        arguments in random order, their outputs are compared and the output or the
+        exception of the decorated callable is returned. Exceptions of the
+        candidate are never propagated. Use the shadow mode only for callables
+        without side effects. In the ``"alternate"`` mode either of the
+        implementations is chosen at random and its output is returned, outputs are
+        not compared.
+
+        :param candidate: The candidate implementation accepting the same arguments.
+        :param fraction: Fraction of calls running the candidate.
+        :param mode: Either ``"shadow"`` or ``"alternate"``.
+        :param equal: Callable comparing outputs of the decorated callable and the
+            candidate, defaults to ``==``.
+        :param on_mismatch: Optional callable called with the positional arguments,
+            the keyword arguments, the output or exception of the decorated callable
+            and the output or exception of the candidate whenever they differ. Its
+            exceptions are logged and never propagated.
+        :return: The decorator.
+        :raise ValueError: Unknown mode.
+        """
+
+        from pytimers.comparison import ALTERNATE, SHADOW
+
+        if mode not in (SHADOW, ALTERNATE):
+            raise ValueError(f"Unknown comparison mode {mode!r}.")
+        return partial(
+            self._decorate_comparison,
+            candidate=candidate,
+            fraction=fraction,
+            mode=mode,
+            equal=equal,
+            on_mismatch=on_mismatch,
+        )
+
+    def _decorate_comparison(self, wrapped: Callable[..., Any], **kwargs: Any) -> Any:
+        # the decorator library is imported on the first decoration
+        from decorator import decorate
+
+        if _is_coroutine_function(wrapped):
+            raise TypeError("Coroutine functions can not be compared.")
+        from pytimers.comparison import Comparison
+
+        comparison = Comparison(wrapped.__qualname__, **kwargs)
+        decorated = decorate(
+            wrapped,
+            partial(
+                self._comparison_wrapper,
+                LABEL_REGISTRY.intern(wrapped.__qualname__),
+                LABEL_REGISTRY.intern(comparison.baseline_label),
+                LABEL_REGISTRY.intern(comparison.candidate_label),
+                comparison,
+            ),
+        )
+        decorated.comparison = comparison
+        return decorated
+
+    def _comparison_wrapper(
+        self,
+        label_id: int,
+        baseline_label_id: int,
+        candidate_label_id: int,
+        comparison: Comparison,
+        wrapped: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        if not comparison.sampled():
+            return self._wrapper(label_id, None, wrapped, *args, **kwargs)
+        from random import random
+
+        from pytimers.comparison import ALTERNATE
+
+        run_baseline = partial(
+            self._timed_outcome,
+            baseline_label_id,
+            comparison.baseline_label,
+            wrapped,
+            args,
+            kwargs,
+        )
+        run_candidate = partial(
+            self._timed_outcome,
+            candidate_label_id,
+            comparison.candidate_label,
+            comparison.candidate,
+            args,
+            kwargs,
+        )
+        if comparison.mode == ALTERNATE:
+            use_candidate = random() < 0.5
+            output, exc, duration = (
+                run_candidate() if use_candidate else run_baseline()
+            )
+            comparison.add_single(duration, use_candidate)
+        else:
+            # random order cancels out effects of the first call, e.g. warmed caches
+            if random() < 0.5:
+                baseline = run_baseline()
+                candidate = run_candidate()
+            else:
+                candidate = run_candidate()
+                baseline = run_baseline()
+            comparison.add_pair(baseline, candidate, args, kwargs)
+            output, exc, _ = baseline
+        if exc is not None:
+            raise exc
+        return output
+
+    def _timed_outcome(
+        self,
+        label_id: int,
+        label: str,
+        function: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Outcome:
+        cpu_timer = self.cpu_timer
+        cpu_start_time = cpu_timer() if cpu_timer is not None else None
+        gc_start = _gc_snapshot() if self.gc_pauses else None
+        start_time = default_timer()
+        try:
+            output = function(*args, **kwargs)
+        except Exception as exc:
+            end_time = default_timer()
+            self._finish_call(
+                label_id,
+                label,
+                start_time,
+                end_time,
+                cpu_start_time,
+                gc_start=gc_start,
+                exc_type=type(exc),
+            )
+            return None, exc, end_time - start_time
+        end_time = default_timer()
+        self._finish_call(
+            label_id, label, start_time, end_time, cpu_start_time, gc_start=gc_start
+        )
+        return output, None, end_time - start_time
+
+    def _fast_wrap(self, wrapped: Callable[..., Any]) -> Callable[..., Any]:
+        # Closure based wrapper used for instrumentation. Compared to `__call__` the
+        # wrapper skips signature preservation of the decorator library and exposes
+        # the original signature only through `__wrapped__`.
+        label_id = LABEL_REGISTRY.intern(wrapped.__qualname__)
+        if _is_coroutine_function(wrapped):
+            async_timed = self._async_wrapper
+
+            @wraps(wrapped)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                return await async_timed(label_id, None, wrapped, *args, **kwargs)
+
+            return async_wrapper
         else:
-            return decorate(wrapped, self._wrapper)
+            timed = self._wrapper
+
+            @wraps(wrapped)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                return timed(label_id, None, wrapped, *args, **kwargs)
 
-    def _finish_timing(
+            return wrapper
+
+    def instrument_class(
         self,
-        duration: float,
-        name: Optional[str],
-        decorator: bool,
+        cls: type,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> list[str]:
+        """Times all selected methods defined directly in the class by replacing them
+        in place. Both synchronous and asynchronous methods, static methods and class
+        methods are supported. Generators and inherited methods are left untouched.
+        Use :py:meth:`pytimers.Timer.uninstrument` to restore the original methods.
+
+        :param cls: The class to be instrumented.
+        :param include: Glob patterns (as understood by :py:mod:`fnmatch`) of method
+            names to be timed. If set to ``None`` all methods not starting with an
+            underscore are timed.
+        :param exclude: Glob patterns of method names not to be timed.
+        :return: Names of the instrumented methods.
+        """
+
+        from pytimers.instrumentation import instrument_namespace
+
+        return instrument_namespace(self, cls, self._fast_wrap, include, exclude)
+
+    def instrument_module(
+        self,
+        module: ModuleType,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> list[str]:
+        """Times all selected functions defined in the module by replacing them in
+        place. Functions imported from other modules are left untouched. Note that
+        references to the functions obtained before the instrumentation (e.g. using
+        ``from module import function``) keep pointing to the original functions.
+        Use :py:meth:`pytimers.Timer.uninstrument` to restore the original functions.
+
+        :param module: The module to be instrumented.
+        :param include: Glob patterns (as understood by :py:mod:`fnmatch`) of
+            function names to be timed. If set to ``None`` all functions not
+            starting with an underscore are timed.
+        :param exclude: Glob patterns of function names not to be timed.
+        :return: Names of the instrumented functions.
+        """
+
+        from pytimers.instrumentation import instrument_namespace
+
+        return instrument_namespace(self, module, self._fast_wrap, include, exclude)
+
+    def uninstrument(self, target: type | ModuleType) -> list[str]:
+        """Restores all functions or methods of a class or module instrumented by
+        this timer. Restored functions carry no timing overhead.
+
+        :param target: The class or module to be restored.
+        :return: Names of the restored functions or methods.
+        """
+
+        from pytimers.instrumentation import uninstrument_namespace
+
+        return uninstrument_namespace(self, target)
+
+    def propagate(self, function: Callable[..., Any]) -> Callable[..., Any]:
+        """Binds the callable to a copy of the current context. Code blocks running
+        at the time of the call become parents of code blocks timed by the callable
+        even if it is executed later in another thread, e.g. using
+        :py:meth:`asyncio.loop.run_in_executor`.
+
+        :param function: The callable to be bound.
+        :return: Callable running the bound callable in the copied context.
+        """
+
+        context = copy_context()
+
+        @wraps(function)
+        def propagated(*args: Any, **kwargs: Any) -> Any:
+            # a context can not be entered by several threads at once
+            return context.copy().run(function, *args, **kwargs)
+
+        return propagated
+
+    def record(self, measurement: Measurement) -> None:
+        """Passes a measurement not measured by this timer, e.g. measured in another
+        process, to all triggers of the timer.
+
+        :param measurement: The measurement to be passed to the triggers.
+        """
+
+        self._finish_timing(measurement)
+
+    def flush(self) -> None:
+        """Hands over measurements buffered by all threads to batch triggers. Call
+        this method before reading results of batch triggers or before the
+        application exits.
+        """
+
+        with self._buffers_lock:
+            buffers = self._buffers
+            self._buffers = [buffer for buffer in buffers if buffer.thread.is_alive()]
+        for buffer in buffers:
+            self._flush_buffer(buffer)
+
+    def _flush_buffer(self, buffer: MeasurementBuffer) -> None:
+        durations, label_ids, flags = buffer.drain()
+        if not durations:
+            return
+        governor = self.governor
+        if governor is not None:
+            costs = []
+            for trigger in self.triggers:
+                if isinstance(trigger, BatchTrigger) and governor.enabled(trigger):
+                    start_time = default_timer()
+                    trigger.consume_id_batch(durations, label_ids, flags)
+                    costs.append((trigger, default_timer() - start_time))
+            governor.account(None, costs)
+            return
+        for trigger in self.triggers:
+            if isinstance(trigger, BatchTrigger):
+                trigger.consume_id_batch(durations, label_ids, flags)
+
+    def _buffer_measurement(self, measurement: Measurement) -> None:
+        buffer: Optional[MeasurementBuffer] = getattr(
+            self._local_buffer, "buffer", None
+        )
+        if buffer is None:
+            from pytimers.batching import MeasurementBuffer
+
+            buffer = self._local_buffer.buffer = MeasurementBuffer()
+            with self._buffers_lock:
+                self._buffers.append(buffer)
+        label_id = measurement.label_id
+        size = buffer.append(
+            measurement.duration_s,
+            LABEL_REGISTRY.intern(measurement.label) if label_id is None else label_id,
+            measurement_flags(measurement),
+        )
+        if size >= self.batch_size or (
+            self.flush_interval is not None
+            and default_timer() - buffer.created >= self.flush_interval
+        ):
+            self._flush_buffer(buffer)
+
+    def _finish_timing(self, measurement: Measurement) -> None:
+        if COLLECTORS:
+            # the parent process records collected measurements in its own timer,
+            # local triggers would see them twice
+            for collector in COLLECTORS:
+                collector.append(measurement)
+            return
+        if self.governor is not None:
+            self._finish_governed_timing(measurement, self.governor)
+            return
+        buffered = False
+        for trigger in self.triggers:
+            if _is_batch_trigger(trigger):
+                buffered = True
+            else:
+                notify_trigger(trigger, measurement)
+        if buffered:
+            self._buffer_measurement(measurement)
+
+    def _finish_governed_timing(
+        self, measurement: Measurement, governor: OverheadGovernor
     ) -> None:
+        if not governor.sampled():
+            governor.account(measurement.duration_s)
+            return
+        costs = []
+        buffered = False
         for trigger in self.triggers:
-            trigger(
-                duration,
-                decorator,
-                name,
-            )
+            if not governor.enabled(trigger):
+                continue
+            if _is_batch_trigger(trigger):
+                # batch triggers are charged once the buffer is flushed
+                buffered = True
+                continue
+            start_time = default_timer()
+            notify_trigger(trigger, measurement)
+            costs.append((trigger, default_timer() - start_time))
+        governor.account(measurement.duration_s, costs)
+        if buffered:
+            self._buffer_measurement(measurement)
@@ -1,8 +1,50 @@
+from importlib import import_module
+from typing import Any, List, TYPE_CHECKING
+
 from pytimers.triggers.base_trigger import BaseTrigger
-from pytimers.triggers.logger_trigger import LoggerTrigger
+from pytimers.triggers.batch_trigger import BatchTrigger
+
+if TYPE_CHECKING:
+    from pytimers.triggers.aggregating_trigger import AggregatingTrigger
+    from pytimers.triggers.anomaly_trigger import AnomalyTrigger
+    from pytimers.triggers.chrome_trace_trigger import ChromeTraceTrigger
+    from pytimers.triggers.logger_trigger import LoggerTrigger
+    from pytimers.triggers.scaling_trigger import ScalingTrigger
+    from pytimers.triggers.span_export_trigger import SpanExportTrigger
+    from pytimers.triggers.sqlite_trigger import SQLiteTrigger
+
+# triggers are imported on first access to keep `import pytimers` fast
+_LAZY_ATTRIBUTES = {
+    "AggregatingTrigger": "pytimers.triggers.aggregating_trigger",
+    "AnomalyTrigger": "pytimers.triggers.anomaly_trigger",
+    "ChromeTraceTrigger": "pytimers.triggers.chrome_trace_trigger",
+    "LoggerTrigger": "pytimers.triggers.logger_trigger",
+    "ScalingTrigger": "pytimers.triggers.scaling_trigger",
+    "SpanExportTrigger": "pytimers.triggers.span_export_trigger",
+    "SQLiteTrigger": "pytimers.triggers.sqlite_trigger",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
 
 __all__ = [
+    "AggregatingTrigger",
+    "AnomalyTrigger",
     "BaseTrigger",
+    "BatchTrigger",
+    "ChromeTraceTrigger",
     "LoggerTrigger",
+    "ScalingTrigger",
+    "SpanExportTrigger",
+    "SQLiteTrigger",
 ]
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from threading import Lock, Thread, current_thread, local
+from typing import List, Optional, Sequence
+
+from pytimers.aggregation import LabelStatistics
+from pytimers.labels import LABEL_REGISTRY
+from pytimers.triggers.batch_trigger import BatchTrigger, ERROR_FLAG
+
+
+# statistics of label id `i` are stored at index `2 * i` for successful and at index
+# `2 * i + 1` for failed measurements
+IndexedStatistics = List[Optional[LabelStatistics]]
+
+
+def _merge_into(target: IndexedStatistics, source: IndexedStatistics) -> None:
+    missing = len(source) - len(target)
+    if missing > 0:
+        target.extend([None] * missing)
+    for index, statistics in enumerate(source):
+        if statistics is None:
+            continue
+        target_statistics = target[index]
+        if target_statistics is None:
+            target[index] = statistics.copy()
+        else:
+            target_statistics.merge(statistics)
+
+
+class _Shard:
+    """Statistics updated by a single thread. The lock of the shard is contended
+    only while the shard is read.
+    """
+
+    __slots__ = ("statistics", "thread", "lock")
+
+    def __init__(self, thread: Thread) -> None:
+        self.statistics: IndexedStatistics = []
+        self.thread = thread
+        self.lock = Lock()
+
+
+class AggregatingTrigger(BatchTrigger):
+    """Provided batch trigger collecting per label summary statistics of the
+    measured durations. Successful and failed measurements are aggregated
+    separately. Statistics are updated once per label, outcome and batch and are
+    stored in lists indexed by label ids. Each thread updates its own shard of the
+    statistics so threads never wait for each other. Shards are merged on read.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._local_shard = local()
+        self._shards: list[_Shard] = []
+        # merged statistics of shards owned by finished threads
+        self._retired: IndexedStatistics = []
+        self._shards_lock = Lock()
+
+    def _shard(self) -> _Shard:
+        shard: Optional[_Shard] = getattr(self._local_shard, "shard", None)
+        if shard is None:
+            shard = self._local_shard.shard = _Shard(current_thread())
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def consume_batch(
+        self,
+        durations: Sequence[float],
+        labels: Sequence[Optional[str]],
+        flags: Sequence[int],
+    ) -> None:
+        self.consume_id_batch(
+            durations,
+            [LABEL_REGISTRY.intern(label) for label in labels],
+            flags,
+        )
+
+    def consume_id_batch(
+        self,
+        durations: Sequence[float],
+        label_ids: Sequence[int],
+        flags: Sequence[int],
+    ) -> None:
+        if not durations:
+            return
+        grouped: dict[int, list[float]] = {}
+        for label_id, duration, measurement_flags in zip(label_ids, durations, flags):
+            index = label_id << 1 | (1 if measurement_flags & ERROR_FLAG else 0)
+            group = grouped.get(index)
+            if group is None:
+                grouped[index] = [duration]
+            else:
+                group.append(duration)
+
+        shard = self._shard()
+        with shard.lock:
+            all_statistics = shard.statistics
+            missing = max(grouped) + 1 - len(all_statistics)
+            if missing > 0:
+                all_statistics.extend([None] * missing)
+            for index, group in grouped.items():
+                statistics = all_statistics[index]
+                if statistics is None:
+                    statistics = all_statistics[index] = LabelStatistics()
+                statistics.add_many(group)
+
+    def _merged(self) -> IndexedStatistics:
+        merged: IndexedStatistics = []
+        with self._shards_lock:
+            alive_shards = []
+            for shard in self._shards:
+                with shard.lock:
+                    if shard.thread.is_alive():
+                        alive_shards.append(shard)
+                        _merge_into(merged, shard.statistics)
+                    else:
+                        _merge_into(self._retired, shard.statistics)
+            self._shards = alive_shards
+            _merge_into(merged, self._retired)
+        return merged
+
+    def statistics(
+        self, failed: Optional[bool] = None
+    ) -> dict[Optional[str], LabelStatistics]:
+        """Exposes collected statistics merged from all threads. Measurements still
+        buffered in :py:class:`pytimers.Timer` are not included until the timer is
+        flushed.
+
+        :param failed: If ``None`` statistics of all measurements are returned.
+            If ``False`` only statistics of successful measurements are returned and
+            if ``True`` only statistics of measurements of code raising an exception.
+        :return: Copy of the statistics for each label.
+        """
+
+        result: dict[Optional[str], LabelStatistics] = {}
+        for index, statistics in enumerate(self._merged()):
+            if statistics is None or (failed is not None and failed != bool(index & 1)):
+                continue
+            label = LABEL_REGISTRY.label(index >> 1)
+            if label in result:
+                result[label].merge(statistics)
+            else:
+                result[label] = statistics
+        return result
+
+    def reset(self) -> None:
+        """Discards all collected statistics."""
+
+        with self._shards_lock:
+            for shard in self._shards:
+                with shard.lock:
+                    shard.statistics = []
+            self._retired = []
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from collections import deque
+from threading import Lock
+from typing import Any, Callable, Iterable, Optional
+
+from pytimers.anomaly import ChangeDetector
+from pytimers.measurement import Measurement
+from pytimers.triggers.base_trigger import BaseTrigger, notify_trigger
+
+
+class ChangePoint:
+    """Shift of durations of a label detected by
+    :py:class:`pytimers.triggers.anomaly_trigger.AnomalyTrigger`.
+
+    :param label: Label of the shifted durations.
+    :param increased: ``True`` if durations increased, ``False`` if they decreased.
+    :param baseline_s: Typical duration in seconds before the shift.
+    :param measurement: The measurement completing the detection.
+    """
+
+    __slots__ = ("label", "increased", "baseline_s", "measurement")
+
+    def __init__(
+        self,
+        label: Optional[str],
+        increased: bool,
+        baseline_s: float,
+        measurement: Measurement,
+    ) -> None:
+        self.label = label
+        self.increased = increased
+        self.baseline_s = baseline_s
+        self.measurement = measurement
+
+    def __repr__(self) -> str:
+        return (
+            f"ChangePoint(label={self.label!r}, increased={self.increased}, "
+            f"baseline_s={self.baseline_s}, "
+            f"duration_s={self.measurement.duration_s})"
+        )
+
+
+class AnomalyTrigger(BaseTrigger):
+    """Provided trigger detecting shifts of durations of each label, e.g. after a
+    deploy or when a dependency degrades, using
+    :py:class:`pytimers.anomaly.ChangeDetector`. Downstream triggers are called only
+    with the measurement completing the detection of a shift, steady measurements
+    cost a few float operations. Each label is learned separately, shifts are not
+    reported during the first ``warmup`` measurements of a label and after each
+    detected shift.
+
+    :param triggers: An iterable of triggers called once a shift is detected.
+        Instances of :py:class:`pytimers.BaseTrigger` subclasses receive the
+        measurement via :py:meth:`pytimers.BaseTrigger.on_measurement`. Any other
+        callable is called with positional arguments
+        ``duration_s: float, decorator: bool, label: str``.
+    :param alpha: Weight of the newest duration in the moving averages.
+    :param threshold: Cumulative sum of standardized deviations reporting a shift.
+        Higher values report fewer false shifts but detect shifts later.
+    :param drift: Standardized deviation tolerated without reporting a shift.
+    :param warmup: Number of measurements used to learn the baseline of a label.
+    :param min_std: Lowest relative spread of durations used for the
+        standardization.
+    :param detect_decreases: If set to ``True`` decreases of durations are reported
+        as well.
+    :param max_change_points: Number of most recent change points kept in
+        ``change_points``.
+    """
+
+    def __init__(
+        self,
+        triggers: Iterable[BaseTrigger | Callable[[float, bool, Optional[str]], Any]],
+        alpha: float = 0.01,
+        threshold: float = 8.0,
+        drift: float = 1.0,
+        warmup: int = 100,
+        min_std: float = 0.05,
+        detect_decreases: bool = False,
+        max_change_points: int = 100,
+    ) -> None:
+        super().__init__()
+        self.triggers = list(triggers)
+        self.needs_task_name = any(
+            getattr(trigger, "needs_task_name", False) for trigger in self.triggers
+        )
+        self.alpha = alpha
+        self.threshold = threshold
+        self.drift = drift
+        self.warmup = warmup
+        self.min_std = min_std
+        self.detect_decreases = detect_decreases
+        self.change_points: deque[ChangePoint] = deque(maxlen=max_change_points)
+        self._detectors: dict[Optional[str], ChangeDetector] = {}
+        self._lock = Lock()
+
+    def detector(self, label: Optional[str]) -> ChangeDetector:
+        """Provides the detector of a label, created on the first access.
+
+        :param label: The label.
+        :return: The detector of the label.
+        """
+
+        detector = self._detectors.get(label)
+        if detector is None:
+            with self._lock:
+                detector = self._detectors.get(label)
+                if detector is None:
+                    detector = self._detectors[label] = ChangeDetector(
+                        self.alpha,
+                        self.threshold,
+                        self.drift,
+                        self.warmup,
+                        self.min_std,
+                    )
+        return detector
+
+    def on_measurement(self, measurement: Measurement) -> None:
+        # detectors are updated without locking, concurrent updates of a label may
+        # lose an update or interleave with a reset after a detected shift, which
+        # only slightly skews the learned baseline and never raises
+        detector = self.detector(measurement.label)
+        direction = detector.update(measurement.duration_s)
+        if direction == 0 or (direction < 0 and not self.detect_decreases):
+            return
+        change_point = ChangePoint(
+            measurement.label,
+            direction > 0,
+            detector.previous_baseline_s,
+            measurement,
+        )
+        with self._lock:
+            self.change_points.append(change_point)
+        for trigger in self.triggers:
+            notify_trigger(trigger, measurement)
+
+    def reset(self) -> None:
+        """Forgets baselines of all labels and the change points."""
+
+        with self._lock:
+            self._detectors = {}
+            self.change_points.clear()
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from threading import Condition, Lock, Thread
+from typing import Callable, Generic, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+
+class BackgroundQueue(Generic[T]):
+    """Bounded queue of items processed in batches by a background daemon thread,
+    shared by triggers which must not block the timed code. If the queue is full
+    new items are dropped and counted in ``dropped``.
+
+    :param process: Callable processing a batch of items, called by the background
+        thread or by :py:meth:`flush`. It should not raise.
+    :param batch_size: Number of queued items triggering processing.
+    :param interval: Maximal number of seconds between two processed batches.
+    :param max_size: Maximal number of queued items.
+    :param name: Name of the background thread.
+    :param on_idle: Optional callable called by the background thread after each
+        processed batch.
+    """
+
+    def __init__(
+        self,
+        process: Callable[[list[T]], None],
+        batch_size: int,
+        interval: float,
+        max_size: int,
+        name: str,
+        on_idle: Optional[Callable[[], None]] = None,
+    ):
+        self.process = process
+        self.batch_size = batch_size
+        self.interval = interval
+        self.max_size = max_size
+        self.on_idle = on_idle
+        self.dropped = 0
+        self._items: list[T] = []
+        self._condition = Condition()
+        # keeps batches processed by the thread and by `flush` in order
+        self._flush_lock = Lock()
+        self._stopping = False
+        self._thread = Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def put(self, item: T) -> None:
+        """Queues the item or drops it if the queue is full or stopped.
+
+        :param item: The item.
+        """
+
+        with self._condition:
+            if self._stopping or len(self._items) >= self.max_size:
+                self.dropped += 1
+                return
+            self._items.append(item)
+            if len(self._items) >= self.batch_size:
+                self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._stopping or len(self._items) >= self.batch_size,
+                    timeout=self.interval,
+                )
+                if self._stopping:
+                    return
+            self.flush()
+            if self.on_idle is not None:
+                self.on_idle()
+
+    def flush(self) -> None:
+        """Processes all queued items in the calling thread."""
+
+        with self._flush_lock:
+            with self._condition:
+                items, self._items = self._items, []
+            if items:
+                self.process(items)
+
+    def shutdown(self) -> None:
+        """Stops the background thread and processes remaining queued items. Items
+        queued after the shutdown are dropped.
+        """
+
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        self._thread.join()
+        self.flush()
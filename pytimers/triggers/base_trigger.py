@@ -1,26 +1,49 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from typing import Optional
+from abc import ABC
+from typing import Any, Callable, Optional, cast
+
+from pytimers.measurement import Measurement
 
 
 class BaseTrigger(ABC):
     """This class provides timer trigger abstraction. Custom triggers can be
     implemented using simple functions but subclassing this abstract class is the
-    preferred way. Any custom implementation has to override
-    :py:meth:`pytimers.BaseTrigger.__call__` method where the trigger logic
-    should be provided.
+    preferred way. Any custom implementation has to override either
+    :py:meth:`pytimers.BaseTrigger.on_measurement` method (preferred) or
+    :py:meth:`pytimers.BaseTrigger.__call__` method where the trigger logic should be
+    provided. The method not overridden adapts between the two protocols.
+    Subclasses of provided triggers overriding only
+    :py:meth:`pytimers.BaseTrigger.__call__` are called by timers through it and
+    can still reach the provided implementation using ``super().__call__``.
+    Triggers reading :py:attr:`pytimers.measurement.Measurement.task_name` have to
+    set ``needs_task_name`` to ``True``, timers look up names of asyncio tasks only
+    if any of their triggers does.
     """
 
-    @abstractmethod
+    needs_task_name = False
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> BaseTrigger:
+        if (
+            cls.__call__ is BaseTrigger.__call__
+            and cls.on_measurement is BaseTrigger.on_measurement
+        ):
+            raise TypeError(
+                f"Can't instantiate trigger {cls.__name__} without overriding either "
+                f"on_measurement or __call__ method."
+            )
+        return super().__new__(cls)
+
     def __call__(
         self,
         duration_s: float,
         decorator: bool,
         label: Optional[str] = None,
     ) -> None:
-        """This is a trigger action entrypoint. This method is called in
-        :py:class:`pytimers.Timer` once the timer stops.
+        """Positional trigger entrypoint kept for backwards compatibility. The default
+        implementation wraps the arguments into
+        :py:class:`pytimers.measurement.Measurement` and passes it to
+        :py:meth:`pytimers.BaseTrigger.on_measurement`.
 
         :param duration_s: The measured duration in seconds.
         :param decorator: True if the timer was used as a decorator for callable.
@@ -29,7 +52,21 @@ class BaseTrigger(ABC):
             entering the context manager. For decorator usage this value is set to the
             callable name.
         """
-        pass
+
+        self.on_measurement(Measurement(duration_s, decorator, label))
+
+    def on_measurement(self, measurement: Measurement) -> None:
+        """This is a trigger action entrypoint. This method is called in
+        :py:class:`pytimers.Timer` once the timer stops. The default implementation
+        passes the basic measurement attributes to
+        :py:meth:`pytimers.BaseTrigger.__call__` so triggers implementing only the
+        positional protocol keep working.
+
+        :param measurement: The finished measurement. The same instance is passed to
+            all triggers of the timer and should not be modified.
+        """
+
+        self(measurement.duration_s, measurement.decorator, measurement.label)
 
     @staticmethod
     def humanized_duration(duration_s: float, precision: int = 0) -> str:
@@ -54,3 +91,45 @@ class BaseTrigger(ABC):
             return f"{seconds:.0f}s {ms:.{precision}f}ms"
         else:
             return f"{ms:.{precision}f}ms"
+
+
+# trigger types mapped to True if their instances are called positionally, i.e.
+# plain callables and triggers overriding __call__ in a more derived class than
+# on_measurement, the cache avoids slow isinstance checks of the abstract class
+_POSITIONAL_DISPATCH: dict[type, bool] = {}
+
+
+def _called_positionally(cls: type) -> bool:
+    if not issubclass(cls, BaseTrigger):
+        return True
+    owner = next(
+        klass
+        for klass in cls.__mro__
+        if "__call__" in vars(klass) or "on_measurement" in vars(klass)
+    )
+    return "on_measurement" not in vars(owner)
+
+
+def notify_trigger(
+    trigger: BaseTrigger | Callable[[float, bool, Optional[str]], Any],
+    measurement: Measurement,
+) -> None:
+    """Passes a measurement to a trigger. Instances of
+    :py:class:`pytimers.BaseTrigger` subclasses receive the measurement via
+    :py:meth:`pytimers.BaseTrigger.on_measurement` unless they override
+    :py:meth:`pytimers.BaseTrigger.__call__` in a more derived class, any other
+    callable is called with positional arguments ``duration_s: float,
+    decorator: bool, label: str``.
+
+    :param trigger: The trigger to be called.
+    :param measurement: The finished measurement.
+    """
+
+    cls = type(trigger)
+    positional = _POSITIONAL_DISPATCH.get(cls)
+    if positional is None:
+        positional = _POSITIONAL_DISPATCH[cls] = _called_positionally(cls)
+    if positional:
+        trigger(measurement.duration_s, measurement.decorator, measurement.label)
+    else:
+        cast(BaseTrigger, trigger).on_measurement(measurement)
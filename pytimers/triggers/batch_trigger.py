@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from abc import abstractmethod
+from array import array
+from typing import Optional, Sequence
+
+from pytimers.labels import LABEL_REGISTRY
+from pytimers.measurement import Measurement
+from pytimers.triggers.base_trigger import BaseTrigger
+
+DECORATOR_FLAG = 1
+ERROR_FLAG = 2
+GC_FLAG = 4
+
+
+def measurement_flags(measurement: Measurement) -> int:
+    """Encodes boolean attributes of a measurement into integer bit flags used by
+    :py:meth:`pytimers.triggers.batch_trigger.BatchTrigger.consume_batch`.
+
+    :param measurement: The measurement to be encoded.
+    :return: Bit flags of the measurement.
+    """
+
+    flags = DECORATOR_FLAG if measurement.decorator else 0
+    if measurement.exc_type is not None:
+        flags |= ERROR_FLAG
+    if measurement.gc_duration_s:
+        flags |= GC_FLAG
+    return flags
+
+
+class BatchTrigger(BaseTrigger):
+    """Trigger abstraction for consuming measurements in batches. Instead of calling
+    the trigger after each measurement :py:class:`pytimers.Timer` buffers
+    measurements per thread and hands them over to
+    :py:meth:`pytimers.triggers.batch_trigger.BatchTrigger.consume_batch` once the
+    buffer is flushed. Any custom implementation has to override the
+    ``consume_batch`` method. Triggers aggregating per label may additionally
+    override :py:meth:`pytimers.triggers.batch_trigger.BatchTrigger.consume_id_batch`
+    to receive label ids interned in :py:data:`pytimers.labels.LABEL_REGISTRY`
+    instead of label strings.
+    """
+
+    @abstractmethod
+    def consume_batch(
+        self,
+        durations: Sequence[float],
+        labels: Sequence[Optional[str]],
+        flags: Sequence[int],
+    ) -> None:
+        """This is a batch trigger action entrypoint. All three sequences have the
+        same length and items on the same index describe a single measurement.
+
+        :param durations: The measured durations in seconds.
+        :param labels: The labels of the measurements.
+        :param flags: Bit flags of the measurements, see
+            :py:data:`pytimers.triggers.batch_trigger.DECORATOR_FLAG` and
+            :py:data:`pytimers.triggers.batch_trigger.ERROR_FLAG`.
+        """
+        pass
+
+    def consume_id_batch(
+        self,
+        durations: Sequence[float],
+        label_ids: Sequence[int],
+        flags: Sequence[int],
+    ) -> None:
+        """Batch trigger entrypoint called by :py:class:`pytimers.Timer`. The default
+        implementation looks up labels of the label ids and passes them to
+        :py:meth:`pytimers.triggers.batch_trigger.BatchTrigger.consume_batch`.
+
+        :param durations: The measured durations in seconds.
+        :param label_ids: Ids of the labels interned in
+            :py:data:`pytimers.labels.LABEL_REGISTRY`.
+        :param flags: Bit flags of the measurements, see
+            :py:data:`pytimers.triggers.batch_trigger.DECORATOR_FLAG` and
+            :py:data:`pytimers.triggers.batch_trigger.ERROR_FLAG`.
+        """
+
+        self.consume_batch(durations, LABEL_REGISTRY.labels(label_ids), flags)
+
+    def on_measurement(self, measurement: Measurement) -> None:
+        """Consumes a single measurement as a batch of size one. This method is used
+        only if the trigger is called outside of :py:class:`pytimers.Timer`.
+
+        :param measurement: The finished measurement.
+        """
+
+        self.consume_batch(
+            array("d", [measurement.duration_s]),
+            [measurement.label],
+            array("B", [measurement_flags(measurement)]),
+        )
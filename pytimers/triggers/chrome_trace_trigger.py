@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import threading
+from array import array
+from threading import Lock
+from timeit import default_timer
+from typing import Any, Optional
+
+from pytimers.measurement import Measurement
+from pytimers.triggers.base_trigger import BaseTrigger
+from pytimers.triggers.batch_trigger import (
+    DECORATOR_FLAG,
+    ERROR_FLAG,
+    measurement_flags,
+)
+
+
+class ChromeTraceTrigger(BaseTrigger):
+    """Provided trigger recording measurements into a ring buffer of bounded size
+    and dumping them as a JSON file in the Chrome trace event format, which can be
+    opened in Perfetto or ``chrome://tracing``. Events are stored in arrays
+    preallocated for ``capacity`` events, once the buffer is full the oldest events
+    are overwritten. Code blocks and decorated callables running in asyncio tasks
+    are shown in a separate track of each task.
+
+    :param capacity: Maximal number of recorded events.
+    :param dump_at_exit: Optional path of a file the events are dumped to once the
+        interpreter exits.
+    """
+
+    needs_task_name = True
+
+    def __init__(self, capacity: int = 65536, dump_at_exit: Optional[str] = None):
+        super().__init__()
+        self.capacity = capacity
+        self._start_times = array("d", bytes(8 * capacity))
+        self._durations = array("d", bytes(8 * capacity))
+        self._thread_ids = array("Q", bytes(8 * capacity))
+        self._flags = array("B", bytes(capacity))
+        # labels are kept as strings, interning every label of a code block would
+        # grow the process wide label registry forever
+        self._labels: list[Optional[str]] = [None] * capacity
+        self._task_names: list[Optional[str]] = [None] * capacity
+        self._recorded = 0
+        self._lock = Lock()
+        if dump_at_exit is not None:
+            atexit.register(self.dump, dump_at_exit)
+
+    @property
+    def recorded_events(self) -> int:
+        """Number of events recorded since the last clear including overwritten
+        events.
+        """
+
+        return self._recorded
+
+    def on_measurement(self, measurement: Measurement) -> None:
+        start_time = measurement.start_time
+        if start_time is None:
+            start_time = default_timer() - measurement.duration_s
+        flags = measurement_flags(measurement)
+        with self._lock:
+            index = self._recorded % self.capacity
+            self._recorded += 1
+            self._start_times[index] = start_time
+            self._durations[index] = measurement.duration_s
+            self._thread_ids[index] = measurement.thread_id or 0
+            self._labels[index] = measurement.label
+            self._flags[index] = flags
+            self._task_names[index] = measurement.task_name
+
+    def events(self) -> list[dict[str, Any]]:
+        """Encodes recorded events as Chrome trace events, oldest first. Events are
+        complete events (``"X"``) with timestamps and durations in microseconds.
+        Metadata events name the tracks of threads and asyncio tasks.
+
+        :return: The trace events.
+        """
+
+        with self._lock:
+            recorded = self._recorded
+            size = min(recorded, self.capacity)
+            first = recorded - size
+            indices = [(first + offset) % self.capacity for offset in range(size)]
+            records = [
+                (
+                    self._start_times[index],
+                    self._durations[index],
+                    self._thread_ids[index],
+                    self._labels[index],
+                    self._flags[index],
+                    self._task_names[index],
+                )
+                for index in indices
+            ]
+        pid = os.getpid()
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        # asyncio tasks get their own tracks as their code blocks interleave
+        tracks: dict[tuple[int, Optional[str]], int] = {}
+        events: list[dict[str, Any]] = []
+        for start_time, duration, thread_id, label, flags, task_name in records:
+            track = tracks.get((thread_id, task_name))
+            if track is None:
+                track = thread_id if task_name is None else len(tracks) + 1
+                tracks[(thread_id, task_name)] = track
+                thread_name = thread_names.get(thread_id, str(thread_id))
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": pid,
+                        "tid": track,
+                        "args": {
+                            "name": thread_name
+                            if task_name is None
+                            else f"{task_name} ({thread_name})"
+                        },
+                    }
+                )
+            events.append(
+                {
+                    "name": "code block" if label is None else label,
+                    "cat": "decorator" if flags & DECORATOR_FLAG else "code block",
+                    "ph": "X",
+                    "ts": start_time * 1e6,
+                    "dur": duration * 1e6,
+                    "pid": pid,
+                    "tid": track,
+                    "args": {"failed": bool(flags & ERROR_FLAG)},
+                }
+            )
+        return events
+
+    def dump(self, path: str) -> int:
+        """Writes recorded events into a Chrome trace event JSON file.
+
+        :param path: Path of the file.
+        :return: Number of written events excluding metadata events.
+        """
+
+        events = self.events()
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(
+                {"traceEvents": events, "displayTimeUnit": "ms"},
+                file,
+                separators=(",", ":"),
+            )
+        return sum(1 for event in events if event["ph"] == "X")
+
+    def clear(self) -> None:
+        """Discards all recorded events."""
+
+        with self._lock:
+            self._recorded = 0
+            self._labels = [None] * self.capacity
+            self._task_names = [None] * self.capacity
@@ -2,18 +2,20 @@ from __future__ import annotations
 
 from typing import Optional
 
+from pytimers.measurement import Measurement
 from pytimers.triggers.base_trigger import BaseTrigger
 
 
 class DummyTrigger(BaseTrigger):
+    needs_task_name = True
+
     def __init__(self) -> None:
         super().__init__()
         self.calls: list[tuple[float, bool, Optional[str]]] = []
+        self.measurements: list[Measurement] = []
 
-    def __call__(
-        self,
-        duration_s: float,
-        decorator: bool,
-        label: Optional[str] = None,
-    ) -> None:
-        self.calls.append((duration_s, decorator, label))
+    def on_measurement(self, measurement: Measurement) -> None:
+        self.measurements.append(measurement)
+        self.calls.append(
+            (measurement.duration_s, measurement.decorator, measurement.label)
+        )
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from threading import Lock
+from typing import Any, Callable, Optional
+
+from pytimers.measurement import Measurement
+from pytimers.triggers.base_trigger import BaseTrigger, notify_trigger
+
+
+class LazyTrigger(BaseTrigger):
+    """Trigger constructing the wrapped trigger only once the first measurement is
+    received. This defers the import and setup cost of the wrapped trigger, e.g.
+    configuration of :py:mod:`logging`, until the timer is actually used. Batch
+    triggers can not be wrapped as the timer would not recognize them. Public
+    attributes, e.g. ``level`` of :py:class:`pytimers.LoggerTrigger`, are read from
+    and set on the wrapped trigger constructing it if needed.
+
+    :param factory: Callable without arguments returning the wrapped trigger.
+    """
+
+    def __init__(self, factory: Callable[[], BaseTrigger]):
+        super().__init__()
+        self._factory = factory
+        self._trigger: Optional[BaseTrigger] = None
+        self._lock = Lock()
+
+    @property
+    def trigger(self) -> BaseTrigger:
+        """The wrapped trigger constructed on the first access."""
+
+        if self._trigger is None:
+            with self._lock:
+                if self._trigger is None:
+                    self._trigger = self._factory()
+        return self._trigger
+
+    def on_measurement(self, measurement: Measurement) -> None:
+        notify_trigger(self.trigger, measurement)
+
+    def __getattr__(self, name: str) -> Any:
+        # called only for attributes the lazy trigger itself does not define
+        if name.startswith("_"):
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        return getattr(self.trigger, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith("_"):
+            super().__setattr__(name, value)
+        else:
+            setattr(self.trigger, name, value)
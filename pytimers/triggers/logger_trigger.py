@@ -1,12 +1,48 @@
 from __future__ import annotations
 
 import logging
+import math
 from string import Template
+from threading import Lock
+from timeit import default_timer
 from typing import Optional
 
+from pytimers.aggregation import LabelStatistics
+from pytimers.measurement import Measurement
 from pytimers.triggers.base_trigger import BaseTrigger
 
 
+class _TokenBucket:
+    """Token bucket allowing ``rate`` actions per second on average with bursts of
+    up to ``rate`` actions.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(rate, 1.0)
+        self.tokens = self.capacity
+        self.last_refill = default_timer()
+
+    def take(self, now: float) -> bool:
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.last_refill) * self.rate
+        )
+        self.last_refill = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class _PendingSummary:
+    __slots__ = ("started", "statistics", "errors")
+
+    def __init__(self, started: float):
+        self.started = started
+        self.statistics = LabelStatistics()
+        self.errors = 0
+
+
 class LoggerTrigger(BaseTrigger):
     """Provided trigger class for logging the measured duration using std logging
     library.
@@ -15,11 +51,30 @@ class LoggerTrigger(BaseTrigger):
         :py:mod:`logging`) used for the message.
     :param template: Message `template string
         <https://docs.python.org/3/library/string.html#template-strings>`_
-        containing placeholders for label, duration and/or humanized_duration.
+        containing placeholders for label, duration, humanized_duration, outcome,
+        cpu_duration, wait_duration and/or gc_duration. Outcome is either
+        ``success`` or the name of the raised exception. CPU and wait durations are
+        only available if the timer measures CPU time and garbage collection
+        duration only if the timer measures garbage collection pauses, otherwise
+        they are replaced with ``unmeasured_placeholder``.
     :param precision: Number of decimal places for the message duration in seconds.
     :param humanized_precision: Number of decimal places for milliseconds in
         human-readable duration in the message.
     :param default_code_block_label: Label used for code blocks with missing label.
+    :param unmeasured_placeholder: Text used for CPU, wait and garbage collection
+        durations if they are not measured.
+    :param summary_interval: If set, the trigger stops logging every measurement and
+        logs at most one summary line per label per ``summary_interval`` seconds
+        instead. Pending summaries of all labels are logged by the first
+        measurement of any label after their interval elapses or by
+        :py:meth:`pytimers.LoggerTrigger.flush`.
+    :param summary_template: Summary message template string containing
+        placeholders for label, count, errors, mean, p50, p90, p99 and/or max.
+    :param max_lines_per_second: Optional limit of the average number of logged
+        lines per second enforced by a token bucket allowing bursts of the same size.
+        Excess per measurement lines are dropped and counted in
+        ``suppressed_lines``, excess summaries keep aggregating until the limit
+        allows them to be logged.
     """
 
     def __init__(
@@ -29,6 +84,12 @@ class LoggerTrigger(BaseTrigger):
         precision: int = 3,
         humanized_precision: int = 3,
         default_code_block_label: str = "code block",
+        unmeasured_placeholder: str = "n/a",
+        summary_interval: Optional[float] = None,
+        summary_template: str = (
+            "${label}: ${count} calls, p50 ${p50}, p99 ${p99}, max ${max}"
+        ),
+        max_lines_per_second: Optional[float] = None,
     ):
         super().__init__()
         self.level = level
@@ -37,23 +98,132 @@ class LoggerTrigger(BaseTrigger):
         self.precision = precision
         self.humanized_precision = humanized_precision
         self.default_code_block_label = default_code_block_label
+        self.unmeasured_placeholder = unmeasured_placeholder
+        self.summary_interval = summary_interval
+        self.summary_template = Template(summary_template)
+        self.suppressed_lines = 0
+        self._rate_limit = (
+            _TokenBucket(max_lines_per_second)
+            if max_lines_per_second is not None
+            else None
+        )
+        self._pending: dict[Optional[str], _PendingSummary] = {}
+        # earliest time any pending summary may be logged
+        self._next_due = math.inf
+        self._lock = Lock()
+
+    def on_measurement(self, measurement: Measurement) -> None:
+        label = measurement.label
+        if label is None and measurement.decorator is False:
+            label = self.default_code_block_label
+        if self.summary_interval is None:
+            self._log_measurement(label, measurement)
+        else:
+            self._summarize_measurement(label, measurement, self.summary_interval)
+
+    def flush(self) -> None:
+        """Logs summaries of all labels with pending measurements regardless of the
+        summary interval and the rate limit. Has no effect unless
+        ``summary_interval`` is set.
+        """
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._next_due = math.inf
+        for label, summary in pending.items():
+            self._log_summary(label, summary)
+
+    def _allowed(self, now: float) -> bool:
+        return self._rate_limit is None or self._rate_limit.take(now)
 
-    def __call__(
+    def _summarize_measurement(
         self,
-        duration_s: float,
-        decorator: bool,
-        label: Optional[str] = None,
+        label: Optional[str],
+        measurement: Measurement,
+        summary_interval: float,
     ) -> None:
-        if label is None and decorator is False:
-            label = self.default_code_block_label
+        now = default_timer()
+        with self._lock:
+            summary = self._pending.get(label)
+            if summary is None:
+                summary = self._pending[label] = _PendingSummary(now)
+                self._next_due = min(self._next_due, now + summary_interval)
+            summary.statistics.add(measurement.duration_s)
+            if measurement.exc_type is not None:
+                summary.errors += 1
+            if now < self._next_due:
+                return
+            # labels gone quiet are logged by measurements of other labels
+            due = self._due_summaries(now, summary_interval)
+        for due_label, due_summary in due:
+            self._log_summary(due_label, due_summary)
+
+    def _due_summaries(
+        self, now: float, summary_interval: float
+    ) -> list[tuple[Optional[str], _PendingSummary]]:
+        due = []
+        next_due = math.inf
+        for label, summary in list(self._pending.items()):
+            due_time = summary.started + summary_interval
+            if due_time > now:
+                next_due = min(next_due, due_time)
+            elif self._allowed(now):
+                del self._pending[label]
+                due.append((label, summary))
+            elif self._rate_limit is not None:
+                # retried once the token bucket refills
+                next_due = min(next_due, now + 1.0 / self._rate_limit.rate)
+        self._next_due = next_due
+        return due
+
+    def _log_summary(self, label: Optional[str], summary: _PendingSummary) -> None:
+        statistics = summary.statistics
+        self.logger.log(
+            level=self.level,
+            msg=self.summary_template.substitute(
+                label=label,
+                count=f"{statistics.count:,}",
+                errors=f"{summary.errors:,}",
+                mean=self._humanized(statistics.mean_s),
+                p50=self._humanized(statistics.quantile(0.5)),
+                p90=self._humanized(statistics.quantile(0.9)),
+                p99=self._humanized(statistics.quantile(0.99)),
+                max=self._humanized(statistics.max_s),
+            ),
+        )
+
+    def _humanized(self, duration_s: float) -> str:
+        return self.humanized_duration(
+            duration_s=duration_s,
+            precision=self.humanized_precision,
+        )
+
+    def _log_measurement(self, label: Optional[str], measurement: Measurement) -> None:
+        if self._rate_limit is not None:
+            with self._lock:
+                allowed = self._rate_limit.take(default_timer())
+                if not allowed:
+                    self.suppressed_lines += 1
+            if not allowed:
+                return
         self.logger.log(
             level=self.level,
             msg=self.template.substitute(
-                duration=round(duration_s, self.precision),
-                humanized_duration=self.humanized_duration(
-                    duration_s=duration_s,
-                    precision=self.humanized_precision,
-                ),
+                duration=round(measurement.duration_s, self.precision),
+                humanized_duration=self._humanized(measurement.duration_s),
                 label=label,
+                outcome=(
+                    "success"
+                    if measurement.exc_type is None
+                    else measurement.exc_type.__name__
+                ),
+                cpu_duration=self._format_optional(measurement.cpu_duration_s),
+                wait_duration=self._format_optional(measurement.wait_duration_s),
+                gc_duration=self._format_optional(measurement.gc_duration_s),
             ),
         )
+
+    def _format_optional(self, duration_s: Optional[float]) -> str:
+        if duration_s is None:
+            return self.unmeasured_placeholder
+        return str(round(duration_s, self.precision))
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from math import isfinite
+from threading import Lock
+from typing import Optional
+
+from pytimers.measurement import Measurement
+from pytimers.scaling import SizeScaling
+from pytimers.triggers.base_trigger import BaseTrigger
+
+
+class ScalingTrigger(BaseTrigger):
+    """Provided trigger collecting per label statistics of durations against the size
+    of the input of callables decorated using :py:meth:`pytimers.Timer.by`. The key
+    of the measurement has to be the size, i.e. a finite non-negative number.
+    Measurements without such a key are ignored.
+
+    :param relative_accuracy: Maximal relative error of estimated quantiles, see
+        :py:class:`pytimers.aggregation.LatencyHistogram`.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        super().__init__()
+        self.relative_accuracy = relative_accuracy
+        self._statistics: dict[Optional[str], SizeScaling] = {}
+        self._lock = Lock()
+
+    def on_measurement(self, measurement: Measurement) -> None:
+        size = measurement.key
+        if not isinstance(size, (int, float)) or isinstance(size, bool) or size < 0:
+            return
+        if isinstance(size, float) and not isfinite(size):
+            return
+        with self._lock:
+            scaling = self._statistics.get(measurement.label)
+            if scaling is None:
+                scaling = self._statistics[measurement.label] = SizeScaling(
+                    self.relative_accuracy
+                )
+            scaling.add(size, measurement.duration_s)
+
+    def statistics(self) -> dict[Optional[str], SizeScaling]:
+        """Exposes collected statistics.
+
+        :return: Copy of the statistics for each label.
+        """
+
+        with self._lock:
+            return {
+                label: scaling.copy() for label, scaling in self._statistics.items()
+            }
+
+    def superlinear(self, threshold: float = 1.2) -> dict[Optional[str], float]:
+        """Finds labels whose durations grow faster than linearly with the size.
+
+        :param threshold: Minimal fitted exponent of the size to report the label.
+        :return: Fitted exponent of each reported label.
+        """
+
+        result = {}
+        for label, scaling in self.statistics().items():
+            exponent = scaling.exponent
+            if exponent is not None and exponent >= threshold:
+                result[label] = exponent
+        return result
+
+    def reset(self) -> None:
+        """Discards all collected statistics."""
+
+        with self._lock:
+            self._statistics = {}
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import json
+import logging
+import random
+from abc import ABC, abstractmethod
+from timeit import default_timer
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from pytimers.clock import Clock, epoch_offset
+from pytimers.measurement import Measurement
+from pytimers.triggers.background_queue import BackgroundQueue
+from pytimers.triggers.base_trigger import BaseTrigger
+
+
+logger = logging.getLogger(__name__)
+
+# OTLP span kind and status codes
+SPAN_KIND_INTERNAL = 1
+STATUS_CODE_OK = 1
+STATUS_CODE_ERROR = 2
+
+
+class SpanExporter(ABC):
+    """Abstraction of a destination of spans exported by
+    :py:class:`pytimers.triggers.span_export_trigger.SpanExportTrigger`.
+    """
+
+    @abstractmethod
+    def export(self, request: dict[str, Any]) -> None:
+        """Exports a batch of spans.
+
+        :param request: OTLP/JSON ``ExportTraceServiceRequest`` containing the spans.
+        """
+        pass
+
+
+class OTLPJsonFileExporter(SpanExporter):
+    """Exporter appending each batch of spans as a single line of OTLP/JSON to a
+    file.
+
+    :param path: Path of the file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def export(self, request: dict[str, Any]) -> None:
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(json.dumps(request, separators=(",", ":")) + "\n")
+
+
+class OTLPHttpExporter(SpanExporter):
+    """Exporter sending each batch of spans in OTLP/JSON to an OTLP/HTTP endpoint,
+    e.g. a local OpenTelemetry collector.
+
+    :param endpoint: URL of the traces endpoint.
+    :param timeout: Timeout of a single request in seconds.
+    """
+
+    def __init__(
+        self,
+        endpoint: str = "http://localhost:4318/v1/traces",
+        timeout: float = 10.0,
+    ):
+        self.endpoint = endpoint
+        self.timeout = timeout
+
+    def export(self, request: dict[str, Any]) -> None:
+        # urllib is imported only when exporting as it is slow to import
+        from urllib.request import Request, urlopen
+
+        http_request = Request(
+            self.endpoint,
+            data=json.dumps(request).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urlopen(http_request, timeout=self.timeout) as response:
+            response.read()
+
+
+class SpanExportTrigger(BaseTrigger):
+    """Provided trigger exporting measurements as OpenTelemetry compatible trace
+    spans. Nested timed code blocks and decorated callables called inside timed
+    code blocks become child spans of the enclosing code block. The trigger only
+    queues the measurement, spans are encoded and exported in batches by a
+    background daemon thread so exporting never blocks the timed code. If the queue
+    is full new measurements are dropped and counted in ``dropped_spans``.
+
+    :param exporter: Destination of the exported spans.
+    :param service_name: Value of the ``service.name`` resource attribute.
+    :param batch_size: Number of queued measurements triggering an export.
+    :param export_interval: Maximal number of seconds between two exports.
+    :param max_queue_size: Maximal number of queued measurements.
+    """
+
+    needs_task_name = True
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        service_name: str = "pytimers",
+        batch_size: int = 512,
+        export_interval: float = 1.0,
+        max_queue_size: int = 2048,
+    ):
+        super().__init__()
+        self.exporter = exporter
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self.export_interval = export_interval
+        self.max_queue_size = max_queue_size
+        self.failed_exports = 0
+        self._epoch_offset = epoch_offset()
+        self._span_ids: WeakKeyDictionary[Clock, int] = WeakKeyDictionary()
+        self._trace_ids: WeakKeyDictionary[Clock, int] = WeakKeyDictionary()
+        self._queue: BackgroundQueue[Measurement] = BackgroundQueue(
+            self._export,
+            batch_size,
+            export_interval,
+            max_queue_size,
+            "pytimers-span-exporter",
+        )
+
+    @property
+    def dropped_spans(self) -> int:
+        """Number of measurements dropped because the queue was full."""
+
+        return self._queue.dropped
+
+    def on_measurement(self, measurement: Measurement) -> None:
+        self._queue.put(measurement)
+
+    def force_flush(self) -> None:
+        """Exports all queued measurements in the calling thread."""
+
+        self._queue.flush()
+
+    def _export(self, measurements: list[Measurement]) -> None:
+        try:
+            self.exporter.export(self.encode(measurements))
+        except Exception:
+            self.failed_exports += 1
+            logger.warning("Export of %d spans failed.", len(measurements))
+
+    def shutdown(self) -> None:
+        """Stops the background thread and exports remaining queued measurements.
+        Measurements received after the shutdown are dropped.
+        """
+
+        self._queue.shutdown()
+
+    def _clock_span_id(self, clock: Clock) -> int:
+        span_id = self._span_ids.get(clock)
+        if span_id is None:
+            span_id = self._span_ids[clock] = random.getrandbits(64) or 1
+        return span_id
+
+    def _clock_trace_id(self, clock: Clock) -> int:
+        while clock.parent is not None:
+            clock = clock.parent
+        trace_id = self._trace_ids.get(clock)
+        if trace_id is None:
+            trace_id = self._trace_ids[clock] = random.getrandbits(128) or 1
+        return trace_id
+
+    def _encode_span(self, measurement: Measurement) -> dict[str, Any]:
+        if measurement.clock is not None:
+            span_id = self._clock_span_id(measurement.clock)
+        else:
+            span_id = random.getrandbits(64) or 1
+        parent_clock = measurement.parent_clock
+        if measurement.clock is not None:
+            trace_id = self._clock_trace_id(measurement.clock)
+        elif parent_clock is not None:
+            trace_id = self._clock_trace_id(parent_clock)
+        else:
+            trace_id = random.getrandbits(128) or 1
+
+        start_time = measurement.start_time
+        if start_time is None:
+            start_time = default_timer() - measurement.duration_s
+        start_ns = int((start_time + self._epoch_offset) * 1e9)
+        attributes: list[dict[str, Any]] = [
+            {"key": "pytimers.decorator", "value": {"boolValue": measurement.decorator}}
+        ]
+        if measurement.thread_id is not None:
+            attributes.append(
+                {"key": "thread.id", "value": {"intValue": str(measurement.thread_id)}}
+            )
+        if measurement.task_name is not None:
+            attributes.append(
+                {
+                    "key": "pytimers.task",
+                    "value": {"stringValue": measurement.task_name},
+                }
+            )
+
+        span: dict[str, Any] = {
+            "traceId": f"{trace_id:032x}",
+            "spanId": f"{span_id:016x}",
+            "name": measurement.label or "code block",
+            "kind": SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(start_ns),
+            "endTimeUnixNano": str(start_ns + int(measurement.duration_s * 1e9)),
+            "attributes": attributes,
+            "status": (
+                {"code": STATUS_CODE_OK}
+                if measurement.exc_type is None
+                else {
+                    "code": STATUS_CODE_ERROR,
+                    "message": measurement.exc_type.__name__,
+                }
+            ),
+        }
+        if parent_clock is not None:
+            span["parentSpanId"] = f"{self._clock_span_id(parent_clock):016x}"
+        return span
+
+    def encode(self, measurements: list[Measurement]) -> dict[str, Any]:
+        """Encodes measurements as OTLP/JSON ``ExportTraceServiceRequest``.
+
+        :param measurements: The measurements to be encoded.
+        :return: JSON serializable export request.
+        """
+
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {
+                                "key": "service.name",
+                                "value": {"stringValue": self.service_name},
+                            }
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "pytimers"},
+                            "spans": [
+                                self._encode_span(measurement)
+                                for measurement in measurements
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
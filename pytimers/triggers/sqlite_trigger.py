@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import json
+import logging
+import math
+import sqlite3
+from threading import Lock
+from time import time
+from timeit import default_timer
+from typing import Optional, Tuple
+
+from pytimers.aggregation import LabelStatistics
+from pytimers.clock import epoch_offset
+from pytimers.measurement import Measurement
+from pytimers.triggers.background_queue import BackgroundQueue
+from pytimers.triggers.base_trigger import BaseTrigger
+
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS measurements (
+    timestamp REAL NOT NULL,
+    label TEXT,
+    duration_s REAL NOT NULL,
+    cpu_duration_s REAL,
+    decorator INTEGER NOT NULL,
+    failed INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS measurements_label_timestamp
+    ON measurements (label, timestamp);
+CREATE INDEX IF NOT EXISTS measurements_timestamp ON measurements (timestamp);
+CREATE TABLE IF NOT EXISTS rollups (
+    minute INTEGER NOT NULL,
+    label TEXT,
+    count INTEGER NOT NULL,
+    errors INTEGER NOT NULL,
+    total_s REAL NOT NULL,
+    min_s REAL NOT NULL,
+    max_s REAL NOT NULL,
+    zero_count INTEGER NOT NULL,
+    buckets TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS rollups_label_minute ON rollups (label, minute);
+CREATE INDEX IF NOT EXISTS rollups_minute ON rollups (minute);
+"""
+
+# unix time, label, duration, CPU duration, decorator and failure flags
+Row = Tuple[float, Optional[str], float, Optional[float], int, int]
+
+
+class SQLiteTrigger(BaseTrigger):
+    """Provided trigger persisting measurements in a local SQLite database. The
+    trigger only queues the measurement, a background daemon thread inserts queued
+    measurements in batches into the ``measurements`` table of a database in WAL
+    mode. Raw measurements older than ``raw_retention_s`` are periodically rolled up
+    into per minute per label aggregates in the ``rollups`` table and deleted,
+    rollups older than ``rollup_retention_s`` are deleted as well. If the queue is
+    full new measurements are dropped and counted in ``dropped_measurements``.
+    Failed inserts and failed maintenance runs of the background thread are logged
+    and counted in ``failed_writes``.
+
+    :param path: Path of the database file, created if it does not exist.
+    :param batch_size: Number of queued measurements triggering an insert.
+    :param flush_interval: Maximal number of seconds between two inserts.
+    :param max_queue_size: Maximal number of queued measurements.
+    :param raw_retention_s: Age in seconds of raw measurements rolled up into per
+        minute aggregates.
+    :param rollup_retention_s: Age in seconds of deleted per minute aggregates. If
+        set to ``None`` the aggregates are kept forever.
+    :param maintenance_interval: Number of seconds between two roll ups run by the
+        background thread.
+    :param relative_accuracy: Maximal relative error of quantiles of the per minute
+        aggregates, see :py:class:`pytimers.aggregation.LatencyHistogram`. A database
+        has to be always used with the same accuracy.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 512,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 65536,
+        raw_retention_s: float = 3600.0,
+        rollup_retention_s: Optional[float] = 30 * 86400.0,
+        maintenance_interval: float = 60.0,
+        relative_accuracy: float = 0.01,
+    ):
+        super().__init__()
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self.raw_retention_s = raw_retention_s
+        self.rollup_retention_s = rollup_retention_s
+        self.maintenance_interval = maintenance_interval
+        self.relative_accuracy = relative_accuracy
+        self.failed_writes = 0
+        self._epoch_offset = epoch_offset()
+        # the connection is shared by the background thread and the query methods
+        self._connection_lock = Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+        self._last_maintenance = default_timer()
+        self._queue: BackgroundQueue[Row] = BackgroundQueue(
+            self._insert,
+            batch_size,
+            flush_interval,
+            max_queue_size,
+            "pytimers-sqlite-writer",
+            self._maintain_periodically,
+        )
+
+    @property
+    def dropped_measurements(self) -> int:
+        """Number of measurements dropped because the queue was full."""
+
+        return self._queue.dropped
+
+    def on_measurement(self, measurement: Measurement) -> None:
+        start_time = measurement.start_time
+        if start_time is None:
+            end_time = default_timer()
+        else:
+            end_time = start_time + measurement.duration_s
+        row = (
+            end_time + self._epoch_offset,
+            measurement.label,
+            measurement.duration_s,
+            measurement.cpu_duration_s,
+            int(measurement.decorator),
+            int(measurement.exc_type is not None),
+        )
+        self._queue.put(row)
+
+    def _maintain_periodically(self) -> None:
+        if default_timer() - self._last_maintenance >= self.maintenance_interval:
+            self._last_maintenance = default_timer()
+            # e.g. a locked database must not stop the inserts
+            try:
+                self.maintain()
+            except sqlite3.Error:
+                self.failed_writes += 1
+                logger.warning("Maintenance of %s failed.", self.path, exc_info=True)
+
+    def force_flush(self) -> None:
+        """Inserts all queued measurements in the calling thread."""
+
+        self._queue.flush()
+
+    def _insert(self, rows: list[Row]) -> None:
+        with self._connection_lock:
+            try:
+                with self._connection:
+                    self._connection.executemany(
+                        "INSERT INTO measurements VALUES (?, ?, ?, ?, ?, ?)", rows
+                    )
+            except sqlite3.Error:
+                self.failed_writes += 1
+                logger.warning("Insert of %d measurements failed.", len(rows))
+
+    def maintain(self, now: Optional[float] = None) -> int:
+        """Rolls up raw measurements older than ``raw_retention_s`` into per minute
+        aggregates and deletes aggregates older than ``rollup_retention_s``. Only
+        whole minutes are rolled up. Called periodically by the background thread.
+
+        :param now: Current unix time, defaults to :py:func:`time.time`.
+        :return: Number of rolled up raw measurements.
+        """
+
+        if now is None:
+            now = time()
+        cutoff_minute = int((now - self.raw_retention_s) // 60)
+        with self._connection_lock, self._connection:
+            # the cursor is iterated as there may be many expired measurements
+            rows = self._connection.execute(
+                "SELECT label, CAST(timestamp / 60 AS INTEGER), duration_s, failed "
+                "FROM measurements WHERE timestamp < ?",
+                (cutoff_minute * 60,),
+            )
+            rollups: dict[tuple[Optional[str], int], LabelStatistics] = {}
+            errors: dict[tuple[Optional[str], int], int] = {}
+            for label, minute, duration_s, failed in rows:
+                statistics = rollups.get((label, minute))
+                if statistics is None:
+                    statistics = rollups[(label, minute)] = LabelStatistics(
+                        self.relative_accuracy
+                    )
+                    errors[(label, minute)] = 0
+                statistics.add(duration_s)
+                errors[(label, minute)] += failed
+            self._connection.executemany(
+                "INSERT INTO rollups VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        minute,
+                        label,
+                        statistics.count,
+                        errors[(label, minute)],
+                        statistics.total_s,
+                        statistics.min_s,
+                        statistics.max_s,
+                        statistics.histogram.zero_count,
+                        json.dumps(statistics.histogram.buckets),
+                    )
+                    for (label, minute), statistics in rollups.items()
+                ],
+            )
+            self._connection.execute(
+                "DELETE FROM measurements WHERE timestamp < ?", (cutoff_minute * 60,)
+            )
+            if self.rollup_retention_s is not None:
+                self._connection.execute(
+                    "DELETE FROM rollups WHERE minute < ?",
+                    (int((now - self.rollup_retention_s) // 60),),
+                )
+        return sum(statistics.count for statistics in rollups.values())
+
+    def statistics(
+        self,
+        label: Optional[str],
+        window_s: float = 3600.0,
+        now: Optional[float] = None,
+    ) -> LabelStatistics:
+        """Aggregates persisted measurements of a label finished within the time
+        window, including measurements still queued. Rolled up minutes are included
+        if the minute starts within the window.
+
+        :param label: The label.
+        :param window_s: Length of the window in seconds ending now.
+        :param now: Current unix time, defaults to :py:func:`time.time`.
+        :return: Statistics of the measurements in the window.
+        """
+
+        self.force_flush()
+        if now is None:
+            now = time()
+        since = now - window_s
+        statistics = LabelStatistics(self.relative_accuracy)
+        with self._connection_lock:
+            durations = self._connection.execute(
+                "SELECT duration_s FROM measurements "
+                "WHERE label IS ? AND timestamp >= ? AND timestamp <= ?",
+                (label, since, now),
+            ).fetchall()
+            rollups = self._connection.execute(
+                "SELECT count, total_s, min_s, max_s, zero_count, buckets "
+                "FROM rollups WHERE label IS ? AND minute >= ? AND minute * 60 <= ?",
+                (label, math.ceil(since / 60), now),
+            ).fetchall()
+        statistics.add_many([duration_s for duration_s, in durations])
+        for count, total_s, min_s, max_s, zero_count, buckets in rollups:
+            rollup = LabelStatistics(self.relative_accuracy)
+            rollup.count = rollup.histogram.count = count
+            rollup.total_s = total_s
+            rollup.min_s = min_s
+            rollup.max_s = max_s
+            rollup.histogram.zero_count = zero_count
+            rollup.histogram.buckets = {
+                int(key): bucket_count
+                for key, bucket_count in json.loads(buckets).items()
+            }
+            statistics.merge(rollup)
+        return statistics
+
+    def quantile(
+        self,
+        label: Optional[str],
+        q: float,
+        window_s: float = 3600.0,
+        now: Optional[float] = None,
+    ) -> float:
+        """Estimates a quantile of durations of a label within the time window, e.g.
+        ``trigger.quantile("request", 0.95)`` for p95 over the last hour, see
+        :py:meth:`pytimers.triggers.sqlite_trigger.SQLiteTrigger.statistics`.
+
+        :param label: The label.
+        :param q: The quantile between 0 and 1.
+        :param window_s: Length of the window in seconds ending now.
+        :param now: Current unix time, defaults to :py:func:`time.time`.
+        :return: The estimated duration in seconds or ``0.0`` if there are no
+            measurements.
+        """
+
+        return self.statistics(label, window_s, now).quantile(q)
+
+    def labels(self) -> list[Optional[str]]:
+        """Lists labels of all persisted measurements and aggregates.
+
+        :return: The sorted labels, ``None`` first if present.
+        """
+
+        self.force_flush()
+        with self._connection_lock:
+            rows = self._connection.execute(
+                "SELECT label FROM measurements UNION SELECT label FROM rollups"
+            ).fetchall()
+        return sorted(
+            (label for label, in rows), key=lambda label: (label is not None, label)
+        )
+
+    def shutdown(self) -> None:
+        """Stops the background thread, inserts remaining queued measurements and
+        closes the database. Measurements received after the shutdown are dropped.
+        """
+
+        self._queue.shutdown()
+        with self._connection_lock:
+            self._connection.close()
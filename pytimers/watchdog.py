@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import sys
+import traceback
+from threading import Event, Thread
+from types import TracebackType
+from typing import Any, Callable, Iterable, Mapping, Optional, Type
+from weakref import WeakSet
+
+from pytimers.active_clocks import ACTIVE_CLOCKS
+from pytimers.clock import Clock
+from pytimers.measurement import Measurement
+from pytimers.triggers.base_trigger import BaseTrigger, notify_trigger
+
+
+class Watchdog:
+    """Background watchdog reporting labelled code blocks still running after their
+    deadline, e.g. stuck requests, before they finish or even if they never do. The
+    watchdog periodically checks clocks running in all threads and asyncio tasks and
+    calls its triggers once for each overdue code block. Triggers receive a
+    :py:class:`pytimers.measurement.Measurement` with the duration elapsed so far.
+    Only code blocks timed using the context manager are watched as decorated
+    callables do not start a :py:class:`pytimers.clock.Clock`.
+
+    :param triggers: An iterable of triggers to be called for each overdue code
+        block. Instances of :py:class:`pytimers.BaseTrigger` subclasses receive the
+        measurement via :py:meth:`pytimers.BaseTrigger.on_measurement`. Any other
+        callable is called with positional arguments
+        ``duration_s: float, decorator: bool, label: str``.
+    :param deadline_s: Deadline in seconds of labelled code blocks not listed in
+        ``deadlines``. If set to ``None`` only the listed labels are watched.
+    :param deadlines: Deadlines in seconds of individual labels.
+    :param interval: Number of seconds between two checks.
+    :param capture_stack: If set to ``True`` the stack trace of the thread running
+        the overdue code block is passed in
+        :py:attr:`pytimers.measurement.Measurement.stack_trace`. Code blocks running
+        in asyncio tasks get the stack of the thread running the event loop which
+        may be running another task at the time of the check.
+    """
+
+    def __init__(
+        self,
+        triggers: Iterable[BaseTrigger | Callable[[float, bool, Optional[str]], Any]],
+        deadline_s: Optional[float] = 1.0,
+        deadlines: Optional[Mapping[str, float]] = None,
+        interval: float = 0.1,
+        capture_stack: bool = False,
+    ):
+        self.triggers = list(triggers)
+        self.deadline_s = deadline_s
+        self.deadlines = dict(deadlines) if deadlines else {}
+        self.interval = interval
+        self.capture_stack = capture_stack
+        # clocks already reported, finished clocks are dropped automatically
+        self._reported: WeakSet[Clock] = WeakSet()
+        self._stop_event = Event()
+        self._thread: Optional[Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """True if the background watchdog thread is running."""
+
+        return self._thread is not None
+
+    def start(self) -> None:
+        """Starts watching running clocks in a background daemon thread.
+
+        :raise RuntimeError: The watchdog is already running.
+        """
+
+        if self._thread is not None:
+            raise RuntimeError("Watchdog is already running.")
+        ACTIVE_CLOCKS.acquire()
+        self._stop_event.clear()
+        self._thread = Thread(
+            target=self._run,
+            name="pytimers-watchdog",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the background watchdog thread."""
+
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        ACTIVE_CLOCKS.release()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.check()
+
+    def _deadline(self, label: str) -> Optional[float]:
+        return self.deadlines.get(label, self.deadline_s)
+
+    def check(self) -> int:
+        """Reports running code blocks exceeding their deadline which were not
+        reported yet. This method is called periodically by the background thread.
+
+        :return: Number of newly reported code blocks.
+        """
+
+        overdue = []
+        for clock in ACTIVE_CLOCKS.snapshot():
+            if clock.label is None or clock in self._reported:
+                continue
+            deadline = self._deadline(clock.label)
+            if deadline is None:
+                continue
+            duration = clock.current_duration()
+            if duration >= deadline:
+                overdue.append((clock, duration))
+        if not overdue:
+            return 0
+
+        frames = sys._current_frames() if self.capture_stack else {}
+        for clock, duration in overdue:
+            self._reported.add(clock)
+            frame = frames.get(clock.thread_id)
+            self._fire(
+                Measurement(
+                    duration_s=duration,
+                    decorator=False,
+                    label=clock.label,
+                    start_time=clock.start_time,
+                    thread_id=clock.thread_id,
+                    parent_label=None if clock.parent is None else clock.parent.label,
+                    label_id=clock.label_id,
+                    clock=clock,
+                    parent_clock=clock.parent,
+                    stack_trace=(
+                        None
+                        if frame is None
+                        else "".join(traceback.format_stack(frame))
+                    ),
+                )
+            )
+        return len(overdue)
+
+    def _fire(self, measurement: Measurement) -> None:
+        for trigger in self.triggers:
+            notify_trigger(trigger, measurement)
+
+    def __enter__(self) -> Watchdog:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.stop()
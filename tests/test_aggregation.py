@@ -0,0 +1,113 @@
+import pytest
+
+from pytimers.aggregation import LabelStatistics, LatencyHistogram
+
+
+def test_empty_statistics() -> None:
+    statistics = LabelStatistics()
+    statistics.add_many([])
+
+    assert statistics.count == 0
+    assert statistics.mean_s == 0.0
+
+
+def test_statistics_add_many() -> None:
+    statistics = LabelStatistics()
+    statistics.add_many([1.0, 3.0])
+    statistics.add_many([2.0])
+
+    assert statistics.count == 3
+    assert statistics.total_s == 6.0
+    assert statistics.min_s == 1.0
+    assert statistics.max_s == 3.0
+    assert statistics.mean_s == 2.0
+
+
+def test_statistics_copy_is_independent() -> None:
+    statistics = LabelStatistics()
+    statistics.add_many([1.0])
+
+    copied = statistics.copy()
+    statistics.add_many([2.0])
+
+    assert copied.count == 1
+    assert copied.total_s == 1.0
+    assert copied.min_s == 1.0
+    assert copied.max_s == 1.0
+
+
+def test_statistics_merge() -> None:
+    statistics = LabelStatistics()
+    statistics.add_many([2.0])
+    other = LabelStatistics()
+    other.add_many([1.0, 3.0])
+
+    statistics.merge(other)
+
+    assert statistics.count == 3
+    assert statistics.total_s == 6.0
+    assert statistics.min_s == 1.0
+    assert statistics.max_s == 3.0
+
+
+def test_histogram_quantiles_within_relative_accuracy() -> None:
+    histogram = LatencyHistogram(relative_accuracy=0.01)
+    durations = [i / 1000 for i in range(1, 1001)]
+    histogram.add_many(durations)
+
+    for q in (0.0, 0.5, 0.9, 0.99, 1.0):
+        exact = durations[round(q * (len(durations) - 1))]
+        assert histogram.quantile(q) == pytest.approx(exact, rel=0.01)
+
+
+def test_histogram_counts_short_durations_as_zero() -> None:
+    histogram = LatencyHistogram()
+    histogram.add_many([0.0, 0.0, 1.0])
+
+    assert histogram.zero_count == 2
+    assert histogram.quantile(0.5) == 0.0
+    assert histogram.quantile(1.0) == pytest.approx(1.0, rel=0.01)
+
+
+def test_empty_histogram_quantile() -> None:
+    assert LatencyHistogram().quantile(0.5) == 0.0
+
+
+def test_histogram_rejects_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        LatencyHistogram(relative_accuracy=1.0)
+    with pytest.raises(ValueError):
+        LatencyHistogram().quantile(1.5)
+
+
+def test_histogram_merge() -> None:
+    histogram = LatencyHistogram()
+    histogram.add_many([1.0, 2.0])
+    other = LatencyHistogram()
+    other.add_many([0.0, 2.0])
+
+    histogram.merge(other)
+    copied = histogram.copy()
+
+    assert copied.count == 4
+    assert copied.zero_count == 1
+    assert copied.buckets == histogram.buckets
+
+
+def test_histogram_merge_requires_same_buckets() -> None:
+    with pytest.raises(ValueError):
+        LatencyHistogram(0.01).merge(LatencyHistogram(0.02))
+
+
+def test_statistics_quantile() -> None:
+    statistics = LabelStatistics()
+    assert statistics.quantile(0.5) == 0.0
+
+    statistics.add(0.001)
+    statistics.add_many([0.002, 0.003])
+
+    assert statistics.count == 3
+    assert statistics.min_s == 0.001
+    assert statistics.quantile(0.0) == 0.001
+    assert statistics.quantile(0.5) == pytest.approx(0.002, rel=0.01)
+    assert statistics.quantile(1.0) == 0.003
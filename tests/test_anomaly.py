@@ -0,0 +1,66 @@
+import math
+from random import Random
+from typing import List, cast
+
+import pytest
+
+from pytimers.anomaly import ChangeDetector
+
+
+def noisy_durations(mean_s: float, count: int, seed: int = 0) -> List[float]:
+    random = Random(seed)
+    return [mean_s * math.exp(random.gauss(0.0, 0.1)) for _ in range(count)]
+
+
+def test_detector_stays_quiet_on_steady_durations() -> None:
+    detector = ChangeDetector()
+
+    directions = [detector.update(duration) for duration in noisy_durations(0.01, 5000)]
+
+    assert set(directions) == {0}
+    assert detector.baseline_s == pytest.approx(0.01, rel=0.05)
+    assert detector.previous_baseline_s == 0.0
+
+
+def test_detector_reports_increase_and_learns_new_baseline() -> None:
+    detector = ChangeDetector()
+    for duration in noisy_durations(0.01, 500):
+        assert detector.update(duration) == 0
+
+    directions = [detector.update(duration) for duration in noisy_durations(0.02, 50)]
+
+    assert directions.count(1) == 1
+    assert directions.index(1) < 10
+    assert -1 not in directions
+    assert detector.previous_baseline_s == pytest.approx(0.01, rel=0.05)
+    assert detector.count < 50
+
+
+def test_detector_reports_decrease() -> None:
+    detector = ChangeDetector(warmup=20)
+    for duration in noisy_durations(0.01, 20):
+        detector.update(duration)
+
+    directions = [detector.update(duration) for duration in noisy_durations(0.001, 20)]
+
+    assert directions.count(-1) == 1
+    assert 1 not in directions
+
+
+def test_detector_baseline_before_first_update() -> None:
+    assert ChangeDetector().baseline_s == 0.0
+
+
+def test_detector_update_survives_concurrent_reset() -> None:
+    detector = ChangeDetector()
+
+    class ResettingWarmup:
+        # emulates a reset by another thread in the middle of the update
+        def __lt__(self, count: int) -> bool:
+            detector.reset()
+            return False
+
+    detector.warmup = cast(int, ResettingWarmup())
+
+    assert detector.update(1.0) == 0
+    assert detector.update(1.0) == 0
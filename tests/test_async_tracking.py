@@ -0,0 +1,129 @@
+from asyncio import CancelledError, create_task, get_running_loop, sleep
+from time import sleep as sleep_sync
+
+import pytest
+
+from pytimers.async_tracking import ActiveTimeAwaitable
+from pytimers.event_loop import EventLoopLagMonitor
+from pytimers.timer import Timer
+from pytimers.triggers.dummy_trigger import DummyTrigger
+
+
+@pytest.fixture()
+def trigger() -> DummyTrigger:
+    return DummyTrigger()
+
+
+@pytest.fixture()
+def timer(trigger: DummyTrigger) -> Timer:
+    return Timer(triggers=[trigger], async_active_time=True)
+
+
+async def test_decorator_splits_active_and_suspended_time(
+    timer: Timer, trigger: DummyTrigger
+) -> None:
+    @timer
+    async def callable_name() -> int:
+        sleep_sync(0.01)
+        await sleep(0.05)
+        return 1
+
+    assert await callable_name() == 1
+
+    measurement = trigger.measurements[0]
+    assert measurement.active_duration_s is not None
+    assert measurement.suspended_duration_s is not None
+    assert 0.01 <= measurement.active_duration_s < 0.05
+    assert measurement.suspended_duration_s >= 0.04
+
+
+async def test_decorator_measures_active_time_of_failed_call(
+    timer: Timer, trigger: DummyTrigger
+) -> None:
+    @timer
+    async def callable_name() -> None:
+        await sleep(0)
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        await callable_name()
+
+    assert trigger.measurements[0].exc_type is ValueError
+    assert trigger.measurements[0].active_duration_s is not None
+
+
+async def test_decorator_forwards_cancellation(
+    timer: Timer, trigger: DummyTrigger
+) -> None:
+    @timer
+    async def callable_name() -> None:
+        await sleep(10)
+
+    task = create_task(callable_name())
+    await sleep(0)
+    task.cancel()
+
+    with pytest.raises(CancelledError):
+        await task
+
+    assert trigger.measurements[0].exc_type is CancelledError
+
+
+async def test_decorator_without_active_time(trigger: DummyTrigger) -> None:
+    timer = Timer(triggers=[trigger])
+
+    @timer
+    async def callable_name() -> None:
+        pass
+
+    await callable_name()
+
+    assert trigger.measurements[0].active_duration_s is None
+    assert trigger.measurements[0].suspended_duration_s is None
+
+
+async def test_awaitable_closes_wrapped_coroutine() -> None:
+    closed = []
+
+    async def coroutine() -> None:
+        try:
+            await sleep(10)
+        finally:
+            closed.append(True)
+
+    iterator = ActiveTimeAwaitable(coroutine()).__await__()
+    iterator.send(None)
+    iterator.close()
+
+    assert closed == [True]
+
+
+async def test_lag_monitor_measures_blocked_loop(trigger: DummyTrigger) -> None:
+    monitor = EventLoopLagMonitor(interval=0.001, timer=Timer(triggers=[trigger]))
+    monitor.start()
+    assert monitor.running
+
+    await sleep(0)
+    sleep_sync(0.05)
+    await sleep(0.01)
+    monitor.stop()
+
+    assert not monitor.running
+    assert monitor.statistics().max_s >= 0.04
+    assert monitor.lag_s >= 0
+    assert len(trigger.measurements) == monitor.statistics().count
+    assert trigger.measurements[0].label == "event loop lag"
+
+
+async def test_lag_monitor_without_timer() -> None:
+    monitor = EventLoopLagMonitor(interval=0.001)
+    monitor.start(get_running_loop())
+
+    with pytest.raises(RuntimeError):
+        monitor.start()
+
+    await sleep(0.01)
+    monitor.stop()
+    monitor.stop()
+
+    assert monitor.statistics().count > 0
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from threading import Thread
+from typing import Optional, Sequence
+
+import pytest
+
+from pytimers.batching import MeasurementBuffer
+from pytimers.labels import LABEL_REGISTRY
+from pytimers.measurement import Measurement
+from pytimers.timer import Timer
+from pytimers.triggers.batch_trigger import BatchTrigger, DECORATOR_FLAG
+from pytimers.triggers.dummy_trigger import DummyTrigger
+
+
+class RecordingBatchTrigger(BatchTrigger):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[tuple[list[float], list[Optional[str]], list[int]]] = []
+
+    def consume_batch(
+        self,
+        durations: Sequence[float],
+        labels: Sequence[Optional[str]],
+        flags: Sequence[int],
+    ) -> None:
+        self.batches.append((list(durations), list(labels), list(flags)))
+
+
+@pytest.fixture()
+def batch_trigger() -> RecordingBatchTrigger:
+    return RecordingBatchTrigger()
+
+
+def test_buffer_drain_empties_buffer() -> None:
+    buffer = MeasurementBuffer()
+    assert buffer.append(1.0, 3, 0) == 1
+
+    durations, label_ids, flags = buffer.drain()
+
+    assert list(durations) == [1.0]
+    assert list(label_ids) == [3]
+    assert list(flags) == [0]
+    assert len(buffer.drain()[0]) == 0
+
+
+def test_timer_buffers_until_flush(batch_trigger: RecordingBatchTrigger) -> None:
+    timer = Timer(triggers=[batch_trigger], flush_interval=None)
+
+    @timer
+    def decorated() -> None:
+        pass
+
+    with timer.label("label"):
+        decorated()
+
+    assert batch_trigger.batches == []
+
+    timer.flush()
+
+    assert len(batch_trigger.batches) == 1
+    durations, labels, flags = batch_trigger.batches[0]
+    assert len(durations) == 2
+    assert labels == [decorated.__qualname__, "label"]
+    assert flags == [DECORATOR_FLAG, 0]
+
+
+def test_timer_buffers_empty_label(batch_trigger: RecordingBatchTrigger) -> None:
+    timer = Timer(triggers=[batch_trigger], flush_interval=None)
+
+    with timer.label(""):
+        pass
+    with timer:
+        pass
+    timer.flush()
+
+    _, labels, _ = batch_trigger.batches[0]
+    assert labels == ["", None]
+
+
+def test_timer_flushes_by_size(batch_trigger: RecordingBatchTrigger) -> None:
+    timer = Timer(triggers=[batch_trigger], batch_size=2, flush_interval=None)
+
+    for _ in range(5):
+        with timer:
+            pass
+
+    assert [len(batch[0]) for batch in batch_trigger.batches] == [2, 2]
+
+
+def test_timer_flushes_by_interval(batch_trigger: RecordingBatchTrigger) -> None:
+    timer = Timer(triggers=[batch_trigger], flush_interval=0.0)
+
+    with timer:
+        pass
+
+    assert len(batch_trigger.batches) == 1
+
+
+def test_timer_flush_skips_empty_buffers(
+    batch_trigger: RecordingBatchTrigger,
+) -> None:
+    timer = Timer(triggers=[batch_trigger], flush_interval=None)
+    with timer:
+        pass
+    timer.flush()
+
+    timer.flush()
+
+    assert len(batch_trigger.batches) == 1
+
+
+def test_timer_flushes_buffers_of_other_threads(
+    batch_trigger: RecordingBatchTrigger,
+) -> None:
+    timer = Timer(triggers=[batch_trigger], flush_interval=None)
+
+    def timed_block() -> None:
+        with timer:
+            pass
+
+    threads = [Thread(target=timed_block) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    timer.flush()
+
+    assert sum(len(batch[0]) for batch in batch_trigger.batches) == 4
+    assert timer._buffers == []
+
+
+def test_timer_calls_other_triggers_immediately(
+    batch_trigger: RecordingBatchTrigger,
+) -> None:
+    trigger = DummyTrigger()
+    timer = Timer(triggers=[batch_trigger, trigger], flush_interval=None)
+
+    with timer:
+        pass
+
+    assert len(trigger.calls) == 1
+    assert batch_trigger.batches == []
+
+
+def test_batch_trigger_consumes_single_measurement(
+    batch_trigger: RecordingBatchTrigger,
+) -> None:
+    batch_trigger(1.0, True, "label")
+
+    assert batch_trigger.batches == [([1.0], ["label"], [DECORATOR_FLAG])]
+
+
+def test_timer_passes_label_ids_to_opted_in_triggers() -> None:
+    id_batches = []
+
+    class IdBatchTrigger(RecordingBatchTrigger):
+        def consume_id_batch(
+            self,
+            durations: Sequence[float],
+            label_ids: Sequence[int],
+            flags: Sequence[int],
+        ) -> None:
+            id_batches.append(list(label_ids))
+
+    timer = Timer(triggers=[IdBatchTrigger()], flush_interval=None)
+
+    with timer.label("label"):
+        pass
+    with timer:
+        pass
+    timer.flush()
+
+    assert id_batches == [[LABEL_REGISTRY.intern("label"), 0]]
+
+
+def test_timer_interns_labels_of_foreign_measurements(
+    batch_trigger: RecordingBatchTrigger,
+) -> None:
+    timer = Timer(triggers=[batch_trigger], flush_interval=None)
+
+    timer._finish_timing(Measurement(1.0, False, "foreign label"))
+    timer.flush()
+
+    assert batch_trigger.batches == [([1.0], ["foreign label"], [0])]
@@ -0,0 +1,105 @@
+import os
+import subprocess
+import sys
+from typing import Tuple
+
+
+# Times a labelled code block and a decorated call with a single function trigger
+# against the timer of the baseline version, which passed the duration straight
+# to the triggers, and prints both cost ratios.
+BENCHMARK = """
+from timeit import default_timer, timeit
+
+from decorator import decorate
+
+from pytimers.clock import Clock
+from pytimers.timer import STARTED_CLOCK_VAR, Timer
+
+
+def trigger(duration_s, decorator, label):
+    pass
+
+
+class BaselineTimer:
+    def __enter__(self):
+        clock = Clock("label")
+        STARTED_CLOCK_VAR.set(STARTED_CLOCK_VAR.get().push(clock))
+        return clock
+
+    def __exit__(self, *exc_info):
+        clock, clock_stack = STARTED_CLOCK_VAR.get().pop()
+        STARTED_CLOCK_VAR.set(clock_stack)
+        clock.stop()
+        trigger(clock.duration(), False, clock.label)
+
+
+def baseline_wrapper(wrapped, *args, **kwargs):
+    start_time = default_timer()
+    output = wrapped(*args, **kwargs)
+    trigger(default_timer() - start_time, True, wrapped.__qualname__)
+    return output
+
+
+def function():
+    pass
+
+
+timer = Timer([trigger])
+baseline_timer = BaselineTimer()
+
+
+def block():
+    with timer.label("label"):
+        pass
+
+
+def baseline_block():
+    with baseline_timer:
+        pass
+
+
+def cost_ratio(statement, baseline):
+    # interleaved so that noise of a busy machine hits both statements alike
+    costs = []
+    baseline_costs = []
+    for _ in range(100):
+        costs.append(timeit(statement, number=2000))
+        baseline_costs.append(timeit(baseline, number=2000))
+    return min(costs) / min(baseline_costs)
+
+
+print(
+    cost_ratio(block, baseline_block),
+    cost_ratio(timer(function), decorate(function, baseline_wrapper)),
+)
+"""
+
+
+def cost_ratios() -> Tuple[float, float]:
+    """Runs the benchmark in a fresh interpreter not traced by coverage and returns
+    the cost ratios of a code block and of a decorated call.
+    """
+
+    env = {
+        name: value
+        for name, value in os.environ.items()
+        if not name.startswith("COV_CORE_")
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", BENCHMARK],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    block, call = result.stdout.split()
+    return float(block), float(call)
+
+
+def test_measurement_cost_budget() -> None:
+    block, call = cost_ratios()
+
+    # the measurement record, nesting and trigger dispatch may cost up to 75 %
+    # on top of the bare timing done by the baseline version
+    assert block < 1.75
+    assert call < 1.75
@@ -0,0 +1,217 @@
+from typing import Any, List, Tuple
+
+import pytest
+
+from pytimers.comparison import ALTERNATE, Comparison
+from pytimers.timer import Timer
+from pytimers.triggers.dummy_trigger import DummyTrigger
+
+
+def baseline(x: int) -> int:
+    return x * 2
+
+
+def candidate(x: int) -> int:
+    return x + x
+
+
+def wrong_candidate(x: int) -> int:
+    return x * 3
+
+
+def failing_candidate(x: int) -> int:
+    raise KeyError(x)
+
+
+def test_shadow_mode_times_both_implementations() -> None:
+    trigger = DummyTrigger()
+    timer = Timer(triggers=[trigger])
+    decorated = timer.compare(candidate=candidate, fraction=1.0)(baseline)
+
+    assert decorated(3) == 6
+    assert decorated(4) == 8
+
+    comparison = decorated.comparison
+    assert comparison.compared == 2
+    assert comparison.mismatches == 0
+    labels = sorted(str(measurement.label) for measurement in trigger.measurements)
+    assert labels == [
+        "baseline[baseline]",
+        "baseline[baseline]",
+        "baseline[candidate]",
+        "baseline[candidate]",
+    ]
+    assert all(measurement.decorator for measurement in trigger.measurements)
+
+
+def test_unsampled_calls_are_timed_as_usual() -> None:
+    trigger = DummyTrigger()
+    timer = Timer(triggers=[trigger])
+    decorated = timer.compare(candidate=wrong_candidate, fraction=0.0)(baseline)
+
+    assert decorated(3) == 6
+
+    assert decorated.comparison.compared == 0
+    (measurement,) = trigger.measurements
+    assert measurement.label == "baseline"
+
+
+def test_mismatch_is_reported() -> None:
+    mismatches: List[Tuple[Any, ...]] = []
+    timer = Timer()
+    decorated = timer.compare(
+        candidate=wrong_candidate,
+        fraction=1.0,
+        on_mismatch=lambda *arguments: mismatches.append(arguments),
+    )(baseline)
+
+    assert decorated(3) == 6
+    assert decorated(x=0) == 0
+
+    assert decorated.comparison.compared == 2
+    assert decorated.comparison.mismatches == 1
+    assert mismatches == [((3,), {}, 6, 9)]
+
+
+def test_failing_mismatch_callback_is_not_propagated() -> None:
+    def on_mismatch(*arguments: Any) -> None:
+        raise RuntimeError
+
+    timer = Timer()
+    decorated = timer.compare(
+        candidate=wrong_candidate, fraction=1.0, on_mismatch=on_mismatch
+    )(baseline)
+
+    assert decorated(1) == 2
+    assert decorated.comparison.mismatches == 1
+    assert decorated.comparison.failed_callbacks == 1
+
+
+def test_custom_equality() -> None:
+    timer = Timer()
+    decorated = timer.compare(
+        candidate=wrong_candidate,
+        fraction=1.0,
+        equal=lambda first, second: first % 3 == second % 3,
+    )(baseline)
+    decorated(3)
+    decorated(4)
+
+    assert decorated.comparison.mismatches == 1
+
+
+def test_failing_equality_is_mismatch() -> None:
+    def equal(first: Any, second: Any) -> bool:
+        raise TypeError
+
+    timer = Timer()
+    decorated = timer.compare(candidate=candidate, fraction=1.0, equal=equal)(
+        baseline
+    )
+
+    assert decorated(3) == 6
+    assert decorated.comparison.mismatches == 1
+
+
+def test_candidate_exception_is_not_propagated() -> None:
+    mismatches: List[Tuple[Any, ...]] = []
+    trigger = DummyTrigger()
+    timer = Timer(triggers=[trigger])
+    decorated = timer.compare(
+        candidate=failing_candidate,
+        fraction=1.0,
+        on_mismatch=lambda *arguments: mismatches.append(arguments),
+    )(baseline)
+
+    assert decorated(3) == 6
+
+    ((args, kwargs, output, exc),) = mismatches
+    assert (args, kwargs, output) == ((3,), {}, 6)
+    assert isinstance(exc, KeyError)
+    failed = [m for m in trigger.measurements if m.failed]
+    assert [m.label for m in failed] == ["baseline[candidate]"]
+
+
+def test_baseline_exception_is_propagated() -> None:
+    def failing(x: int) -> int:
+        raise KeyError(x)
+
+    timer = Timer()
+    decorated = timer.compare(candidate=failing_candidate, fraction=1.0)(failing)
+
+    with pytest.raises(KeyError):
+        decorated(3)
+    assert decorated.comparison.compared == 1
+    assert decorated.comparison.mismatches == 0
+
+
+def test_alternate_mode_runs_one_implementation() -> None:
+    trigger = DummyTrigger()
+    timer = Timer(triggers=[trigger], cpu_timer=lambda: 0.0, gc_pauses=True)
+    decorated = timer.compare(
+        candidate=wrong_candidate, fraction=1.0, mode="alternate"
+    )(baseline)
+
+    outputs = {decorated(1) for _ in range(200)}
+
+    assert outputs == {2, 3}
+    assert len(trigger.measurements) == 200
+    assert decorated.comparison.compared == 0
+    assert decorated.comparison.mismatches == 0
+    assert decorated.comparison.speedup() is not None
+
+
+def test_alternate_mode_propagates_exceptions() -> None:
+    timer = Timer()
+    decorated = timer.compare(
+        candidate=failing_candidate, fraction=1.0, mode=ALTERNATE
+    )(failing_candidate)
+
+    with pytest.raises(KeyError):
+        decorated(1)
+
+
+def test_shadow_speedup() -> None:
+    comparison = Comparison("label", candidate)
+    assert comparison.speedup() is None
+
+    for baseline_s, candidate_s in ((2.0, 1.0), (4.1, 2.0), (3.9, 2.0)):
+        comparison.add_pair((None, None, baseline_s), (None, None, candidate_s), (), {})
+
+    estimate = comparison.speedup()
+    assert estimate is not None
+    speedup, lower, upper = estimate
+    assert lower < speedup < upper
+    assert speedup == pytest.approx(2.0, rel=0.02)
+
+
+def test_alternate_speedup() -> None:
+    comparison = Comparison("label", candidate, mode=ALTERNATE)
+    comparison.add_single(1.0, candidate=False)
+    comparison.add_single(1.1, candidate=False)
+    comparison.add_single(0.5, candidate=True)
+    assert comparison.speedup() is None
+
+    comparison.add_single(0.55, candidate=True)
+    comparison.add_single(0.0, candidate=True)
+
+    estimate = comparison.speedup(z=0.0)
+    assert estimate is not None
+    speedup, lower, upper = estimate
+    assert speedup == lower == upper
+    assert speedup > 2.0
+
+
+def test_unknown_mode() -> None:
+    with pytest.raises(ValueError):
+        Timer().compare(candidate=candidate, mode="canary")
+    with pytest.raises(ValueError):
+        Comparison("label", candidate, mode="canary")
+
+
+def test_coroutine_function_can_not_be_compared() -> None:
+    async def coroutine_function(x: int) -> int:
+        return x
+
+    with pytest.raises(TypeError):
+        Timer().compare(candidate=candidate)(coroutine_function)
@@ -0,0 +1,113 @@
+import json
+from time import sleep
+from typing import Any
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import pytest
+
+from pytimers.active_clocks import ACTIVE_CLOCKS
+from pytimers.dashboard import TimingDashboard
+from pytimers.measurement import Measurement
+from pytimers.timer import Timer
+from pytimers.triggers.aggregating_trigger import AggregatingTrigger
+
+
+def fetch(url: str) -> Any:
+    with urlopen(url, timeout=5) as response:
+        assert response.headers["Content-Type"] == "application/json"
+        return json.loads(response.read())
+
+
+def test_dashboard_serves_statistics() -> None:
+    aggregating_trigger = AggregatingTrigger()
+    timer = Timer([aggregating_trigger], flush_interval=None)
+    for _ in range(3):
+        with timer.label("label"):
+            pass
+    with pytest.raises(ValueError):
+        with timer.label("label"):
+            raise ValueError
+    timer.flush()
+
+    with TimingDashboard(aggregating_trigger, refresh_interval=60.0) as dashboard:
+        (label,) = fetch(dashboard.url + "labels")
+
+    assert label["label"] == "label"
+    assert label["count"] == 4
+    assert label["errors"] == 1
+    assert label["min_s"] <= label["p50_s"] <= label["p99_s"] <= label["max_s"]
+
+
+def test_dashboard_refreshes_statistics_periodically() -> None:
+    aggregating_trigger = AggregatingTrigger()
+    aggregating_trigger.consume_batch([1.0], ["label"], [0])
+
+    with TimingDashboard(aggregating_trigger, refresh_interval=0.01) as dashboard:
+        assert dashboard.labels()[0]["count"] == 1
+        aggregating_trigger.consume_batch([1.0], ["label"], [0])
+        while dashboard.labels()[0]["count"] == 1:
+            sleep(0.01)
+
+
+def test_dashboard_serves_in_flight_clocks() -> None:
+    timer = Timer()
+
+    with TimingDashboard() as dashboard:
+        with timer.label("outer"):
+            with timer.label("inner"):
+                content = fetch(dashboard.url)
+                in_flight = fetch(dashboard.url + "in-flight")
+
+    assert content["labels"] == []
+    outer, inner = content["in_flight"]
+    assert outer["label"] == "outer"
+    assert inner["parent_label"] == "outer"
+    assert outer["parent_label"] is None
+    assert outer["current_duration_s"] >= inner["current_duration_s"] >= 0.0
+    assert [clock["label"] for clock in in_flight] == ["outer", "inner"]
+    assert not ACTIVE_CLOCKS.enabled
+
+
+def test_dashboard_serves_recent_slow_calls() -> None:
+    dashboard = TimingDashboard(slow_threshold_s=1.0, max_slow_calls=2)
+    timer = Timer([dashboard])
+    timer.record(Measurement(0.5, False, "fast"))
+    timer.record(Measurement(1.0, False, "first"))
+    timer.record(Measurement(2.0, True, "second", start_time=1.0, exc_type=KeyError))
+    timer.record(Measurement(3.0, False, "third"))
+
+    with dashboard:
+        slow_calls = fetch(dashboard.url + "slow-calls/")
+
+    assert [call["label"] for call in slow_calls] == ["third", "second"]
+    assert slow_calls[0]["exception"] is None
+    assert slow_calls[0]["start_time"] is None
+    assert slow_calls[1]["exception"] == "KeyError"
+    assert slow_calls[1]["start_time"] > 1.0
+
+
+def test_dashboard_returns_not_found() -> None:
+    with TimingDashboard() as dashboard:
+        with pytest.raises(HTTPError) as error:
+            fetch(dashboard.url + "unknown")
+
+    assert error.value.code == 404
+
+
+def test_dashboard_start_and_stop() -> None:
+    dashboard = TimingDashboard()
+    assert not dashboard.running
+    with pytest.raises(RuntimeError):
+        dashboard.url
+
+    dashboard.start()
+    try:
+        assert dashboard.running
+        with pytest.raises(RuntimeError):
+            dashboard.start()
+    finally:
+        dashboard.stop()
+    dashboard.stop()
+
+    assert not dashboard.running
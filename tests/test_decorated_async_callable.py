@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import inspect
-from typing import Awaitable, Callable
+from asyncio import sleep
+from time import thread_time
+from typing import Awaitable, Callable, Iterator
 
 import pytest
 
@@ -228,3 +230,62 @@ async def test_decorator_calls_trigger(
     await decorated_callable(1)
 
     assert len(trigger.calls) == 1
+
+
+async def test_decorator_measures_cpu_duration() -> None:
+    trigger = DummyTrigger()
+    timer = Timer(triggers=[trigger], cpu_timer=thread_time)
+
+    @timer
+    async def callable_name() -> None:
+        await sleep(0.01)
+
+    await callable_name()
+
+    measurement = trigger.measurements[0]
+    assert measurement.cpu_duration_s is not None
+    assert measurement.wait_duration_s is not None
+    assert 0 < measurement.wait_duration_s <= measurement.duration_s
+
+
+async def test_decorator_times_failed_call(
+    trigger: DummyTrigger, timer: Timer
+) -> None:
+    @timer
+    async def callable_name() -> None:
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        await callable_name()
+
+    assert len(trigger.measurements) == 1
+    assert trigger.measurements[0].exc_type is ValueError
+
+
+async def test_decorator_by_passes_key(trigger: DummyTrigger, timer: Timer) -> None:
+    @timer.by(lambda items: len(items))
+    async def callable_name(items: list[int]) -> int:
+        return sum(items)
+
+    @timer.by(lambda items: len(items))
+    async def failing(items: list[int]) -> None:
+        raise ValueError()
+
+    assert await callable_name([1, 2, 3]) == 6
+    with pytest.raises(ValueError):
+        await failing([1])
+
+    assert [measurement.key for measurement in trigger.measurements] == [3, 1]
+
+
+async def test_decorator_by_survives_failing_key(
+    trigger: DummyTrigger, timer: Timer
+) -> None:
+    @timer.by(lambda items: len(items))
+    async def callable_name(items: Iterator[int]) -> int:
+        return sum(items)
+
+    assert await callable_name(iter([1, 2, 3])) == 6
+
+    assert trigger.measurements[0].key is None
+    assert timer.key_errors == 1
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import inspect
-from typing import Callable
+import random
+from time import sleep, thread_time
+from typing import Callable, Iterator
 
 import pytest
 
 from pytimers import Timer
+from pytimers.labels import LABEL_REGISTRY
 from pytimers.triggers.dummy_trigger import DummyTrigger
 
 
@@ -220,3 +223,160 @@ def test_decorator_calls_trigger(
     decorated_callable(1)
 
     assert len(trigger.calls) == 1
+
+
+def test_decorator_measures_cpu_duration() -> None:
+    trigger = DummyTrigger()
+    timer = Timer(triggers=[trigger], cpu_timer=thread_time)
+
+    @timer
+    def callable_name() -> None:
+        sleep(0.01)
+
+    callable_name()
+
+    measurement = trigger.measurements[0]
+    assert measurement.cpu_duration_s is not None
+    assert measurement.wait_duration_s is not None
+    assert 0 < measurement.wait_duration_s <= measurement.duration_s
+
+
+def test_decorator_without_cpu_timer_skips_cpu_duration(
+    trigger: DummyTrigger, timer: Timer
+) -> None:
+    @timer
+    def callable_name() -> None:
+        pass
+
+    callable_name()
+
+    assert trigger.measurements[0].cpu_duration_s is None
+    assert trigger.measurements[0].wait_duration_s is None
+
+
+def test_decorator_passes_parent_label(trigger: DummyTrigger, timer: Timer) -> None:
+    @timer
+    def callable_name() -> None:
+        pass
+
+    with timer.label("parent"):
+        callable_name()
+
+    assert (
+        trigger.measurements[0].label
+        == "test_decorator_passes_parent_label.<locals>.callable_name"
+    )
+    assert trigger.measurements[0].parent_label == "parent"
+
+
+def test_decorator_interns_label(trigger: DummyTrigger, timer: Timer) -> None:
+    @timer
+    def callable_name() -> None:
+        pass
+
+    label_id = LABEL_REGISTRY.intern(callable_name.__qualname__)
+    callable_name()
+
+    assert trigger.measurements[0].label_id == label_id
+
+
+def test_decorator_times_failed_call(trigger: DummyTrigger, timer: Timer) -> None:
+    @timer
+    def callable_name() -> None:
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        callable_name()
+
+    assert len(trigger.measurements) == 1
+    assert trigger.measurements[0].exc_type is ValueError
+    assert trigger.measurements[0].failed
+
+
+def test_decorator_times_failed_call_with_cpu_timer() -> None:
+    trigger = DummyTrigger()
+    timer = Timer(triggers=[trigger], cpu_timer=thread_time)
+
+    @timer
+    def callable_name() -> None:
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        callable_name()
+
+    assert trigger.measurements[0].cpu_duration_s is not None
+
+
+def test_decorator_marks_successful_call(trigger: DummyTrigger, timer: Timer) -> None:
+    @timer
+    def callable_name() -> None:
+        pass
+
+    callable_name()
+
+    assert trigger.measurements[0].exc_type is None
+    assert not trigger.measurements[0].failed
+
+
+def test_decorator_by_passes_key(trigger: DummyTrigger, timer: Timer) -> None:
+    @timer.by(lambda items, factor=1: len(items) * factor)
+    def callable_name(items: list[int], factor: int = 1) -> int:
+        return sum(items) * factor
+
+    assert callable_name([1, 2, 3], factor=2) == 12
+    assert inspect.signature(callable_name).parameters["factor"].default == 1
+
+    assert trigger.measurements[0].key == 6
+    assert trigger.measurements[0].label == callable_name.__qualname__
+
+
+def test_decorator_by_passes_key_of_failed_call(
+    trigger: DummyTrigger, timer: Timer
+) -> None:
+    @timer.by(lambda items: len(items))
+    def callable_name(items: list[int]) -> None:
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        callable_name([1])
+
+    assert trigger.measurements[0].key == 1
+
+
+def test_decorator_by_survives_failing_key(
+    trigger: DummyTrigger, timer: Timer
+) -> None:
+    @timer.by(lambda items: len(items))
+    def callable_name(items: Iterator[int]) -> int:
+        return sum(items)
+
+    assert callable_name(iter([1, 2, 3])) == 6
+
+    assert trigger.measurements[0].key is None
+    assert timer.key_errors == 1
+
+
+def test_decorator_by_samples_key(
+    trigger: DummyTrigger, timer: Timer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    evaluated = []
+
+    def key(items: list[int]) -> int:
+        evaluated.append(items)
+        return len(items)
+
+    # random is imported once the sampled key is created
+    draws = iter([0.75, 0.25])
+    monkeypatch.setattr(random, "random", lambda: next(draws))
+
+    @timer.by(key, sample_rate=0.5)
+    def callable_name(items: list[int]) -> None:
+        pass
+
+    callable_name([1])
+    callable_name([1, 2])
+
+    assert len(trigger.measurements) == 2
+    assert trigger.measurements[0].key is None
+    assert trigger.measurements[1].key == 2
+    assert evaluated == [[1, 2]]
@@ -0,0 +1,211 @@
+import os
+import pickle
+from asyncio import get_running_loop
+from concurrent.futures import CancelledError
+from concurrent.futures.process import BrokenProcessPool
+from time import sleep, thread_time
+from typing import List
+
+import pytest
+
+from pytimers.executors import (
+    MeasurementBatch,
+    TimedProcessPoolExecutor,
+    TimedThreadPoolExecutor,
+    _run_in_worker,
+)
+from pytimers.measurement import Measurement
+from pytimers.timer import Timer
+from pytimers.triggers.dummy_trigger import DummyTrigger
+
+
+worker_timer = Timer(cpu_timer=thread_time)
+
+
+@worker_timer
+def square(value: int) -> int:
+    with worker_timer.label("outer"):
+        with worker_timer.label("nested"):
+            return value * value
+
+
+@worker_timer
+def fail(value: int) -> None:
+    raise KeyError(value)
+
+
+def wait(seconds: float) -> float:
+    sleep(seconds)
+    return seconds
+
+
+def crash() -> None:
+    os._exit(1)
+
+
+def timed_block(timer: Timer) -> None:
+    with timer.label("worker"):
+        pass
+
+
+@pytest.fixture()
+def trigger() -> DummyTrigger:
+    return DummyTrigger()
+
+
+def test_propagate_carries_clock_into_thread(trigger: DummyTrigger) -> None:
+    timer = Timer([trigger])
+
+    def work() -> None:
+        with timer.label("worker"):
+            pass
+
+    with TimedThreadPoolExecutor(max_workers=2) as executor:
+        with timer.label("request"):
+            propagated = timer.propagate(work)
+        executor.submit(propagated).result()
+        executor.submit(propagated).result()
+
+    assert [m.parent_label for m in trigger.measurements] == [
+        None,
+        "request",
+        "request",
+    ]
+
+
+def test_thread_pool_executor_propagates_context(trigger: DummyTrigger) -> None:
+    timer = Timer([trigger])
+
+    with TimedThreadPoolExecutor(max_workers=2) as executor:
+        with timer.label("request") as clock:
+            futures = [executor.submit(timed_block, timer) for _ in range(3)]
+            for future in futures:
+                future.result()
+
+    worker_measurements = trigger.measurements[:3]
+    assert all(m.parent_clock is clock for m in worker_measurements)
+
+
+async def test_thread_pool_executor_propagates_context_to_event_loop(
+    trigger: DummyTrigger,
+) -> None:
+    timer = Timer([trigger])
+
+    with TimedThreadPoolExecutor(max_workers=1) as executor:
+        with timer.label("request"):
+            await get_running_loop().run_in_executor(executor, timed_block, timer)
+
+    assert trigger.measurements[0].parent_label == "request"
+
+
+def test_process_pool_executor_returns_worker_measurements(
+    trigger: DummyTrigger,
+) -> None:
+    timer = Timer([trigger])
+
+    with TimedProcessPoolExecutor(timer, max_workers=2) as executor:
+        with timer.label("request") as clock:
+            results = list(executor.map(square, [1, 2, 3]))
+            future = executor.submit(square, 4)
+            assert future.result() == 16
+
+    assert results == [1, 4, 9]
+    worker_measurements = trigger.measurements[:-1]
+    assert len(worker_measurements) == 12
+    nested = [m for m in worker_measurements if m.label == "nested"]
+    top_level = [m for m in worker_measurements if m.label != "nested"]
+    calls = [m for m in worker_measurements if m.decorator]
+    assert len(nested) == len(calls) == 4
+    assert all(m.parent_label == "outer" for m in nested)
+    assert all(m.parent_clock is None for m in nested)
+    assert all(m.parent_label == "request" for m in top_level)
+    assert all(m.parent_clock is clock for m in top_level)
+    assert all(m.cpu_duration_s is not None for m in calls)
+    assert all(m.label_id is None for m in calls)
+
+
+def test_process_pool_executor_returns_measurements_of_failed_call(
+    trigger: DummyTrigger,
+) -> None:
+    timer = Timer([trigger])
+
+    with TimedProcessPoolExecutor(timer, max_workers=1) as executor:
+        future = executor.submit(fail, 1)
+        with pytest.raises(KeyError):
+            future.result()
+
+    (measurement,) = trigger.measurements
+    assert measurement.exc_type is KeyError
+    assert measurement.parent_label is None
+    assert not hasattr(future.exception(), "_pytimers_batch")
+
+
+def test_process_pool_executor_cancels_futures(trigger: DummyTrigger) -> None:
+    timer = Timer([trigger])
+
+    with TimedProcessPoolExecutor(timer, max_workers=1) as executor:
+        running = executor.submit(wait, 0.2)
+        queued = [executor.submit(wait, 0.0) for _ in range(3)]
+        sleep(0.1)
+        running.cancel()
+        queued[-1].cancel()
+        for future in queued[:-1]:
+            future.result()
+
+    assert running.cancelled()
+    with pytest.raises(CancelledError):
+        queued[-1].result()
+
+
+def test_process_pool_executor_propagates_broken_pool(trigger: DummyTrigger) -> None:
+    timer = Timer([trigger])
+
+    with TimedProcessPoolExecutor(timer, max_workers=1) as executor:
+        with pytest.raises(BrokenProcessPool):
+            executor.submit(crash).result()
+
+    assert trigger.measurements == []
+
+
+def test_measurement_batch_is_compact_and_picklable() -> None:
+    measurements: List[Measurement] = [
+        Measurement(1.0, True, "label"),
+        Measurement(2.0, False, "label", cpu_duration_s=0.5, parent_label="parent"),
+        Measurement(3.0, False, None, exc_type=ValueError),
+    ]
+
+    batch = pickle.loads(pickle.dumps(MeasurementBatch(measurements)))
+
+    assert len(batch) == 3
+    assert batch.labels == ["label", None, "parent"]
+    decoded = batch.decode()
+    assert [m.duration_s for m in decoded] == [1.0, 2.0, 3.0]
+    assert [m.decorator for m in decoded] == [True, False, False]
+    assert [m.cpu_duration_s for m in decoded] == [None, 0.5, None]
+    assert [m.parent_label for m in decoded] == [None, "parent", None]
+    assert [m.exc_type for m in decoded] == [None, None, ValueError]
+
+
+def test_worker_collects_measurements_in_empty_context(trigger: DummyTrigger) -> None:
+    timer = Timer([trigger])
+
+    with timer.label("parent"):
+        result, batch = _run_in_worker(square, 3)
+        with pytest.raises(KeyError) as error:
+            _run_in_worker(fail, 1)
+
+    assert result == 9
+    assert [m.label for m in batch.decode()] == ["nested", "outer", "square"]
+    assert batch.decode()[1].parent_label is None
+    (failed,) = error.value.__dict__["_pytimers_batch"].decode()
+    assert failed.exc_type is KeyError
+    assert trigger.measurements[0].label == "parent"
+
+
+def test_worker_does_not_call_local_triggers(trigger: DummyTrigger) -> None:
+    timer = Timer([trigger])
+
+    _, batch = _run_in_worker(timed_block, timer)
+
+    assert [m.label for m in batch.decode()] == ["worker"]
+    assert trigger.measurements == []
@@ -0,0 +1,174 @@
+import asyncio
+import gc
+from logging import INFO
+from typing import Iterator
+
+import pytest
+from _pytest.logging import LogCaptureFixture
+
+from pytimers.exceptions import ClockStillRunning
+from pytimers.gc_tracking import GCPauseTracker, GC_PAUSES
+from pytimers.measurement import Measurement
+from pytimers.timer import Timer
+from pytimers.triggers.batch_trigger import GC_FLAG, measurement_flags
+from pytimers.triggers.dummy_trigger import DummyTrigger
+from pytimers.triggers.logger_trigger import LoggerTrigger
+
+
+@pytest.fixture()
+def trigger() -> Iterator[DummyTrigger]:
+    yield DummyTrigger()
+    GC_PAUSES.disable()
+
+
+def test_tracker_enable_and_disable() -> None:
+    tracker = GCPauseTracker()
+    tracker.enable()
+    tracker.enable()
+    try:
+        assert gc.callbacks.count(tracker._callback) == 1
+        snapshot = tracker.snapshot()
+        gc.collect()
+        pause_s, collections = tracker.since(snapshot)
+    finally:
+        tracker.disable()
+    tracker.disable()
+
+    assert tracker._callback not in gc.callbacks
+    assert pause_s > 0.0
+    assert collections[2] >= 1
+    assert tracker.snapshot() == (tracker.pause_s, tuple(tracker.collections))
+
+
+def test_tracker_counts_users() -> None:
+    tracker = GCPauseTracker()
+    tracker.acquire()
+    tracker.acquire()
+    tracker.release()
+
+    assert tracker._callback in gc.callbacks
+
+    tracker.release()
+    tracker.release()
+
+    assert tracker._callback not in gc.callbacks
+
+
+def test_timer_releases_tracker_once_collected(trigger: DummyTrigger) -> None:
+    first = Timer(triggers=[trigger], gc_pauses=True)
+    second = Timer(triggers=[trigger], gc_pauses=True)
+    del first
+    gc.collect()
+
+    assert GC_PAUSES.enabled
+
+    del second
+    gc.collect()
+
+    assert not GC_PAUSES.enabled
+
+
+def test_tracker_ignores_collection_stop_without_start() -> None:
+    tracker = GCPauseTracker()
+    tracker._callback("stop", {"generation": 0})
+
+    assert tracker.snapshot() == (0.0, (0,) * len(gc.get_count()))
+
+
+def test_code_block_measures_gc_pauses(trigger: DummyTrigger) -> None:
+    timer = Timer(triggers=[trigger], gc_pauses=True)
+    with timer.label("collecting") as clock:
+        gc.collect()
+
+    (measurement,) = trigger.measurements
+    assert measurement.gc_duration_s == clock.gc_duration()
+    assert measurement.gc_duration_s is not None
+    assert 0.0 < measurement.gc_duration_s <= measurement.duration_s
+    assert measurement.gc_collections is not None
+    assert measurement.gc_collections[2] >= 1
+    assert measurement.non_gc_duration_s == pytest.approx(
+        measurement.duration_s - measurement.gc_duration_s
+    )
+    assert clock.gc_duration(precision=3) == round(measurement.gc_duration_s, 3)
+    assert measurement_flags(measurement) & GC_FLAG
+
+
+def test_code_block_without_gc_pauses() -> None:
+    trigger = DummyTrigger()
+    with Timer(triggers=[trigger]) as clock:
+        gc.collect()
+
+    (measurement,) = trigger.measurements
+    assert clock.gc_duration() is None
+    assert clock.gc_collections() is None
+    assert measurement.gc_duration_s is None
+    assert measurement.non_gc_duration_s is None
+    assert not measurement_flags(measurement) & GC_FLAG
+
+
+def test_clock_protects_unfinished_gc_pauses(trigger: DummyTrigger) -> None:
+    timer = Timer(gc_pauses=True)
+    with timer as clock:
+        with pytest.raises(ClockStillRunning):
+            clock.gc_duration()
+        with pytest.raises(ClockStillRunning):
+            clock.gc_collections()
+
+
+def test_nested_code_blocks_share_gc_pauses(trigger: DummyTrigger) -> None:
+    timer = Timer(triggers=[trigger], gc_pauses=True)
+    with timer.label("outer"):
+        with timer.label("inner"):
+            gc.collect()
+
+    inner, outer = trigger.measurements
+    assert inner.gc_duration_s is not None and outer.gc_duration_s is not None
+    assert outer.gc_duration_s >= inner.gc_duration_s > 0.0
+
+
+def test_decorated_callable_measures_gc_pauses(trigger: DummyTrigger) -> None:
+    timer = Timer(triggers=[trigger], gc_pauses=True)
+
+    @timer
+    def collect() -> None:
+        gc.collect()
+
+    @timer
+    def fail() -> None:
+        gc.collect()
+        raise ValueError
+
+    collect()
+    with pytest.raises(ValueError):
+        fail()
+
+    for measurement in trigger.measurements:
+        assert measurement.gc_duration_s is not None
+        assert measurement.gc_duration_s > 0.0
+        assert measurement.gc_collections is not None
+        assert measurement.gc_collections[2] >= 1
+
+
+def test_decorated_coroutine_function_measures_gc_pauses(
+    trigger: DummyTrigger,
+) -> None:
+    timer = Timer(triggers=[trigger], gc_pauses=True)
+
+    @timer
+    async def collect() -> None:
+        gc.collect()
+
+    asyncio.run(collect())
+
+    (measurement,) = trigger.measurements
+    assert measurement.gc_duration_s is not None
+    assert measurement.gc_duration_s > 0.0
+
+
+def test_logger_trigger_formats_gc_duration(caplog: LogCaptureFixture) -> None:
+    trigger = LoggerTrigger(template="${gc_duration}", unmeasured_placeholder="-")
+    with caplog.at_level(INFO):
+        trigger.on_measurement(Measurement(1.0, False, "label", gc_duration_s=0.25))
+        trigger.on_measurement(Measurement(1.0, False, "label"))
+
+    assert [record.msg for record in caplog.records] == ["0.25", "-"]
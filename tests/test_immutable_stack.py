@@ -35,3 +35,15 @@ def test_len_empty() -> None:
 
 def test_len_from_sequence() -> None:
     assert len(ImmutableStack.create_from_iterable([1, 2, 3])) == 3
+
+
+def test_peek_empty() -> None:
+    with pytest.raises(IndexError):
+        ImmutableStack.create_empty().peek()
+
+
+def test_peek_keeps_stack() -> None:
+    stack = ImmutableStack.create_from_iterable([1, 2])
+
+    assert stack.peek() == 2
+    assert len(stack) == 2
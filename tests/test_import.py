@@ -0,0 +1,156 @@
+import subprocess
+import sys
+from logging import DEBUG, INFO
+from typing import Dict, Sequence
+
+import pytest
+from _pytest.logging import LogCaptureFixture
+
+import pytimers
+import pytimers.triggers
+from pytimers.triggers.aggregating_trigger import AggregatingTrigger
+from pytimers.triggers.dummy_trigger import DummyTrigger
+from pytimers.triggers.lazy_trigger import LazyTrigger
+from pytimers.triggers.logger_trigger import LoggerTrigger
+
+
+def import_times(statement: str) -> Dict[str, int]:
+    """Runs the statement in a fresh interpreter with ``-X importtime`` and returns
+    the cumulative import time in microseconds of every imported module.
+    """
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split(":", 1)[1].split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+def total_import_time(modules: Sequence[str]) -> int:
+    """Imports the modules in a fresh interpreter five times and returns the lowest
+    total cumulative import time in microseconds of the modules. :py:mod:`typing`
+    and :py:mod:`threading` needed by almost any application are imported in
+    advance and not included.
+    """
+
+    statement = f"import typing, threading; import {', '.join(modules)}"
+    return min(
+        sum(import_times(statement)[module] for module in modules) for _ in range(5)
+    )
+
+
+def test_import_time_budget() -> None:
+    lazy = total_import_time(["pytimers"])
+    # modules imported by `import pytimers` before they were deferred
+    eager = total_import_time(["decorator", "inspect", "logging", "pytimers"])
+
+    # the deferred modules make up most of an eager import
+    assert lazy < 0.5 * eager
+
+
+def test_import_loads_only_core_modules() -> None:
+    times = import_times("import pytimers")
+
+    assert {module for module in times if module.startswith("pytimers")} == {
+        "pytimers",
+        "pytimers.active_clocks",
+        "pytimers.clock",
+        "pytimers.exceptions",
+        "pytimers.immutable_stack",
+        "pytimers.labels",
+        "pytimers.measurement",
+        "pytimers.timer",
+        "pytimers.triggers",
+        "pytimers.triggers.base_trigger",
+        "pytimers.triggers.batch_trigger",
+        "pytimers.triggers.lazy_trigger",
+    }
+
+
+def test_import_does_not_load_heavy_modules() -> None:
+    times = import_times("import pytimers")
+
+    assert "pytimers" in times
+    for module in (
+        "asyncio",
+        "decorator",
+        "fnmatch",
+        "inspect",
+        "json",
+        "logging",
+        "random",
+        "string",
+        "urllib.request",
+        "weakref",
+        "pytimers.triggers.logger_trigger",
+        "pytimers.triggers.aggregating_trigger",
+        "pytimers.triggers.span_export_trigger",
+    ):
+        assert module not in times
+
+
+def test_decoration_loads_decorator_library() -> None:
+    times = import_times("import pytimers; pytimers.timer(lambda: None)")
+
+    assert "decorator" in times
+    assert "logging" not in times
+
+
+def test_lazy_attributes_are_resolved() -> None:
+    assert pytimers.__getattr__("LoggerTrigger") is LoggerTrigger
+    assert pytimers.triggers.__getattr__("AggregatingTrigger") is AggregatingTrigger
+    assert "SpanExportTrigger" in dir(pytimers)
+    assert "SpanExportTrigger" in dir(pytimers.triggers)
+
+
+def test_unknown_attribute_raises() -> None:
+    with pytest.raises(AttributeError):
+        pytimers.__getattr__("UnknownTrigger")
+    with pytest.raises(AttributeError):
+        pytimers.triggers.__getattr__("UnknownTrigger")
+
+
+def test_lazy_trigger_constructs_trigger_once() -> None:
+    constructed = []
+
+    def factory() -> DummyTrigger:
+        constructed.append(DummyTrigger())
+        return constructed[-1]
+
+    trigger = LazyTrigger(factory)
+    assert not constructed
+
+    trigger(1.0, False, "first")
+    trigger(2.0, False, "second")
+
+    assert len(constructed) == 1
+    assert constructed[0].calls == [(1.0, False, "first"), (2.0, False, "second")]
+
+
+def test_default_timer_logs(caplog: LogCaptureFixture) -> None:
+    with caplog.at_level(INFO):
+        with pytimers.timer.label("default"):
+            pass
+
+    assert len(caplog.records) == 1
+    assert "default" in caplog.records[0].getMessage()
+
+
+def test_lazy_trigger_forwards_attributes() -> None:
+    trigger = LazyTrigger(LoggerTrigger)
+
+    trigger.level = DEBUG
+
+    assert isinstance(trigger.trigger, LoggerTrigger)
+    assert trigger.trigger.level == DEBUG
+    assert trigger.level == DEBUG
+    with pytest.raises(AttributeError):
+        trigger._missing
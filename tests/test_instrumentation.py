@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from types import ModuleType
+from typing import Iterator
+
+import pytest
+
+from pytimers import Timer
+from pytimers.triggers.dummy_trigger import DummyTrigger
+
+
+MODULE_SOURCE = '''
+from os.path import join
+
+
+def public_function(a, b=1):
+    return a + b
+
+
+async def async_function(a):
+    return a
+
+
+def _private_function():
+    return 1
+'''
+
+
+class Service:
+    def method(self, a: int) -> int:
+        return a
+
+    async def async_method(self, a: int) -> int:
+        return a
+
+    @staticmethod
+    def static_method(a: int) -> int:
+        return a
+
+    @classmethod
+    def class_method(cls, a: int) -> int:
+        return a
+
+    def _private_method(self) -> int:
+        return 1
+
+    def generator(self) -> Iterator[int]:
+        yield 1
+
+    @property
+    def value(self) -> int:
+        return 1
+
+
+@pytest.fixture()
+def trigger() -> DummyTrigger:
+    return DummyTrigger()
+
+
+@pytest.fixture()
+def timer(trigger: DummyTrigger) -> Timer:
+    return Timer(triggers=[trigger])
+
+
+@pytest.fixture()
+def service_class() -> Iterator[type[Service]]:
+    original = dict(vars(Service))
+    yield Service
+    for name, attribute in original.items():
+        if name not in ("__dict__", "__weakref__"):
+            setattr(Service, name, attribute)
+
+
+@pytest.fixture()
+def module() -> ModuleType:
+    module = ModuleType("instrumented_module")
+    exec(MODULE_SOURCE, vars(module))
+    return module
+
+
+async def test_instrument_class_times_public_methods(
+    timer: Timer, trigger: DummyTrigger, service_class: type[Service]
+) -> None:
+    names = timer.instrument_class(service_class)
+
+    assert sorted(names) == ["async_method", "class_method", "method", "static_method"]
+
+    service = service_class()
+    assert service.method(1) == 1
+    assert await service.async_method(2) == 2
+    assert service.static_method(3) == 3
+    assert service_class.class_method(4) == 4
+    assert service._private_method() == 1
+    assert list(service.generator()) == [1]
+    assert service.value == 1
+
+    assert [measurement.label for measurement in trigger.measurements] == [
+        "Service.method",
+        "Service.async_method",
+        "Service.static_method",
+        "Service.class_method",
+    ]
+    assert all(measurement.decorator for measurement in trigger.measurements)
+
+
+def test_instrument_class_preserves_metadata(
+    timer: Timer, service_class: type[Service]
+) -> None:
+    original = service_class.method
+    timer.instrument_class(service_class)
+
+    assert service_class.method.__name__ == "method"
+    assert service_class.method.__wrapped__ is original  # type: ignore
+
+
+def test_instrument_class_with_include_and_exclude(
+    timer: Timer, service_class: type[Service]
+) -> None:
+    names = timer.instrument_class(
+        service_class,
+        include=["*method"],
+        exclude=["async_*"],
+    )
+
+    assert sorted(names) == [
+        "_private_method",
+        "class_method",
+        "method",
+        "static_method",
+    ]
+
+
+def test_instrument_class_twice_keeps_single_wrapper(
+    timer: Timer, trigger: DummyTrigger, service_class: type[Service]
+) -> None:
+    timer.instrument_class(service_class)
+
+    assert timer.instrument_class(service_class) == []
+
+    service_class().method(1)
+    assert len(trigger.measurements) == 1
+
+
+def test_uninstrument_class_restores_methods(
+    timer: Timer, trigger: DummyTrigger, service_class: type[Service]
+) -> None:
+    original = dict(vars(service_class))
+    timer.instrument_class(service_class)
+
+    names = timer.uninstrument(service_class)
+
+    assert sorted(names) == ["async_method", "class_method", "method", "static_method"]
+    assert dict(vars(service_class)) == original
+    service_class().method(1)
+    assert trigger.measurements == []
+
+
+def test_uninstrument_ignores_other_timers(
+    timer: Timer, service_class: type[Service]
+) -> None:
+    timer.instrument_class(service_class)
+
+    assert Timer().uninstrument(service_class) == []
+
+
+async def test_instrument_module_times_own_functions(
+    timer: Timer, trigger: DummyTrigger, module: ModuleType
+) -> None:
+    names = timer.instrument_module(module)
+
+    assert sorted(names) == ["async_function", "public_function"]
+    assert module.public_function(1) == 2
+    assert await module.async_function(1) == 1
+    assert [measurement.label for measurement in trigger.measurements] == [
+        "public_function",
+        "async_function",
+    ]
+
+
+def test_uninstrument_module_restores_functions(
+    timer: Timer, trigger: DummyTrigger, module: ModuleType
+) -> None:
+    original = module.public_function
+    timer.instrument_module(module)
+
+    timer.uninstrument(module)
+
+    assert module.public_function is original
+    module.public_function(1)
+    assert trigger.measurements == []
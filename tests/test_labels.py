@@ -0,0 +1,34 @@
+import pytest
+
+from pytimers.labels import LabelRegistry
+
+
+def test_registry_interns_none_as_zero() -> None:
+    registry = LabelRegistry()
+
+    assert registry.intern(None) == 0
+    assert registry.label(0) is None
+    assert len(registry) == 1
+
+
+def test_registry_assigns_consecutive_ids() -> None:
+    registry = LabelRegistry()
+
+    assert registry.intern("a") == 1
+    assert registry.intern("b") == 2
+    assert registry.intern("a") == 1
+    assert len(registry) == 3
+
+
+def test_registry_looks_up_labels() -> None:
+    registry = LabelRegistry()
+    a_id = registry.intern("a")
+    b_id = registry.intern("b")
+
+    assert registry.label(b_id) == "b"
+    assert registry.labels([b_id, 0, a_id]) == ["b", None, "a"]
+
+
+def test_registry_rejects_unknown_id() -> None:
+    with pytest.raises(IndexError):
+        LabelRegistry().label(1)
@@ -0,0 +1,31 @@
+from pytimers.measurement import Measurement
+
+
+def test_wait_duration_without_cpu_duration() -> None:
+    measurement = Measurement(1.0, False, "label")
+
+    assert measurement.wait_duration_s is None
+
+
+def test_wait_duration_is_never_negative() -> None:
+    measurement = Measurement(1.0, False, "label", cpu_duration_s=1.5)
+
+    assert measurement.wait_duration_s == 0
+
+
+def test_measurement_has_no_instance_dict() -> None:
+    measurement = Measurement(1.0, False, "label")
+
+    assert not hasattr(measurement, "__dict__")
+
+
+def test_measurement_repr() -> None:
+    measurement = Measurement(1.0, False, "label", thread_id=1)
+
+    assert repr(measurement) == (
+        "Measurement(duration_s=1.0, decorator=False, label='label', "
+        "cpu_duration_s=None, start_time=None, thread_id=1, task_name=None, "
+        "parent_label=None, label_id=None, exc_type=None, "
+        "active_duration_s=None, clock=None, parent_clock=None, stack_trace=None, "
+        "key=None, phases=None, gc_duration_s=None, gc_collections=None)"
+    )
@@ -0,0 +1,162 @@
+from threading import Thread
+from time import sleep
+from typing import List, Optional, Sequence
+
+import pytest
+
+from pytimers.measurement import Measurement
+from pytimers.overhead import OverheadGovernor, TriggerCost
+from pytimers.timer import Timer
+from pytimers.triggers.batch_trigger import BatchTrigger
+from pytimers.triggers.dummy_trigger import DummyTrigger
+
+
+class SlowTrigger(DummyTrigger):
+    def on_measurement(self, measurement: Measurement) -> None:
+        sleep(0.001)
+        super().on_measurement(measurement)
+
+
+class CountingBatchTrigger(BatchTrigger):
+    def __init__(self) -> None:
+        super().__init__()
+        self.consumed = 0
+
+    def consume_batch(
+        self,
+        durations: Sequence[float],
+        labels: Sequence[Optional[str]],
+        flags: Sequence[int],
+    ) -> None:
+        self.consumed += len(durations)
+
+
+def test_trigger_cost_mean() -> None:
+    assert TriggerCost().mean_s == 0.0
+    assert TriggerCost(4, 2.0).mean_s == 0.5
+    assert repr(TriggerCost(1, 0.5)) == "TriggerCost(calls=1, total_s=0.5)"
+
+
+def test_governor_tracks_costs_of_triggers() -> None:
+    trigger = SlowTrigger()
+    calls: List[float] = []
+    batch_trigger = CountingBatchTrigger()
+    governor = OverheadGovernor(max_fraction=None, check_interval=1)
+    timer = Timer(
+        triggers=[trigger, lambda duration, *_: calls.append(duration), batch_trigger],
+        governor=governor,
+    )
+
+    for _ in range(3):
+        with timer:
+            pass
+    timer.flush()
+
+    assert len(trigger.measurements) == 3
+    assert len(calls) == 3
+    assert batch_trigger.consumed == 3
+    costs = governor.costs()
+    assert costs[0][0] is trigger
+    assert costs[0][1].calls == 3
+    assert costs[0][1].total_s >= 0.003
+    assert {id(trigger): cost.calls for trigger, cost in costs} == {
+        id(trigger): 3,
+        id(timer.triggers[1]): 3,
+        id(batch_trigger): 1,
+    }
+    assert governor.overhead_fraction > 1.0
+    assert governor.sample_rate == 1.0
+    assert governor.disabled_triggers() == []
+
+
+def test_governor_lowers_sample_rate_and_disables_triggers() -> None:
+    trigger = SlowTrigger()
+    cheap_trigger = DummyTrigger()
+    governor = OverheadGovernor(
+        max_fraction=0.01, check_interval=2, min_sample_rate=0.5
+    )
+    timer = Timer(triggers=[trigger, cheap_trigger], governor=governor)
+
+    timer.record(Measurement(0.001, False, "label"))
+    timer.record(Measurement(0.001, False, "label"))
+    assert governor.sample_rate == 0.5
+    assert governor.disabled_triggers() == []
+
+    while not governor.disabled_triggers():
+        timer.record(Measurement(0.001, False, "label"))
+
+    assert governor.disabled_triggers() == [trigger]
+    assert not governor.enabled(trigger)
+    assert governor.enabled(cheap_trigger)
+    count = len(trigger.measurements)
+    for _ in range(10):
+        timer.record(Measurement(0.001, False, "label"))
+    assert len(trigger.measurements) == count
+    assert len(cheap_trigger.measurements) > count
+
+    governor.reset()
+    assert governor.sample_rate == 1.0
+    assert governor.disabled_triggers() == []
+    assert governor.costs() == []
+    assert governor.overhead_fraction == 0.0
+
+
+def test_governor_raises_sample_rate_once_cost_drops() -> None:
+    governor = OverheadGovernor(max_fraction=0.01, check_interval=1)
+    trigger = DummyTrigger()
+
+    governor.account(0.0, [(trigger, 0.001)])
+    assert governor.sample_rate == governor.min_sample_rate
+    assert governor.overhead_fraction == float("inf")
+
+    governor.account(1.0, [(trigger, 0.0)])
+    assert governor.sample_rate == pytest.approx(2 * governor.min_sample_rate)
+    governor.account(1.0, [(trigger, 0.008)])
+    assert governor.sample_rate == pytest.approx(2 * governor.min_sample_rate)
+
+
+def test_governor_without_disabling_triggers() -> None:
+    governor = OverheadGovernor(
+        max_fraction=0.01, check_interval=1, min_sample_rate=1.0, disable_triggers=False
+    )
+    trigger = DummyTrigger()
+
+    governor.account(1.0, [(trigger, 1.0)])
+
+    assert governor.enabled(trigger)
+    assert governor.sampled()
+
+
+def test_governor_skips_measurements_not_sampled() -> None:
+    trigger = DummyTrigger()
+    governor = OverheadGovernor()
+    governor.sample_rate = 0.0
+    timer = Timer(triggers=[trigger], governor=governor)
+
+    with timer:
+        pass
+
+    assert trigger.measurements == []
+    assert governor.measured_s > 0.0
+    assert governor.costs() == []
+
+
+def test_governor_merges_costs_of_threads() -> None:
+    trigger = DummyTrigger()
+    governor = OverheadGovernor(max_fraction=None, check_interval=10)
+
+    def work() -> None:
+        for _ in range(15):
+            governor.account(0.5, [(trigger, 0.001)])
+
+    threads = [Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # measurements after the last merge of each thread are merged on read
+    ((_, cost),) = governor.costs()
+    assert cost.calls == 60
+    assert governor.measured_s == 4 * 15 * 0.5
+    assert governor._accounts == []
@@ -0,0 +1,134 @@
+from threading import Event, Thread
+from time import sleep
+
+import pytest
+
+from pytimers.active_clocks import ACTIVE_CLOCKS
+from pytimers.sampling import SamplingProfiler
+from pytimers.timer import Timer
+
+
+@pytest.fixture()
+def timer() -> Timer:
+    return Timer()
+
+
+def test_registry_tracks_clocks_only_while_enabled(timer: Timer) -> None:
+    with timer:
+        assert ACTIVE_CLOCKS.snapshot() == []
+
+    ACTIVE_CLOCKS.acquire()
+    try:
+        with timer as clock:
+            assert ACTIVE_CLOCKS.snapshot() == [clock]
+        assert ACTIVE_CLOCKS.snapshot() == []
+    finally:
+        ACTIVE_CLOCKS.release()
+
+    assert not ACTIVE_CLOCKS.enabled
+
+
+def test_registry_release_discards_clocks(timer: Timer) -> None:
+    ACTIVE_CLOCKS.acquire()
+    with timer:
+        ACTIVE_CLOCKS.release()
+        ACTIVE_CLOCKS.release()
+
+        assert ACTIVE_CLOCKS.snapshot() == []
+
+
+def test_registry_finds_innermost_clocks(timer: Timer) -> None:
+    ACTIVE_CLOCKS.acquire()
+    try:
+        with timer.label("outer"):
+            with timer as inner:
+                assert ACTIVE_CLOCKS.innermost() == [inner]
+                assert inner.innermost_label() == "outer"
+    finally:
+        ACTIVE_CLOCKS.release()
+
+
+def test_clock_without_label_has_no_innermost_label(timer: Timer) -> None:
+    with timer as clock:
+        assert clock.innermost_label() is None
+
+
+def test_profiler_counts_innermost_labels(timer: Timer) -> None:
+    profiler = SamplingProfiler()
+    ACTIVE_CLOCKS.acquire()
+    try:
+        with timer.label("outer"):
+            profiler.sample()
+            with timer.label("inner"):
+                profiler.sample()
+            with timer:
+                profiler.sample()
+        profiler.sample()
+    finally:
+        ACTIVE_CLOCKS.release()
+
+    assert profiler.counts() == {"outer": 2, "inner": 1}
+    assert profiler.breakdown() == {"outer": 0.5, "inner": 0.25}
+    assert profiler.estimated_durations() == {
+        "outer": 2 * profiler.interval,
+        "inner": profiler.interval,
+    }
+
+
+def test_profiler_samples_other_threads(timer: Timer) -> None:
+    entered = Event()
+    finish = Event()
+
+    def timed_block() -> None:
+        with timer.label("thread"):
+            entered.set()
+            finish.wait()
+
+    profiler = SamplingProfiler()
+    ACTIVE_CLOCKS.acquire()
+    thread = Thread(target=timed_block)
+    try:
+        thread.start()
+        entered.wait()
+        profiler.sample()
+    finally:
+        finish.set()
+        thread.join()
+        ACTIVE_CLOCKS.release()
+
+    assert profiler.counts() == {"thread": 1}
+
+
+def test_profiler_runs_in_background(timer: Timer) -> None:
+    with SamplingProfiler(interval=0.001) as profiler:
+        assert profiler.running
+        with timer.label("label"):
+            sleep(0.05)
+
+    assert not profiler.running
+    assert profiler.counts()["label"] > 0
+    assert not ACTIVE_CLOCKS.enabled
+
+
+def test_profiler_refuses_double_start() -> None:
+    with SamplingProfiler() as profiler:
+        with pytest.raises(RuntimeError):
+            profiler.start()
+
+
+def test_profiler_stop_without_start() -> None:
+    profiler = SamplingProfiler()
+    profiler.stop()
+
+    assert not profiler.running
+
+
+def test_profiler_reset() -> None:
+    profiler = SamplingProfiler()
+    profiler.sample()
+    assert profiler.breakdown() == {}
+
+    profiler.reset()
+
+    assert profiler.counts() == {}
+    assert profiler.breakdown() == {}
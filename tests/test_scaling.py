@@ -0,0 +1,62 @@
+import pytest
+
+from pytimers.scaling import SizeScaling, log2_bucket
+
+
+@pytest.mark.parametrize(
+    "size,bucket",
+    [(0, 0), (0.5, 0), (1, 1), (3, 2), (4, 4), (1000, 512), (1024.5, 1024)],
+)
+def test_log2_bucket(size: float, bucket: int) -> None:
+    assert log2_bucket(size) == bucket
+
+
+def test_size_scaling_fits_linear_scaling() -> None:
+    scaling = SizeScaling()
+    for size in (10, 100, 1000):
+        scaling.add(size, size * 1e-6)
+
+    assert scaling.count == 3
+    assert scaling.per_item_s == pytest.approx(1e-6)
+    assert scaling.exponent == pytest.approx(1.0)
+    assert sorted(scaling.buckets) == [8, 64, 512]
+    assert scaling.buckets[64].max_s == pytest.approx(1e-4)
+
+
+def test_size_scaling_fits_quadratic_scaling() -> None:
+    scaling = SizeScaling()
+    for size in (10, 20, 40, 80):
+        scaling.add(size, size**2 * 1e-9)
+
+    assert scaling.exponent == pytest.approx(2.0)
+
+
+def test_size_scaling_without_distinct_sizes_has_no_exponent() -> None:
+    scaling = SizeScaling()
+    assert scaling.exponent is None
+    assert scaling.per_item_s == 0.0
+
+    scaling.add(10, 1.0)
+    scaling.add(10, 2.0)
+    scaling.add(0, 1.0)
+
+    assert scaling.exponent is None
+    assert scaling.buckets[8].count == 2
+    assert scaling.buckets[0].count == 1
+
+
+def test_size_scaling_merge_and_copy() -> None:
+    first = SizeScaling()
+    first.add(10, 1e-5)
+    second = SizeScaling()
+    second.add(10, 1e-5)
+    second.add(1000, 1e-3)
+
+    merged = first.copy()
+    merged.merge(second)
+
+    assert first.count == 1
+    assert merged.count == 3
+    assert merged.total_size == 1020
+    assert merged.buckets[8].count == 2
+    assert merged.exponent == pytest.approx(1.0)
@@ -0,0 +1,145 @@
+import runpy
+import sys
+from pathlib import Path
+
+import pytest
+from _pytest.capture import CaptureFixture
+from _pytest.monkeypatch import MonkeyPatch
+
+from pytimers.__main__ import main
+from pytimers.aggregation import LabelStatistics
+from pytimers.serialization import (
+    decode_statistics,
+    encode_statistics,
+    merge_statistics,
+)
+
+
+def label_statistics(*durations: float) -> LabelStatistics:
+    statistics = LabelStatistics()
+    statistics.add_many(durations)
+    return statistics
+
+
+def test_encoded_statistics_round_trip() -> None:
+    statistics = {
+        "request": label_statistics(0.0, 1e-6, 0.001, 0.002, 1.5, 20.0),
+        "żluťoučký": label_statistics(0.1),
+        None: LabelStatistics(),
+    }
+
+    decoded = decode_statistics(encode_statistics(statistics))
+
+    assert list(decoded) == list(statistics)
+    for label, original in statistics.items():
+        restored = decoded[label]
+        assert restored.count == original.count
+        assert restored.total_s == original.total_s
+        assert restored.min_s == original.min_s
+        assert restored.max_s == original.max_s
+        assert restored.histogram.count == original.histogram.count
+        assert restored.histogram.zero_count == original.histogram.zero_count
+        assert restored.histogram.buckets == original.histogram.buckets
+        assert restored.quantile(0.5) == original.quantile(0.5)
+
+
+def test_encoded_statistics_are_compact() -> None:
+    statistics = label_statistics(*(index / 10000 for index in range(1, 10001)))
+
+    encoded = encode_statistics({"request": statistics})
+
+    assert len(statistics.histogram.buckets) > 100
+    assert len(encoded) < 4 * len(statistics.histogram.buckets)
+
+
+def test_merged_statistics_match_statistics_of_all_durations() -> None:
+    first = [index / 1000 for index in range(1, 900)]
+    second = [index / 100 for index in range(90, 200)]
+    node_dumps = [
+        encode_statistics(
+            {"request": label_statistics(*first), "a": LabelStatistics()}
+        ),
+        encode_statistics({"request": label_statistics(*second)}),
+    ]
+    expected = label_statistics(*first, *second)
+
+    merged = merge_statistics(*(decode_statistics(dump) for dump in node_dumps))
+
+    assert list(merged) == ["request", "a"]
+    assert merged["request"].count == expected.count
+    assert merged["request"].histogram.buckets == expected.histogram.buckets
+    for q in (0.5, 0.9, 0.99):
+        assert merged["request"].quantile(q) == expected.quantile(q)
+
+
+def test_merge_statistics_copies_statistics() -> None:
+    statistics = label_statistics(1.0)
+
+    merged = merge_statistics({"label": statistics})
+    merged["label"].add(2.0)
+
+    assert statistics.count == 1
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    [
+        (b"JSON{}", "not encoded"),
+        (b"PYTS", "Unsupported version"),
+        (b"PYTS\x02", "Unsupported version"),
+        (encode_statistics({"label": label_statistics(1.0)})[:-1], "truncated"),
+    ],
+)
+def test_decode_statistics_rejects_invalid_data(data: bytes, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        decode_statistics(data)
+
+
+def test_merge_command(tmp_path: Path, capsys: CaptureFixture[str]) -> None:
+    first = tmp_path / "first.bin"
+    second = tmp_path / "second.bin"
+    output = tmp_path / "fleet.bin"
+    first.write_bytes(encode_statistics({"request": label_statistics(1.0, 2.0)}))
+    second.write_bytes(
+        encode_statistics(
+            {"request": label_statistics(3.0), None: label_statistics(4.0)}
+        )
+    )
+
+    assert main(["merge", str(first), str(second), "-o", str(output)]) == 0
+
+    assert capsys.readouterr().out.splitlines() == [
+        "code block: 1 calls, mean 4s, p50 4s, p99 4s, max 4s",
+        "request: 3 calls, mean 2s, p50 1.99366s, p99 1.99366s, max 3s",
+    ]
+    merged = decode_statistics(output.read_bytes())
+    assert merged["request"].count == 3
+
+
+def test_merge_command_reports_errors(
+    tmp_path: Path, capsys: CaptureFixture[str]
+) -> None:
+    invalid = tmp_path / "invalid.bin"
+    invalid.write_bytes(b"invalid")
+
+    assert main(["merge", str(invalid)]) == 1
+    assert main(["merge", str(tmp_path / "missing.bin")]) == 1
+
+    errors = capsys.readouterr().err.splitlines()
+    assert errors[0] == "error: Data are not encoded pytimers statistics."
+    assert errors[1].startswith("error: [Errno 2]")
+
+
+def test_module_entry_point(
+    tmp_path: Path, monkeypatch: MonkeyPatch, capsys: CaptureFixture[str]
+) -> None:
+    dump = tmp_path / "node.bin"
+    dump.write_bytes(encode_statistics({"request": label_statistics(1.0)}))
+    monkeypatch.setattr(sys, "argv", ["pytimers", "merge", str(dump)])
+    monkeypatch.delitem(sys.modules, "pytimers.__main__")
+
+    with pytest.raises(SystemExit) as exc_info:
+        runpy.run_module("pytimers", run_name="__main__")
+
+    assert exc_info.value.code == 0
+    assert capsys.readouterr().out.startswith("request: 1 calls")
@@ -1,8 +1,13 @@
-from asyncio import gather, sleep
+import sys
+from asyncio import create_task, gather, get_running_loop, sleep
+from threading import get_ident
+from time import sleep as sleep_sync, thread_time
 
 import pytest
 
+from pytimers.clock import LAP_CAPACITY
 from pytimers.exceptions import ClockStillRunning
+from pytimers.labels import LABEL_REGISTRY
 from pytimers.timer import Timer
 from pytimers.triggers.dummy_trigger import DummyTrigger
 
@@ -52,6 +57,7 @@ def test_timer_preserves_exception(timer: Timer, trigger: DummyTrigger) -> None:
             raise ValueError()
 
     assert len(trigger.calls) == 1
+    assert trigger.measurements[0].exc_type is ValueError
 
 
 def test_timer_uses_proper_label(timer: Timer, trigger: DummyTrigger) -> None:
@@ -145,3 +151,183 @@ async def test_timer_is_robust_to_async(timer: Timer, trigger: DummyTrigger) ->
         "4ms",
         "5ms",
     ]
+
+
+def test_timer_without_cpu_timer_skips_cpu_duration(
+    timer: Timer, trigger: DummyTrigger
+) -> None:
+    with timer as clock:
+        pass
+
+    assert clock.cpu_duration() is None
+    assert clock.wait_duration() is None
+
+
+def test_timer_measures_cpu_duration() -> None:
+    cpu_times = iter([1.0, 1.25])
+    trigger = DummyTrigger()
+    timer = Timer(triggers=[trigger], cpu_timer=lambda: next(cpu_times))
+
+    with timer as clock:
+        sleep_sync(0.01)
+
+    assert clock.cpu_duration() == 0.25
+    assert clock.cpu_duration(1) == 0.2
+    assert clock.wait_duration() == 0
+    assert trigger.measurements[0].cpu_duration_s == 0.25
+
+
+def test_timer_measures_wait_duration() -> None:
+    timer = Timer(cpu_timer=thread_time)
+
+    with timer as clock:
+        sleep_sync(0.01)
+
+    wait_duration = clock.wait_duration()
+    assert wait_duration is not None
+    assert 0 < wait_duration <= clock.duration()
+    assert clock.wait_duration(0) == 0
+
+
+def test_timer_protects_unfinished_cpu_duration() -> None:
+    timer = Timer(cpu_timer=thread_time)
+
+    with pytest.raises(ClockStillRunning):
+        with timer as clock:
+            _ = clock.cpu_duration()
+
+
+def test_timer_passes_measurement_metadata(
+    timer: Timer, trigger: DummyTrigger
+) -> None:
+    with timer.label("outer") as outer_clock:
+        with timer.label("inner") as inner_clock:
+            pass
+
+    inner, outer = trigger.measurements
+    assert inner.label == "inner"
+    assert inner.parent_label == "outer"
+    assert inner.start_time == inner_clock.start_time
+    assert inner.thread_id == get_ident()
+    assert inner.task_name is None
+    assert outer.parent_label is None
+    assert outer.start_time == outer_clock.start_time
+
+
+def test_timer_shares_measurement_between_triggers() -> None:
+    trigger_1 = DummyTrigger()
+    trigger_2 = DummyTrigger()
+    timer = Timer(triggers=[trigger_1, trigger_2])
+
+    with timer:
+        pass
+
+    assert trigger_1.measurements[0] is trigger_2.measurements[0]
+
+
+async def test_timer_passes_task_name(timer: Timer, trigger: DummyTrigger) -> None:
+    async def timed_block() -> None:
+        with timer:
+            pass
+
+    await create_task(timed_block(), name="task_name")
+
+    assert trigger.measurements[0].task_name == "task_name"
+
+
+async def test_timer_skips_task_name_unless_trigger_needs_it() -> None:
+    trigger = DummyTrigger()
+    trigger.needs_task_name = False
+    timer = Timer(triggers=[trigger])
+
+    async def timed_block() -> None:
+        with timer:
+            pass
+
+    await create_task(timed_block(), name="task_name")
+
+    assert trigger.measurements[0].task_name is None
+
+
+def test_timer_without_asyncio_skips_task_name(
+    timer: Timer, trigger: DummyTrigger, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delitem(sys.modules, "asyncio")
+
+    with timer:
+        pass
+
+    assert trigger.measurements[0].task_name is None
+
+
+async def test_timer_outside_task_skips_task_name(
+    timer: Timer, trigger: DummyTrigger
+) -> None:
+    def timed_callback() -> None:
+        with timer:
+            pass
+
+    get_running_loop().call_soon(timed_callback)
+    await sleep(0)
+
+    assert trigger.measurements[0].task_name is None
+
+
+def test_timer_does_not_intern_label(timer: Timer, trigger: DummyTrigger) -> None:
+    size = len(LABEL_REGISTRY)
+    for request_id in range(100):
+        with timer.label(f"request {request_id}"):
+            pass
+    with timer:
+        pass
+
+    assert len(LABEL_REGISTRY) == size
+    assert trigger.measurements[0].label_id is None
+    assert trigger.measurements[-1].label_id == 0
+
+
+def test_timer_keeps_empty_label(timer: Timer, trigger: DummyTrigger) -> None:
+    with timer.label(""):
+        pass
+    with timer:
+        pass
+
+    labelled, unlabelled = trigger.measurements
+    assert labelled.label == ""
+    assert labelled.label_id is None
+    assert unlabelled.label is None
+    assert unlabelled.label_id == 0
+
+
+def test_timer_passes_lap_phases(timer: Timer, trigger: DummyTrigger) -> None:
+    with timer.label("handler") as clock:
+        sleep_sync(0.01)
+        clock.lap("parse")
+        clock.checkpoint("query")
+
+    (measurement,) = trigger.measurements
+    assert measurement.phases is not None
+    assert [name for name, _ in measurement.phases] == ["parse", "query"]
+    assert measurement.phases[0][1] >= 0.01
+    assert sum(duration for _, duration in measurement.phases) <= clock.duration()
+
+
+def test_timer_without_laps_skips_phases(timer: Timer, trigger: DummyTrigger) -> None:
+    with timer as clock:
+        pass
+
+    assert trigger.measurements[0].phases is None
+    assert clock.lap_count == 0
+    assert clock.phases() == []
+
+
+def test_clock_grows_preallocated_laps(timer: Timer) -> None:
+    with timer as clock:
+        for index in range(LAP_CAPACITY * 2 + 1):
+            clock.lap(str(index))
+
+    phases = clock.phases()
+    assert [name for name, _ in phases] == [
+        str(index) for index in range(LAP_CAPACITY * 2 + 1)
+    ]
+    assert all(duration >= 0.0 for _, duration in phases)
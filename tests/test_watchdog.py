@@ -0,0 +1,101 @@
+from threading import Event, Thread
+from time import sleep
+from typing import List, Optional, Tuple
+
+import pytest
+
+from pytimers.active_clocks import ACTIVE_CLOCKS
+from pytimers.timer import Timer
+from pytimers.triggers.dummy_trigger import DummyTrigger
+from pytimers.watchdog import Watchdog
+
+
+def test_watchdog_reports_overdue_block_once() -> None:
+    trigger = DummyTrigger()
+    watchdog = Watchdog([trigger], deadline_s=0.0)
+    timer = Timer()
+
+    ACTIVE_CLOCKS.acquire()
+    try:
+        with timer.label("outer"):
+            with timer.label("inner"):
+                assert watchdog.check() == 2
+                assert watchdog.check() == 0
+    finally:
+        ACTIVE_CLOCKS.release()
+
+    inner, outer = sorted(trigger.measurements, key=lambda m: str(m.label))
+    assert inner.parent_label == "outer"
+    assert inner.parent_clock is outer.clock
+    assert inner.duration_s >= 0.0
+    assert inner.stack_trace is None
+
+
+def test_watchdog_skips_unlabelled_blocks_and_blocks_within_deadline() -> None:
+    trigger = DummyTrigger()
+    watchdog = Watchdog([trigger], deadline_s=None, deadlines={"slow": 0.0})
+    timer = Timer()
+
+    ACTIVE_CLOCKS.acquire()
+    try:
+        with timer:
+            with timer.label("other"):
+                assert watchdog.check() == 0
+        with timer.label("fast"):
+            assert Watchdog([trigger], deadline_s=60.0).check() == 0
+        with timer.label("slow"):
+            assert watchdog.check() == 1
+    finally:
+        ACTIVE_CLOCKS.release()
+
+    assert [measurement.label for measurement in trigger.measurements] == ["slow"]
+
+
+def test_watchdog_captures_stack_of_other_thread() -> None:
+    trigger = DummyTrigger()
+    calls: List[Tuple[float, bool, Optional[str]]] = []
+    timer = Timer()
+    entered = Event()
+    finish = Event()
+
+    def stuck_request() -> None:
+        with timer.label("stuck"):
+            entered.set()
+            finish.wait()
+
+    with Watchdog(
+        [trigger, lambda *args: calls.append(args)],
+        deadline_s=0.01,
+        interval=0.01,
+        capture_stack=True,
+    ) as watchdog:
+        assert watchdog.running
+        thread = Thread(target=stuck_request)
+        thread.start()
+        entered.wait()
+        while not trigger.measurements:
+            sleep(0.01)
+        finish.set()
+        thread.join()
+
+    assert not watchdog.running
+    (measurement,) = trigger.measurements
+    assert measurement.label == "stuck"
+    assert measurement.thread_id == thread.ident
+    assert measurement.stack_trace is not None
+    assert "stuck_request" in measurement.stack_trace
+    assert calls == [(measurement.duration_s, False, "stuck")]
+
+
+def test_watchdog_start_and_stop() -> None:
+    watchdog = Watchdog([])
+    watchdog.start()
+    try:
+        with pytest.raises(RuntimeError):
+            watchdog.start()
+    finally:
+        watchdog.stop()
+    watchdog.stop()
+
+    assert not watchdog.running
+    assert not ACTIVE_CLOCKS.enabled
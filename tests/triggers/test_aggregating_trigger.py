@@ -0,0 +1,142 @@
+from threading import Event, Thread
+
+import pytest
+
+from pytimers.timer import Timer
+from pytimers.triggers.aggregating_trigger import AggregatingTrigger
+from pytimers.triggers.batch_trigger import DECORATOR_FLAG, ERROR_FLAG
+
+
+def test_trigger_groups_by_label() -> None:
+    trigger = AggregatingTrigger()
+    trigger.consume_batch([1.0, 2.0, 4.0], ["a", None, "a"], [0, 0, 0])
+    trigger.consume_batch([3.0], ["a"], [0])
+
+    statistics = trigger.statistics()
+
+    assert statistics["a"].count == 3
+    assert statistics["a"].max_s == 4.0
+    assert statistics[None].count == 1
+
+
+def test_trigger_reset() -> None:
+    trigger = AggregatingTrigger()
+    trigger.consume_batch([1.0], ["a"], [0])
+
+    trigger.reset()
+
+    assert trigger.statistics() == {}
+
+
+def test_trigger_aggregates_timer_measurements() -> None:
+    trigger = AggregatingTrigger()
+    timer = Timer(triggers=[trigger], flush_interval=None)
+
+    for _ in range(3):
+        with timer.label("label"):
+            pass
+    timer.flush()
+
+    assert trigger.statistics()["label"].count == 3
+
+
+def test_trigger_ignores_empty_batch() -> None:
+    trigger = AggregatingTrigger()
+    trigger.consume_batch([], [], [])
+
+    assert trigger.statistics() == {}
+
+
+def test_trigger_splits_statistics_by_outcome() -> None:
+    trigger = AggregatingTrigger()
+    trigger.consume_batch(
+        [1.0, 10.0, 2.0, 20.0],
+        ["a", "a", "a", "b"],
+        [0, ERROR_FLAG, DECORATOR_FLAG, DECORATOR_FLAG | ERROR_FLAG],
+    )
+
+    succeeded = trigger.statistics(failed=False)
+    failed = trigger.statistics(failed=True)
+    merged = trigger.statistics()
+
+    assert succeeded["a"].count == 2
+    assert succeeded["a"].max_s == 2.0
+    assert "b" not in succeeded
+    assert failed["a"].count == 1
+    assert failed["a"].min_s == 10.0
+    assert failed["b"].count == 1
+    assert merged["a"].count == 3
+    assert merged["a"].total_s == 13.0
+
+
+def test_trigger_aggregates_failed_timer_measurements() -> None:
+    trigger = AggregatingTrigger()
+    timer = Timer(triggers=[trigger], flush_interval=None)
+
+    with pytest.raises(ValueError):
+        with timer.label("label"):
+            raise ValueError()
+    timer.flush()
+
+    assert trigger.statistics(failed=True)["label"].count == 1
+    assert trigger.statistics(failed=False) == {}
+
+
+def test_trigger_merges_statistics_of_threads() -> None:
+    trigger = AggregatingTrigger()
+    finish = Event()
+
+    def consume(duration: float) -> None:
+        trigger.consume_batch([duration], ["label"], [0])
+
+    def consume_and_wait() -> None:
+        consume(3.0)
+        finish.wait()
+
+    waiting_thread = Thread(target=consume_and_wait)
+    waiting_thread.start()
+    finished_threads = [Thread(target=consume, args=(1.0,)) for _ in range(2)]
+    for thread in finished_threads:
+        thread.start()
+    for thread in finished_threads:
+        thread.join()
+    consume(2.0)
+
+    try:
+        statistics = trigger.statistics()["label"]
+        assert statistics.count == 4
+        assert statistics.total_s == 7.0
+        assert statistics.max_s == 3.0
+        # statistics of finished threads are kept after their shards are retired
+        assert trigger.statistics()["label"].count == 4
+    finally:
+        finish.set()
+        waiting_thread.join()
+
+    trigger.reset()
+
+    assert trigger.statistics() == {}
+
+
+def test_trigger_aggregates_timer_measurements_from_threads() -> None:
+    trigger = AggregatingTrigger()
+    timer = Timer(triggers=[trigger], batch_size=10, flush_interval=None)
+
+    # labels set by `Timer.label` are shared by all threads so a decorated function
+    # is used to keep the label of each measurement deterministic
+    @timer
+    def label() -> None:
+        pass
+
+    def timed_calls() -> None:
+        for _ in range(100):
+            label()
+
+    threads = [Thread(target=timed_calls) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    timer.flush()
+
+    assert trigger.statistics()[label.__qualname__].count == 800
@@ -0,0 +1,79 @@
+import math
+from random import Random
+from typing import List, Optional, Tuple
+
+from pytimers.measurement import Measurement
+from pytimers.timer import Timer
+from pytimers.triggers.anomaly_trigger import AnomalyTrigger
+from pytimers.triggers.dummy_trigger import DummyTrigger
+
+
+def measurements(label: str, mean_s: float, count: int) -> List[Measurement]:
+    random = Random(0)
+    return [
+        Measurement(mean_s * math.exp(random.gauss(0.0, 0.1)), False, label)
+        for _ in range(count)
+    ]
+
+
+def test_trigger_fires_downstream_triggers_on_shift() -> None:
+    downstream = DummyTrigger()
+    calls: List[Tuple[float, bool, Optional[str]]] = []
+    trigger = AnomalyTrigger([downstream, lambda *args: calls.append(args)])
+
+    for measurement in measurements("request", 0.01, 500):
+        trigger.on_measurement(measurement)
+    for measurement in measurements("other", 0.05, 500):
+        trigger.on_measurement(measurement)
+    assert downstream.measurements == []
+
+    for measurement in measurements("request", 0.02, 20):
+        trigger.on_measurement(measurement)
+
+    (change_point,) = trigger.change_points
+    assert change_point.label == "request"
+    assert change_point.increased
+    assert 0.009 < change_point.baseline_s < 0.011
+    assert downstream.measurements == [change_point.measurement]
+    assert calls == [(change_point.measurement.duration_s, False, "request")]
+    assert repr(change_point).startswith(
+        "ChangePoint(label='request', increased=True, baseline_s="
+    )
+    assert trigger.detector("other").count == 500
+
+
+def test_trigger_reports_decreases_only_if_enabled() -> None:
+    downstream = DummyTrigger()
+    quiet = AnomalyTrigger([downstream], warmup=20)
+    trigger = AnomalyTrigger([downstream], warmup=20, detect_decreases=True)
+
+    for measurement in measurements("request", 0.01, 20) + measurements(
+        "request", 0.001, 20
+    ):
+        quiet.on_measurement(measurement)
+        trigger.on_measurement(measurement)
+
+    assert len(quiet.change_points) == 0
+    (change_point,) = trigger.change_points
+    assert not change_point.increased
+    assert downstream.measurements == [change_point.measurement]
+
+    trigger.reset()
+    assert len(trigger.change_points) == 0
+    assert trigger.detector("request").count == 0
+
+
+def test_trigger_receives_measurements_from_timer() -> None:
+    trigger = AnomalyTrigger([])
+    timer = Timer([trigger])
+
+    for _ in range(3):
+        with timer.label("block"):
+            pass
+
+    assert trigger.detector("block").count == 3
+
+
+def test_trigger_needs_task_name_of_downstream_triggers() -> None:
+    assert AnomalyTrigger([DummyTrigger()]).needs_task_name
+    assert not AnomalyTrigger([lambda *args: None]).needs_task_name
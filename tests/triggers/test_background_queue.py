@@ -0,0 +1,43 @@
+from time import sleep
+from typing import List
+
+from pytimers.triggers.background_queue import BackgroundQueue
+
+
+def test_full_batch_is_processed_by_background_thread() -> None:
+    batches: List[List[int]] = []
+    idle_calls: List[None] = []
+    queue = BackgroundQueue(
+        batches.append, 2, 60.0, 10, "test-queue", lambda: idle_calls.append(None)
+    )
+    queue.put(1)
+    queue.put(2)
+    while not idle_calls:
+        sleep(0.01)
+    queue.shutdown()
+
+    assert batches == [[1, 2]]
+
+
+def test_flush_processes_queued_items_in_order() -> None:
+    batches: List[List[int]] = []
+    queue = BackgroundQueue(batches.append, 10, 60.0, 10, "test-queue")
+    queue.put(1)
+    queue.flush()
+    queue.flush()
+    queue.put(2)
+    queue.shutdown()
+
+    assert batches == [[1], [2]]
+
+
+def test_full_and_stopped_queue_drops_items() -> None:
+    batches: List[List[int]] = []
+    queue = BackgroundQueue(batches.append, 10, 60.0, 2, "test-queue")
+    for item in range(3):
+        queue.put(item)
+    queue.shutdown()
+    queue.put(3)
+
+    assert queue.dropped == 2
+    assert batches == [[0, 1]]
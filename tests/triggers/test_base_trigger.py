@@ -1,4 +1,9 @@
-from pytimers.triggers.base_trigger import BaseTrigger
+from typing import Optional
+
+import pytest
+
+from pytimers.measurement import Measurement
+from pytimers.triggers.base_trigger import BaseTrigger, notify_trigger
 
 
 def test_humanize_hours() -> None:
@@ -29,3 +34,105 @@ def test_humanize_milliseconds_with_precision() -> None:
     humanized = BaseTrigger.humanized_duration(0.023561, 2)
 
     assert humanized == "23.56ms"
+
+
+def test_trigger_requires_entrypoint() -> None:
+    class IncompleteTrigger(BaseTrigger):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteTrigger()
+
+
+def test_positional_trigger_receives_measurement() -> None:
+    calls = []
+
+    class PositionalTrigger(BaseTrigger):
+        def __call__(
+            self,
+            duration_s: float,
+            decorator: bool,
+            label: Optional[str] = None,
+        ) -> None:
+            calls.append((duration_s, decorator, label))
+
+    PositionalTrigger().on_measurement(Measurement(1.0, True, "label"))
+
+    assert calls == [(1.0, True, "label")]
+
+
+def test_measurement_trigger_supports_positional_call() -> None:
+    measurements = []
+
+    class MeasurementTrigger(BaseTrigger):
+        def on_measurement(self, measurement: Measurement) -> None:
+            measurements.append(measurement)
+
+    MeasurementTrigger()(1.0, True, "label")
+
+    assert len(measurements) == 1
+    assert measurements[0].duration_s == 1.0
+    assert measurements[0].decorator is True
+    assert measurements[0].label == "label"
+
+
+def test_positional_subclass_of_measurement_trigger() -> None:
+    measurements = []
+    calls = []
+
+    class MeasurementTrigger(BaseTrigger):
+        def on_measurement(self, measurement: Measurement) -> None:
+            measurements.append(measurement)
+
+    class PositionalSubclass(MeasurementTrigger):
+        def __call__(
+            self,
+            duration_s: float,
+            decorator: bool,
+            label: Optional[str] = None,
+        ) -> None:
+            calls.append(label)
+            super().__call__(duration_s, decorator, label)
+
+    class NestedSubclass(PositionalSubclass):
+        def __call__(
+            self,
+            duration_s: float,
+            decorator: bool,
+            label: Optional[str] = None,
+        ) -> None:
+            super().__call__(duration_s, decorator, f"nested {label}")
+
+    notify_trigger(PositionalSubclass(), Measurement(1.0, True, "label"))
+    notify_trigger(NestedSubclass(), Measurement(2.0, False, "label"))
+
+    assert calls == ["label", "nested label"]
+    assert [m.label for m in measurements] == ["label", "nested label"]
+
+
+def test_subclass_delegating_call_to_on_measurement() -> None:
+    measurements = []
+
+    class MeasurementTrigger(BaseTrigger):
+        def on_measurement(self, measurement: Measurement) -> None:
+            measurements.append(measurement)
+
+    class DelegatingSubclass(MeasurementTrigger):
+        def __call__(
+            self,
+            duration_s: float,
+            decorator: bool,
+            label: Optional[str] = None,
+        ) -> None:
+            self.on_measurement(Measurement(duration_s, decorator, f"call {label}"))
+
+    class MeasurementSubclass(DelegatingSubclass):
+        def on_measurement(self, measurement: Measurement) -> None:
+            measurements.append(measurement)
+
+    trigger = DelegatingSubclass()
+    notify_trigger(trigger, Measurement(1.0, True, "label"))
+    notify_trigger(trigger, Measurement(2.0, True, "label"))
+    notify_trigger(MeasurementSubclass(), Measurement(3.0, False, "label"))
+
+    assert [m.label for m in measurements] == ["call label", "call label", "label"]
@@ -0,0 +1,141 @@
+import asyncio
+import atexit
+import json
+import os
+from pathlib import Path
+from threading import Thread, current_thread
+from typing import Any, Callable, List, Tuple
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from pytimers.labels import LABEL_REGISTRY
+from pytimers.measurement import Measurement
+from pytimers.timer import Timer
+from pytimers.triggers.chrome_trace_trigger import ChromeTraceTrigger
+
+
+def test_trigger_dumps_nested_blocks_and_calls(tmp_path: Path) -> None:
+    trigger = ChromeTraceTrigger()
+    timer = Timer([trigger])
+
+    @timer
+    def failing() -> None:
+        raise ValueError
+
+    with timer.label("outer"):
+        with timer:
+            pass
+        with pytest.raises(ValueError):
+            failing()
+
+    path = tmp_path / "trace.json"
+    assert trigger.dump(str(path)) == 3
+
+    trace = json.loads(path.read_text())
+    assert trace["displayTimeUnit"] == "ms"
+    metadata, inner, call, outer = trace["traceEvents"]
+    assert metadata == {
+        "name": "thread_name",
+        "ph": "M",
+        "pid": os.getpid(),
+        "tid": current_thread().ident,
+        "args": {"name": current_thread().name},
+    }
+    assert inner["name"] == "code block"
+    assert inner["cat"] == "code block"
+    assert call["name"].endswith("failing")
+    assert call["cat"] == "decorator"
+    assert call["args"] == {"failed": True}
+    assert outer["name"] == "outer"
+    assert outer["args"] == {"failed": False}
+    assert outer["tid"] == current_thread().ident
+    assert outer["ts"] <= inner["ts"] < call["ts"]
+    assert call["ts"] + call["dur"] <= outer["ts"] + outer["dur"]
+
+
+def test_ring_buffer_keeps_newest_events() -> None:
+    trigger = ChromeTraceTrigger(capacity=3)
+    for index in range(5):
+        trigger.on_measurement(Measurement(float(index), False, str(index)))
+
+    events = [event for event in trigger.events() if event["ph"] == "X"]
+
+    assert trigger.recorded_events == 5
+    assert [event["name"] for event in events] == ["2", "3", "4"]
+    assert [event["dur"] for event in events] == [2e6, 3e6, 4e6]
+    assert events[0]["tid"] == 0
+
+    trigger.clear()
+    assert trigger.events() == []
+    assert trigger.recorded_events == 0
+
+
+def test_distinct_labels_are_not_interned() -> None:
+    trigger = ChromeTraceTrigger(capacity=16)
+    timer = Timer([trigger])
+    interned = len(LABEL_REGISTRY)
+    for index in range(10000):
+        with timer.label(f"request {index}"):
+            pass
+
+    events = [event for event in trigger.events() if event["ph"] == "X"]
+
+    assert len(LABEL_REGISTRY) == interned
+    assert events[-1]["name"] == "request 9999"
+
+
+def test_tasks_and_threads_get_separate_tracks() -> None:
+    trigger = ChromeTraceTrigger()
+    timer = Timer([trigger])
+
+    async def task() -> None:
+        with timer.label("in task"):
+            await asyncio.sleep(0)
+
+    async def main() -> None:
+        await asyncio.gather(
+            asyncio.create_task(task(), name="first"),
+            asyncio.create_task(task(), name="second"),
+        )
+
+    asyncio.run(main())
+    with timer.label("in thread"):
+        pass
+
+    def in_worker() -> None:
+        with timer.label("in worker"):
+            pass
+
+    worker = Thread(target=in_worker)
+    worker.start()
+    worker.join()
+
+    events = trigger.events()
+    names = [event["args"]["name"] for event in events if event["ph"] == "M"]
+    thread_name = current_thread().name
+    assert names == [
+        f"first ({thread_name})",
+        f"second ({thread_name})",
+        thread_name,
+        str(worker.ident),
+    ]
+    tracks = {event["tid"] for event in events if event["ph"] == "X"}
+    assert len(tracks) == 4
+
+
+def test_trigger_dumps_at_exit(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    exit_handlers: List[Tuple[Callable[..., Any], Tuple[Any, ...]]] = []
+    monkeypatch.setattr(
+        atexit, "register", lambda *handler: exit_handlers.append(handler)
+    )
+    path = tmp_path / "trace.json"
+    timer = Timer([ChromeTraceTrigger(dump_at_exit=str(path))])
+    with timer.label("block"):
+        pass
+
+    ((handler, argument),) = exit_handlers
+    handler(argument)
+
+    events = json.loads(path.read_text())["traceEvents"]
+    assert [event["name"] for event in events] == ["thread_name", "block"]
@@ -1,8 +1,12 @@
 from logging import INFO
+from time import sleep
+from typing import List, Optional
 
 from _pytest.logging import LogCaptureFixture
 
-from pytimers.triggers.logger_trigger import LoggerTrigger
+from pytimers.measurement import Measurement
+from pytimers.timer import Timer
+from pytimers.triggers.logger_trigger import LoggerTrigger, _TokenBucket
 
 
 def test_creates_log(caplog: LogCaptureFixture) -> None:
@@ -24,3 +28,165 @@ def test_trigger_uses_default_label(caplog: LogCaptureFixture) -> None:
         trigger(1.0, False)
 
     assert caplog.records[0].msg == def_label
+
+
+def test_trigger_formats_cpu_and_wait_duration(caplog: LogCaptureFixture) -> None:
+    trigger = LoggerTrigger(template="${cpu_duration} ${wait_duration}")
+    with caplog.at_level(INFO):
+        trigger.on_measurement(Measurement(1.0, False, "label", cpu_duration_s=0.25))
+
+    assert caplog.records[0].msg == "0.25 0.75"
+
+
+def test_trigger_uses_unmeasured_placeholder(caplog: LogCaptureFixture) -> None:
+    trigger = LoggerTrigger(
+        template="${cpu_duration} ${wait_duration}",
+        unmeasured_placeholder="-",
+    )
+    with caplog.at_level(INFO):
+        trigger(1.0, False, "label")
+
+    assert caplog.records[0].msg == "- -"
+
+
+def test_trigger_formats_outcome(caplog: LogCaptureFixture) -> None:
+    trigger = LoggerTrigger(template="${outcome}")
+    with caplog.at_level(INFO):
+        trigger.on_measurement(Measurement(1.0, False, exc_type=ValueError))
+        trigger.on_measurement(Measurement(1.0, False))
+
+    assert caplog.records[0].msg == "ValueError"
+    assert caplog.records[1].msg == "success"
+
+
+def test_trigger_limits_lines_per_second(caplog: LogCaptureFixture) -> None:
+    trigger = LoggerTrigger(max_lines_per_second=2)
+    with caplog.at_level(INFO):
+        for _ in range(5):
+            trigger(1.0, False, "label")
+
+    assert len(caplog.records) == 2
+    assert trigger.suppressed_lines == 3
+
+
+def test_token_bucket_refills() -> None:
+    bucket = _TokenBucket(rate=1)
+    now = bucket.last_refill
+
+    assert bucket.take(now)
+    assert not bucket.take(now)
+    assert bucket.take(now + 1.0)
+
+
+def test_trigger_summarizes_measurements(caplog: LogCaptureFixture) -> None:
+    trigger = LoggerTrigger(
+        summary_interval=3600,
+        summary_template="${label}: ${count} calls, ${errors} errors, max ${max}",
+    )
+    with caplog.at_level(INFO):
+        for _ in range(1233):
+            trigger.on_measurement(Measurement(0.001, True, "foo"))
+        trigger.on_measurement(Measurement(0.3, True, "foo", exc_type=ValueError))
+        trigger.on_measurement(Measurement(0.002, False))
+
+        assert caplog.records == []
+
+        trigger.flush()
+
+    assert sorted(record.msg for record in caplog.records) == [
+        "code block: 1 calls, 0 errors, max 2.000ms",
+        "foo: 1,234 calls, 1 errors, max 300.000ms",
+    ]
+
+
+def test_trigger_logs_summary_after_interval(caplog: LogCaptureFixture) -> None:
+    trigger = LoggerTrigger(summary_interval=0.0)
+    with caplog.at_level(INFO):
+        trigger.on_measurement(Measurement(0.001, True, "foo"))
+        trigger.on_measurement(Measurement(0.001, True, "foo"))
+
+    assert [record.msg for record in caplog.records] == [
+        "foo: 1 calls, p50 1.000ms, p99 1.000ms, max 1.000ms",
+        "foo: 1 calls, p50 1.000ms, p99 1.000ms, max 1.000ms",
+    ]
+
+
+def test_trigger_delays_rate_limited_summary(caplog: LogCaptureFixture) -> None:
+    trigger = LoggerTrigger(
+        summary_interval=0.0,
+        summary_template="${label}: ${count}",
+        max_lines_per_second=1,
+    )
+    with caplog.at_level(INFO):
+        for _ in range(3):
+            trigger.on_measurement(Measurement(0.001, True, "foo"))
+        trigger.flush()
+
+    assert [record.msg for record in caplog.records] == ["foo: 1", "foo: 2"]
+
+
+def test_trigger_logs_summary_of_quiet_label(caplog: LogCaptureFixture) -> None:
+    trigger = LoggerTrigger(summary_interval=0.1, summary_template="${label}: ${count}")
+    with caplog.at_level(INFO):
+        for _ in range(3):
+            trigger.on_measurement(Measurement(0.001, True, "spike"))
+        sleep(0.06)
+        trigger.on_measurement(Measurement(0.001, True, "steady"))
+        sleep(0.06)
+        trigger.on_measurement(Measurement(0.001, True, "steady"))
+
+        assert [record.msg for record in caplog.records] == ["spike: 3"]
+
+        trigger.flush()
+
+    assert [record.msg for record in caplog.records] == ["spike: 3", "steady: 2"]
+
+
+def test_trigger_flush_without_summaries(caplog: LogCaptureFixture) -> None:
+    trigger = LoggerTrigger()
+    with caplog.at_level(INFO):
+        trigger.flush()
+
+    assert caplog.records == []
+
+
+def test_subclass_overriding_call(caplog: LogCaptureFixture) -> None:
+    labels: List[Optional[str]] = []
+
+    class RecordingLoggerTrigger(LoggerTrigger):
+        def __call__(
+            self,
+            duration_s: float,
+            decorator: bool,
+            label: Optional[str] = None,
+        ) -> None:
+            labels.append(label)
+            super().__call__(duration_s, decorator, label)
+
+    timer = Timer([RecordingLoggerTrigger(template="${label}")])
+    with caplog.at_level(INFO):
+        with timer.label("x"):
+            pass
+
+    assert labels == ["x"]
+    assert [record.msg for record in caplog.records] == ["x"]
+
+
+def test_subclass_delegating_call_to_on_measurement(
+    caplog: LogCaptureFixture,
+) -> None:
+    class PrefixedLoggerTrigger(LoggerTrigger):
+        def __call__(
+            self,
+            duration_s: float,
+            decorator: bool,
+            label: Optional[str] = None,
+        ) -> None:
+            self.on_measurement(Measurement(duration_s, decorator, f"prefix {label}"))
+
+    timer = Timer([PrefixedLoggerTrigger(template="${label}")])
+    with caplog.at_level(INFO):
+        with timer.label("x"):
+            pass
+
+    assert [record.msg for record in caplog.records] == ["prefix x"]
@@ -0,0 +1,66 @@
+from typing import List
+
+import pytest
+
+from pytimers.measurement import Measurement
+from pytimers.timer import Timer
+from pytimers.triggers.scaling_trigger import ScalingTrigger
+
+
+def test_trigger_aggregates_measurements_by_size() -> None:
+    trigger = ScalingTrigger()
+    for size in (10, 100, 1000):
+        trigger.on_measurement(Measurement(size * 1e-6, True, "linear", key=size))
+        trigger.on_measurement(Measurement(size**2 * 1e-9, True, "quadratic", key=size))
+
+    statistics = trigger.statistics()
+
+    assert statistics["linear"].exponent == pytest.approx(1.0)
+    assert statistics["quadratic"].exponent == pytest.approx(2.0)
+    assert trigger.superlinear() == {"quadratic": pytest.approx(2.0)}
+
+
+def test_trigger_ignores_measurements_without_size() -> None:
+    trigger = ScalingTrigger()
+    trigger.on_measurement(Measurement(1.0, True, "label"))
+    trigger.on_measurement(Measurement(1.0, True, "label", key="large"))
+    trigger.on_measurement(Measurement(1.0, True, "label", key=True))
+    trigger.on_measurement(Measurement(1.0, True, "label", key=-1))
+    trigger.on_measurement(Measurement(1.0, True, "label", key=float("nan")))
+    trigger.on_measurement(Measurement(1.0, True, "label", key=float("inf")))
+
+    assert trigger.statistics() == {}
+    assert trigger.superlinear() == {}
+
+
+def test_trigger_collects_sizes_of_decorated_callable() -> None:
+    trigger = ScalingTrigger()
+    timer = Timer([trigger])
+
+    @timer.by(len)
+    def process(items: List[int]) -> None:
+        pass
+
+    process([1, 2, 3])
+    process([1])
+
+    (scaling,) = trigger.statistics().values()
+    assert scaling.count == 2
+    assert scaling.total_size == 4
+
+    trigger.reset()
+
+    assert trigger.statistics() == {}
+
+
+def test_trigger_ignores_non_finite_sizes_of_decorated_callable() -> None:
+    trigger = ScalingTrigger()
+    timer = Timer([trigger])
+
+    @timer.by(lambda size: size)
+    def process(size: float) -> float:
+        return size
+
+    assert process(float("nan")) != process(float("nan"))
+    assert process(float("inf")) == float("inf")
+    assert trigger.statistics() == {}
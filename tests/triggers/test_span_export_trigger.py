@@ -0,0 +1,224 @@
+import json
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from threading import Thread
+from time import sleep
+from typing import Any, Iterator, List
+
+import pytest
+
+from pytimers.measurement import Measurement
+from pytimers.timer import Timer
+from pytimers.triggers.span_export_trigger import (
+    OTLPHttpExporter,
+    OTLPJsonFileExporter,
+    SpanExportTrigger,
+    SpanExporter,
+)
+
+
+class CollectingExporter(SpanExporter):
+    def __init__(self) -> None:
+        self.requests: List[Any] = []
+
+    def export(self, request: Any) -> None:
+        self.requests.append(request)
+
+    def spans(self) -> List[Any]:
+        return [
+            span
+            for request in self.requests
+            for span in request["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        ]
+
+
+class FailingExporter(SpanExporter):
+    def export(self, request: Any) -> None:
+        raise ConnectionError
+
+
+class StubCollector(HTTPServer):
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StubCollectorHandler)
+        self.requests: List[Any] = []
+        self.paths: List[str] = []
+
+
+class StubCollectorHandler(BaseHTTPRequestHandler):
+    server: StubCollector
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.paths.append(self.path)
+        self.server.requests.append(json.loads(body))
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def collector() -> Iterator[StubCollector]:
+    server = StubCollector()
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_nested_code_blocks_become_child_spans() -> None:
+    exporter = CollectingExporter()
+    trigger = SpanExportTrigger(exporter)
+    t = Timer([trigger])
+
+    @t
+    def decorated() -> None:
+        pass
+
+    with t.label("outer"):
+        with t.label("inner"):
+            decorated()
+    trigger.shutdown()
+
+    decorated_span, inner, outer = exporter.spans()
+    assert "parentSpanId" not in outer
+    assert inner["parentSpanId"] == outer["spanId"]
+    assert decorated_span["parentSpanId"] == inner["spanId"]
+    assert {span["traceId"] for span in exporter.spans()} == {outer["traceId"]}
+    assert len(outer["traceId"]) == 32 and len(outer["spanId"]) == 16
+    assert int(outer["startTimeUnixNano"]) <= int(inner["startTimeUnixNano"])
+    assert int(inner["endTimeUnixNano"]) <= int(outer["endTimeUnixNano"])
+
+
+def test_separate_code_blocks_get_separate_traces() -> None:
+    exporter = CollectingExporter()
+    trigger = SpanExportTrigger(exporter)
+    t = Timer([trigger])
+
+    with t.label("first"):
+        pass
+    with t.label("second"):
+        pass
+    t(lambda: None)()
+    trigger.shutdown()
+
+    assert len({span["traceId"] for span in exporter.spans()}) == 3
+
+
+def test_failed_code_block_has_error_status() -> None:
+    exporter = CollectingExporter()
+    trigger = SpanExportTrigger(exporter, service_name="service")
+    t = Timer([trigger])
+
+    with pytest.raises(ValueError):
+        with t.label("failing"):
+            raise ValueError
+    with t:
+        pass
+    trigger.shutdown()
+
+    request = exporter.requests[0]["resourceSpans"][0]
+    assert request["resource"]["attributes"][0]["value"]["stringValue"] == "service"
+    failing, unlabeled = exporter.spans()
+    assert failing["status"] == {"code": 2, "message": "ValueError"}
+    assert unlabeled["status"] == {"code": 1}
+    assert unlabeled["name"] == "code block"
+
+
+def test_legacy_measurement_without_start_time_is_encoded() -> None:
+    trigger = SpanExportTrigger(CollectingExporter())
+    request = trigger.encode(
+        [Measurement(1.0, False, "label", thread_id=1, task_name="task")]
+    )
+    trigger.shutdown()
+
+    span = request["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+    assert int(span["endTimeUnixNano"]) - int(span["startTimeUnixNano"]) == 10**9
+    assert {attribute["key"] for attribute in span["attributes"]} == {
+        "pytimers.decorator",
+        "thread.id",
+        "pytimers.task",
+    }
+
+
+def test_full_batch_is_exported_by_background_thread() -> None:
+    exporter = CollectingExporter()
+    trigger = SpanExportTrigger(exporter, batch_size=2, export_interval=60.0)
+    trigger(1.0, False, "first")
+    trigger(1.0, False, "second")
+    while not exporter.requests:
+        sleep(0.01)
+    trigger.shutdown()
+
+    assert len(exporter.spans()) == 2
+
+
+def test_interval_exports_partial_batch() -> None:
+    exporter = CollectingExporter()
+    trigger = SpanExportTrigger(exporter, export_interval=0.01)
+    trigger(1.0, False, "label")
+    while not exporter.requests:
+        sleep(0.01)
+    trigger.shutdown()
+
+    assert len(exporter.spans()) == 1
+
+
+def test_full_queue_drops_spans() -> None:
+    exporter = CollectingExporter()
+    trigger = SpanExportTrigger(
+        exporter, batch_size=10, export_interval=60.0, max_queue_size=2
+    )
+    for _ in range(3):
+        trigger(1.0, False, "label")
+    trigger.shutdown()
+    trigger(1.0, False, "label")
+
+    assert trigger.dropped_spans == 2
+    assert len(exporter.spans()) == 2
+
+
+def test_failed_export_is_counted() -> None:
+    trigger = SpanExportTrigger(FailingExporter())
+    trigger(1.0, False, "label")
+    trigger.force_flush()
+    trigger.force_flush()
+    trigger.shutdown()
+
+    assert trigger.failed_exports == 1
+
+
+def test_file_exporter_appends_json_lines(tmp_path: Path) -> None:
+    path = tmp_path / "spans.jsonl"
+    trigger = SpanExportTrigger(OTLPJsonFileExporter(str(path)))
+    trigger(1.0, False, "first")
+    trigger.force_flush()
+    trigger(1.0, False, "second")
+    trigger.shutdown()
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[1])["resourceSpans"][0]["scopeSpans"][0]["spans"][0][
+        "name"
+    ] == "second"
+
+
+def test_http_exporter_posts_to_collector(collector: StubCollector) -> None:
+    port = collector.server_port
+    exporter = OTLPHttpExporter(endpoint=f"http://127.0.0.1:{port}/v1/traces")
+    trigger = SpanExportTrigger(exporter)
+    t = Timer([trigger])
+
+    with t.label("outer"):
+        with t.label("inner"):
+            pass
+    trigger.shutdown()
+
+    assert collector.paths == ["/v1/traces"]
+    spans = collector.requests[0]["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert [span["name"] for span in spans] == ["inner", "outer"]
+    assert trigger.failed_exports == 0
@@ -0,0 +1,174 @@
+import sqlite3
+from pathlib import Path
+from time import sleep
+from timeit import default_timer
+from typing import Iterator, Optional
+
+import pytest
+
+from pytimers.measurement import Measurement
+from pytimers.timer import Timer
+from pytimers.triggers.sqlite_trigger import SQLiteTrigger
+
+
+@pytest.fixture()
+def database(tmp_path: Path) -> str:
+    return str(tmp_path / "timings.db")
+
+
+@pytest.fixture()
+def trigger(database: str) -> Iterator[SQLiteTrigger]:
+    trigger = SQLiteTrigger(database, flush_interval=60.0, maintenance_interval=3600.0)
+    yield trigger
+    trigger.shutdown()
+
+
+def measurement_ago(seconds: float, duration_s: float, label: str) -> Measurement:
+    return Measurement(
+        duration_s,
+        False,
+        label,
+        start_time=default_timer() - seconds - duration_s,
+    )
+
+
+def test_trigger_persists_measurements_in_wal_mode(
+    trigger: SQLiteTrigger, database: str
+) -> None:
+    timer = Timer([trigger])
+    with timer.label("block"):
+        pass
+
+    @timer
+    def failing() -> None:
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        failing()
+    trigger.force_flush()
+    trigger.force_flush()
+
+    connection = sqlite3.connect(database)
+    try:
+        assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        rows = connection.execute(
+            "SELECT label, decorator, failed FROM measurements ORDER BY label"
+        ).fetchall()
+    finally:
+        connection.close()
+    qualname = "test_trigger_persists_measurements_in_wal_mode.<locals>.failing"
+    assert rows == [("block", 0, 0), (qualname, 1, 1)]
+    assert trigger.labels() == ["block", qualname]
+
+
+def test_trigger_queries_quantiles_over_window(trigger: SQLiteTrigger) -> None:
+    for index in range(1, 101):
+        trigger.on_measurement(measurement_ago(60.0, index / 1000, "request"))
+    trigger.on_measurement(measurement_ago(7200.0, 10.0, "request"))
+    trigger.on_measurement(Measurement(1.0, False, "other"))
+
+    statistics = trigger.statistics("request")
+    assert statistics.count == 100
+    assert statistics.max_s == pytest.approx(0.1)
+    assert trigger.quantile("request", 0.95) == pytest.approx(0.095, rel=0.02)
+    assert trigger.quantile("request", 0.95, window_s=10.0) == 0.0
+    assert trigger.statistics("request", window_s=86400.0).max_s == 10.0
+    assert trigger.statistics(None).count == 0
+
+
+def test_trigger_rolls_up_old_measurements(trigger: SQLiteTrigger) -> None:
+    now = default_timer()
+    for index in range(1, 101):
+        trigger.on_measurement(measurement_ago(7200.0, index / 1000, "request"))
+    trigger.on_measurement(Measurement(1.0, False, None, exc_type=ValueError))
+    trigger.on_measurement(measurement_ago(7200.0, 0.5, "failing"))
+    trigger.on_measurement(measurement_ago(60.0, 0.2, "request"))
+    exact = trigger.statistics("request", window_s=86400.0)
+
+    assert trigger.maintain() == 101
+    assert trigger.maintain() == 0
+
+    rolled_up = trigger.statistics("request", window_s=86400.0)
+    assert rolled_up.count == exact.count == 101
+    assert rolled_up.total_s == pytest.approx(exact.total_s)
+    assert rolled_up.min_s == exact.min_s
+    assert rolled_up.max_s == exact.max_s
+    assert rolled_up.quantile(0.95) == pytest.approx(exact.quantile(0.95))
+    assert trigger.statistics("request", window_s=600.0).count == 1
+    assert trigger.labels() == [None, "failing", "request"]
+
+    later = trigger._epoch_offset + now + 40 * 86400.0
+    trigger.maintain(now=later)
+    assert trigger.statistics("request", window_s=86400.0, now=later).count == 0
+    assert trigger.labels() == []
+
+
+def test_trigger_keeps_rollups_without_retention(database: str) -> None:
+    trigger = SQLiteTrigger(database, raw_retention_s=0.0, rollup_retention_s=None)
+    try:
+        trigger.on_measurement(measurement_ago(120.0, 0.1, "request"))
+        trigger.force_flush()
+        trigger.maintain(now=trigger._epoch_offset + default_timer() + 1e9)
+        assert trigger.labels() == ["request"]
+    finally:
+        trigger.shutdown()
+
+
+def test_background_thread_inserts_and_rolls_up(database: str) -> None:
+    trigger = SQLiteTrigger(
+        database,
+        batch_size=2,
+        flush_interval=0.01,
+        raw_retention_s=0.0,
+        maintenance_interval=0.0,
+    )
+    try:
+        trigger.on_measurement(measurement_ago(120.0, 0.1, "request"))
+        trigger.on_measurement(measurement_ago(120.0, 0.2, "request"))
+        connection = sqlite3.connect(database)
+        try:
+            while not connection.execute("SELECT * FROM rollups").fetchall():
+                sleep(0.01)
+        finally:
+            connection.close()
+    finally:
+        trigger.shutdown()
+
+
+def test_trigger_drops_measurements(database: str) -> None:
+    trigger = SQLiteTrigger(database, max_queue_size=1, flush_interval=60.0)
+    trigger.on_measurement(Measurement(1.0, False, "label"))
+    trigger.on_measurement(Measurement(1.0, False, "label"))
+    trigger.shutdown()
+    trigger.on_measurement(Measurement(1.0, False, "label"))
+
+    assert trigger.dropped_measurements == 2
+
+
+def test_trigger_counts_failed_writes(trigger: SQLiteTrigger) -> None:
+    with trigger._connection_lock:
+        trigger._connection.execute("DROP TABLE measurements")
+    trigger.on_measurement(Measurement(1.0, False, "label"))
+    trigger.force_flush()
+
+    assert trigger.failed_writes == 1
+
+
+def test_background_thread_survives_failed_maintenance(
+    database: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def locked(now: Optional[float] = None) -> int:
+        raise sqlite3.OperationalError("database is locked")
+
+    trigger = SQLiteTrigger(database, flush_interval=0.01, maintenance_interval=0.0)
+    monkeypatch.setattr(trigger, "maintain", locked)
+    try:
+        while trigger.failed_writes < 2:
+            sleep(0.01)
+        trigger.on_measurement(Measurement(1.0, False, "label"))
+        while trigger.labels() != ["label"]:
+            sleep(0.01)
+    finally:
+        trigger.shutdown()
+
+    assert trigger.failed_writes >= 2